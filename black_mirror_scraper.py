@@ -1,8 +1,8 @@
 from reddit_scraper import RedditScraper
 
 class BlackMirrorScraper(RedditScraper):
-    def __init__(self, topics, max_posts=100, max_comments=50):
-        super().__init__(subreddit="blackmirror", topics=topics, max_posts=max_posts, max_comments=max_comments)
+    def __init__(self, topics, max_posts=100, max_comments=50, **kwargs):
+        super().__init__(subreddit="blackmirror", topics=topics, max_posts=max_posts, max_comments=max_comments, **kwargs)
 
     # def calculate_realism_score(self):
     #     """
@@ -18,12 +18,12 @@ class BlackMirrorScraper(RedditScraper):
 
     def run(self):
         try:
-            self._fetch_posts_and_comments()
-            self.transform_data()
-            self.load_to_database()
-            self.save_to_excel()
+            self._run_stages()
         except Exception as e:
             print(f"\n🚨 CRASH in BlackMirrorScraper: {e}")
+            self.metrics.increment("crashes")
             self.save_to_excel()
             self.save_backup_copy()
             raise e
+        finally:
+            self._finish_run()
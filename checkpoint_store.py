@@ -0,0 +1,85 @@
+import datetime
+import json
+import os
+import sqlite3
+
+
+def encode_value(value):
+    if isinstance(value, datetime.datetime):
+        return {"__datetime__": value.isoformat()}
+    raise TypeError(f"Cannot checkpoint value of type {type(value).__name__}")
+
+
+def decode_value(obj):
+    if "__datetime__" in obj:
+        return datetime.datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+class CheckpointStore:
+    # SQLite checkpoint for long scrapes. Every post is committed together with its
+    # comments as soon as they are fetched, so a restarted run can reload the records
+    # collected so far and skip finished topics and posts.
+    def __init__(self, path):
+        self.path = path
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS completed_topics (
+                topic TEXT PRIMARY KEY,
+                completed_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS completed_posts (
+                topic TEXT NOT NULL,
+                post_id TEXT NOT NULL,
+                post_record TEXT NOT NULL,
+                comment_records TEXT NOT NULL,
+                PRIMARY KEY (topic, post_id)
+            );
+        """)
+        self.connection.commit()
+
+    def completed_topics(self):
+        return {row[0] for row in self.connection.execute("SELECT topic FROM completed_topics")}
+
+    def completed_posts(self):
+        return set(self.connection.execute("SELECT topic, post_id FROM completed_posts"))
+
+    def record_post(self, topic, post_record, comment_records):
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO completed_posts (topic, post_id, post_record, comment_records) VALUES (?, ?, ?, ?)",
+                (topic, post_record["post_id"], json.dumps(post_record, default=encode_value),
+                 json.dumps(comment_records, default=encode_value))
+            )
+
+    def complete_topic(self, topic):
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO completed_topics (topic, completed_at) VALUES (?, ?)",
+                (topic, datetime.datetime.now().isoformat())
+            )
+
+    def iter_records(self):
+        # (topic, post_record, comment_records) in the order they were checkpointed
+        rows = self.connection.execute("SELECT topic, post_record, comment_records FROM completed_posts ORDER BY rowid")
+        for topic, post_json, comments_json in rows:
+            yield topic, json.loads(post_json, object_hook=decode_value), json.loads(comments_json, object_hook=decode_value)
+
+    def load_records(self):
+        posts, comments = [], []
+        for _, post_record, comment_records in self.iter_records():
+            posts.append(post_record)
+            comments.extend(comment_records)
+        return posts, comments
+
+    def clear(self):
+        with self.connection:
+            self.connection.execute("DELETE FROM completed_posts")
+            self.connection.execute("DELETE FROM completed_topics")
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,71 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from checkpoint_store import decode_value, encode_value
+
+
+class CommentForestCache:
+    # On-disk cache of a thread's collected comment records keyed on post id, so a
+    # thread matched by several topics (or re-scraped within ttl seconds by a later run)
+    # only has its comment forest loaded from Reddit once. Shared by the fetch threads.
+    # Each entry remembers the max_comments it was collected with: it serves any request
+    # for at most that many comments, or any request at all when the thread had fewer.
+    def __init__(self, path, ttl=24 * 3600):
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(comment_forests)")]
+        if columns and "max_comments" not in columns:
+            # Entries from before limits were recorded can't tell how they were truncated
+            self.connection.execute("DROP TABLE comment_forests")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS comment_forests (
+                post_id TEXT PRIMARY KEY,
+                fetched_at REAL NOT NULL,
+                max_comments INTEGER NOT NULL,
+                complete INTEGER NOT NULL,
+                comment_records TEXT NOT NULL
+            )
+        """)
+        self.connection.commit()
+
+    def get(self, post_id, max_comments):
+        # The first max_comments records, or None when the entry is missing, expired or was
+        # truncated to fewer comments than asked for
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT fetched_at, comment_records FROM comment_forests "
+                "WHERE post_id = ? AND (complete OR max_comments >= ?)", (post_id, max_comments)
+            ).fetchone()
+            if row is None or time.time() - row[0] > self.ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[1], object_hook=decode_value)[:max_comments]
+
+    def put(self, post_id, comment_records, max_comments):
+        # comment_records as collected with max_comments; fewer records means the whole thread
+        payload = json.dumps(comment_records, default=encode_value)
+        with self._lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO comment_forests (post_id, fetched_at, max_comments, complete, comment_records) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (post_id, time.time(), max_comments, len(comment_records) < max_comments, payload)
+            )
+
+    def prune(self):
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM comment_forests WHERE fetched_at < ?", (time.time() - self.ttl,))
+
+    def close(self):
+        self.connection.close()
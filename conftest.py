@@ -0,0 +1,127 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+
+class FakeReddit:
+    # Minimal local stand-in for the Reddit endpoints the scraper uses: the app-only
+    # token endpoint, subreddit search and /comments/<id>. Responses can be delayed
+    # and scripted per path so tests can exercise concurrency and rate limiting.
+    def __init__(self):
+        self.posts = {}           # topic -> list of post data dicts
+        self.comments = {}        # post id -> list of comment data dicts
+        self.delay = 0.0
+        self.scripted = {}        # path prefix -> queue of (status, headers); 200 keeps the real payload
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def add_post(self, topic, post_id, title="title", selftext="", comments=()):
+        self.posts.setdefault(topic, []).append({
+            "id": post_id, "name": f"t3_{post_id}", "title": title, "selftext": selftext,
+            "subreddit": "blackmirror", "score": 10, "num_comments": len(comments),
+            "created_utc": 1700000000, "author": "someone", "url": f"https://reddit.com/{post_id}"
+        })
+        self.comments[post_id] = [
+            {
+                "id": f"{post_id}_c{index}", "name": f"t1_{post_id}_c{index}", "body": body,
+                "author": "commenter", "created_utc": 1700000100 + index, "score": index,
+                "parent_id": f"t3_{post_id}", "link_id": f"t3_{post_id}", "replies": ""
+            }
+            for index, body in enumerate(comments)
+        ]
+
+    def script(self, path_prefix, responses):
+        self.scripted.setdefault(path_prefix, []).extend(responses)
+
+    def count(self, path_prefix):
+        return sum(1 for path in self.requests if path.startswith(path_prefix))
+
+    def _next_scripted(self, path):
+        with self._lock:
+            for prefix, responses in self.scripted.items():
+                if path.startswith(prefix) and responses:
+                    return responses.pop(0)
+        return None
+
+    def handle(self, method, raw_path):
+        path = urlparse(raw_path).path.rstrip("/")
+        query = parse_qs(urlparse(raw_path).query)
+
+        with self._lock:
+            self.requests.append(path)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+
+            headers = {"x-ratelimit-remaining": "599", "x-ratelimit-used": "1", "x-ratelimit-reset": "60"}
+            scripted = self._next_scripted(path)
+            if scripted is not None:
+                status, scripted_headers = scripted
+                headers = {**headers, **scripted_headers}
+                if status != 200:
+                    return status, headers, {"error": status}
+            if path == "/api/v1/access_token":
+                return 200, headers, {"access_token": "fake", "expires_in": 3600, "scope": "*", "token_type": "bearer"}
+            if path.endswith("/search"):
+                posts = self.posts.get(query.get("q", [""])[0], [])
+                return 200, headers, _listing("t3", posts)
+            if path.startswith("/comments/"):
+                post_id = path.split("/")[2]
+                post = next(post for posts in self.posts.values() for post in posts if post["id"] == post_id)
+                return 200, headers, [_listing("t3", [post]), _listing("t1", self.comments.get(post_id, []))]
+            return 404, headers, {"error": 404}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _listing(kind, children):
+    return {
+        "kind": "Listing",
+        "data": {"children": [{"kind": kind, "data": child} for child in children], "after": None, "before": None}
+    }
+
+
+@pytest.fixture
+def fake_reddit():
+    state = FakeReddit()
+
+    class Handler(BaseHTTPRequestHandler):
+        def _respond(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            status, headers, payload = state.handle(self.command, self.path)
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = _respond
+        do_POST = _respond
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.url = f"http://127.0.0.1:{server.server_address[1]}"
+    state.reddit_kwargs = {"oauth_url": state.url, "reddit_url": state.url}
+    try:
+        yield state
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,189 @@
+import datetime
+import importlib
+import json
+import os
+import sqlite3
+
+import pandas as pd
+
+
+SCORE_COLUMNS = {
+    "sentiment_polarity": "REAL",
+    "sentiment_label": "TEXT",
+    "opinion_strength": "REAL",
+    "opinion_label": "TEXT",
+    "plausibility_score": "REAL",
+    "plausibility_label": "TEXT"
+}
+
+TABLES = {
+    "posts": {
+        "key": "post_id",
+        "columns": {
+            "post_id": "TEXT NOT NULL PRIMARY KEY",
+            "topic": "TEXT",
+            "title": "TEXT",
+            "body": "TEXT",
+            "subreddit": "TEXT",
+            "score": "INTEGER",
+            "num_comments": "INTEGER",
+            "timestamp": "TIMESTAMP",
+            "author": "TEXT",
+            "url": "TEXT",
+            **SCORE_COLUMNS
+        },
+        "indexes": ["topic", "timestamp"]
+    },
+    "comments": {
+        "key": "comment_id",
+        "columns": {
+            "comment_id": "TEXT NOT NULL PRIMARY KEY",
+            "post_id": "TEXT",
+            "topic": "TEXT",
+            "author": "TEXT",
+            "body": "TEXT",
+            "timestamp": "TIMESTAMP",
+            "comment_length": "INTEGER",
+            "score": "INTEGER",
+            **SCORE_COLUMNS
+        },
+        "indexes": ["post_id", "topic"]
+    },
+    # A post matched by several topics is stored once in `posts`; this links it to every topic
+    "post_topics": {
+        "key": ("post_id", "topic"),
+        "columns": {
+            "post_id": "TEXT NOT NULL",
+            "topic": "TEXT NOT NULL"
+        },
+        "indexes": ["topic"]
+    }
+}
+
+PLACEHOLDERS = {"qmark": "?", "format": "%s", "pyformat": "%s"}
+
+
+class DatabaseLoader:
+    # Batched upserts of post and comment records into `posts` and `comments` tables keyed
+    # on post_id / comment_id. Works with any DB-API 2.0 connection: SQLite out of the box,
+    # other drivers through the "dbapi" engine in config/db_config.json. Upserts use
+    # INSERT ... ON CONFLICT DO UPDATE (SQLite >= 3.24, PostgreSQL); pass upsert="replace"
+    # for drivers that only understand REPLACE INTO (MySQL).
+    def __init__(self, connection, paramstyle="qmark", batch_size=500, upsert="on_conflict", datetime_as_text=False):
+        if paramstyle not in PLACEHOLDERS:
+            raise ValueError(f"Unsupported paramstyle '{paramstyle}', expected one of {sorted(PLACEHOLDERS)}")
+        self.connection = connection
+        self.placeholder = PLACEHOLDERS[paramstyle]
+        self.batch_size = batch_size
+        self.upsert = upsert
+        self.datetime_as_text = datetime_as_text
+        # Sink interface (see record_sinks.RecordSink): writes go out in batch_size transactions
+        self.chunk_size = batch_size
+        # Keys written by this loader; a post upserted again (e.g. for another topic) counts once
+        self._written_keys = {"posts": set(), "comments": set()}
+        self.create_tables()
+
+    @property
+    def rows_written(self):
+        return {table: len(keys) for table, keys in self._written_keys.items()}
+
+    @classmethod
+    def from_config(cls, config=None):
+        # config is a dict or a path to a JSON file, by default config/db_config.json:
+        #   {"engine": "sqlite", "database": "data/reddit_scraper.sqlite", "batch_size": 500}
+        #   {"engine": "dbapi", "module": "psycopg2", "connect_kwargs": {...}, "batch_size": 2000}
+        if config is None or isinstance(config, str):
+            with open(config or os.path.join("config", "db_config.json"), encoding="utf-8") as handle:
+                config = json.load(handle)
+
+        engine = config.get("engine", "sqlite")
+        batch_size = config.get("batch_size", 500)
+        if engine == "sqlite":
+            database = config.get("database", os.path.join("data", "reddit_scraper.sqlite"))
+            folder = os.path.dirname(database)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            return cls(sqlite3.connect(database), "qmark", batch_size, datetime_as_text=True)
+        if engine == "dbapi":
+            module = importlib.import_module(config["module"])
+            connection = module.connect(**config.get("connect_kwargs", {}))
+            return cls(connection, config.get("paramstyle", module.paramstyle), batch_size,
+                       upsert=config.get("upsert", "on_conflict"))
+        raise ValueError(f"Unknown database engine '{engine}'")
+
+    def create_tables(self):
+        cursor = self.connection.cursor()
+        for table, spec in TABLES.items():
+            columns = ", ".join(f"{name} {sql_type}" for name, sql_type in spec["columns"].items())
+            if isinstance(spec["key"], tuple):
+                columns += f", PRIMARY KEY ({', '.join(spec['key'])})"
+            cursor.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns})")
+            for column in spec["indexes"]:
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} ({column})")
+        self.connection.commit()
+
+    def _upsert_sql(self, table):
+        spec = TABLES[table]
+        columns = list(spec["columns"])
+        placeholders = ", ".join([self.placeholder] * len(columns))
+        if self.upsert == "replace":
+            return f"REPLACE INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+        key = spec["key"] if isinstance(spec["key"], tuple) else (spec["key"],)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns if column not in key)
+        action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        return (
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+            f"ON CONFLICT ({', '.join(key)}) {action}"
+        )
+
+    def _row(self, table, record):
+        row = []
+        for column in TABLES[table]["columns"]:
+            value = record.get(column)
+            if self.datetime_as_text and isinstance(value, datetime.datetime):
+                value = value.isoformat(sep=" ")
+            row.append(value)
+        return row
+
+    def upsert_records(self, table, records):
+        sql = self._upsert_sql(table)
+        cursor = self.connection.cursor()
+        batch = []
+        for record in records:
+            batch.append(self._row(table, record))
+            if len(batch) >= self.batch_size:
+                self._commit_batch(cursor, sql, batch)
+                batch = []
+        if batch:
+            self._commit_batch(cursor, sql, batch)
+
+    def _commit_batch(self, cursor, sql, batch):
+        try:
+            cursor.executemany(sql, batch)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+
+    def write_posts(self, records):
+        self.upsert_records("posts", records)
+        self.upsert_records("post_topics", records)
+        self._written_keys["posts"].update(record["post_id"] for record in records)
+
+    def write_comments(self, records):
+        self.upsert_records("comments", records)
+        self._written_keys["comments"].update(record["comment_id"] for record in records)
+
+    def path(self, stream):
+        return f"database table {stream}"
+
+    def read(self, stream):
+        return pd.read_sql_query(f"SELECT * FROM {stream}", self.connection, parse_dates=["timestamp"])
+
+    def close(self):
+        # Every batch is already committed; the connection stays usable for read()
+        self.connection.commit()
+
+    def disconnect(self):
+        self.connection.close()
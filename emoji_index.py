@@ -0,0 +1,42 @@
+import pandas as pd
+from keyword_matcher import KeywordMatcher
+
+
+class EmojiIndex:
+    # Precomputed emoji -> sentiment score table. Single code point emojis are looked up
+    # straight from the text's code points; any multi code point sequences in the table
+    # go through a KeywordMatcher so they keep plain substring semantics.
+    def __init__(self, scores):
+        self.scores = {emoji: score for emoji, score in scores.items() if score != 0}
+        self.single = {emoji: score for emoji, score in self.scores.items() if len(emoji) == 1}
+
+        sequences = [emoji for emoji in self.scores if len(emoji) > 1]
+        self.sequence_matcher = KeywordMatcher({"emoji": sequences}) if sequences else None
+
+    @classmethod
+    def from_dataframe(cls, emoji_df):
+        return cls(dict(zip(emoji_df["Emoji"], emoji_df["sentiment score"])))
+
+    @classmethod
+    def from_csv(cls, path):
+        return cls.from_dataframe(pd.read_csv(path))
+
+    def hits(self, text):
+        found = [char for char in set(text) if char in self.single]
+        if self.sequence_matcher is not None:
+            found.extend(self.sequence_matcher.matches(text)["emoji"])
+
+        positive = [emoji for emoji in found if self.scores[emoji] > 0]
+        negative = [emoji for emoji in found if self.scores[emoji] < 0]
+        return positive, negative
+
+    def score(self, text, weighted=False):
+        # Distinct positive/negative emojis in the text, or the sum of their absolute
+        # sentiment scores when weighted
+        positive, negative = self.hits(text)
+        if not weighted:
+            return len(positive), len(negative)
+        return (
+            sum(self.scores[emoji] for emoji in positive),
+            -sum(self.scores[emoji] for emoji in negative)
+        )
@@ -0,0 +1,26 @@
+import threading
+import time
+
+
+DEFAULT_MODEL = "en_core_web_sm"
+# Scoring only reads doc.ents and token.pos_, so the dependency parser and lemmatizer never run
+DEFAULT_EXCLUDE = ("parser", "lemmatizer")
+
+_parsers = {}
+_lock = threading.Lock()
+
+
+def get_entity_parser(model=DEFAULT_MODEL, exclude=DEFAULT_EXCLUDE):
+    # Loaded on first use and shared per (model, exclude), so importing the scraper (e.g. from
+    # train_models.py) or scoring texts without NER never pays for spaCy at all
+    key = (model, tuple(exclude))
+    with _lock:
+        parser = _parsers.get(key)
+        if parser is None:
+            started = time.perf_counter()
+            import spacy
+
+            parser = spacy.load(model, exclude=list(exclude))
+            print(f"🧠 Loaded spaCy '{model}' [{', '.join(parser.pipe_names)}] in {time.perf_counter() - started:.2f}s")
+            _parsers[key] = parser
+    return parser
@@ -0,0 +1,76 @@
+from collections import deque
+
+
+class KeywordMatcher:
+    # Aho-Corasick automaton over several named lexicons. One scan of a text finds every
+    # pattern that occurs in it as a plain substring, so results match `pattern in text`.
+    def __init__(self, lexicons):
+        self.lexicons = {name: frozenset(patterns) for name, patterns in lexicons.items()}
+
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [[]]
+
+        for name, patterns in self.lexicons.items():
+            for pattern in patterns:
+                if pattern:
+                    self._add_pattern(pattern, name)
+        self._build_fail_links()
+
+        # transform_data scores the same body with several scorers back to back
+        self._last_text = None
+        self._last_matches = None
+
+    def _add_pattern(self, pattern, name):
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            node = next_node
+        self._outputs[node].append((name, pattern))
+
+    def _build_fail_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+
+    def matches(self, text):
+        if text == self._last_text:
+            return self._last_matches
+
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+
+        found = set()
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if outputs[node]:
+                found.update(outputs[node])
+
+        grouped = {name: [] for name in self.lexicons}
+        for name, pattern in found:
+            grouped[name].append(pattern)
+        matches = {name: frozenset(patterns) for name, patterns in grouped.items()}
+
+        self._last_text = text
+        self._last_matches = matches
+        return matches
+
+    def count(self, text):
+        return {name: len(patterns) for name, patterns in self.matches(text).items()}
@@ -17,6 +17,9 @@ episodes = [
 ]
 
 if __name__ == "__main__":
-    scraper = BlackMirrorScraper(topics=episodes, max_posts=10, max_comments=10)#5POST  -> 10COMMENT
+    scraper = BlackMirrorScraper(topics=episodes, max_posts=10, max_comments=10,#5POST  -> 10COMMENT
+                                 checkpoint_path="data/checkpoints/blackmirror_checkpoint.sqlite",
+                                 score_cache_path="data/cache/score_cache.sqlite",
+                                 metrics_path="data/metrics/last_run.json")
     scraper.run()
     #print(scraper._emoji_sentiment_boost(" 😍💀😆🤬👍👎😊😡I HATED THIS 😡🤬 IT WAS AWFUL!!! 😍🔥💯😄😆 The visuals were cool 😍 but the story sucked 💩😊🥰👍👏🎉✨🌟 😡🤬👿💀💩👎😤😠😭😣😫😩 "))
\ No newline at end of file
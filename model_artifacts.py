@@ -0,0 +1,284 @@
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+
+# Array export of a TF-IDF + linear classifier pipeline: one directory per model holding
+# config.json and .npy arrays that np.load can memory-map. Worker processes that load the
+# same export share its pages read-only instead of each unpickling a vocabulary dict.
+FORMAT_VERSION = 1
+VECTORIZER_PARAMS = (
+    "input", "encoding", "decode_error", "strip_accents", "lowercase",
+    "analyzer", "stop_words", "token_pattern", "ngram_range"
+)
+ARRAYS = ("terms", "feature_index", "idf", "coef", "intercept")
+
+
+def tfidf_from_counts(counts, use_idf, idf, norm, sublinear_tf, binary):
+    # TfidfVectorizer.transform from a float64 CSR matrix of raw term counts
+    features = counts.copy()
+    # Same column order as the vectorizer's own output, so the norm sums in the same order
+    features.sort_indices()
+    if binary:
+        features.data.fill(1)
+    if sublinear_tf:
+        np.log(features.data, features.data)
+        features.data += 1
+    if use_idf:
+        features.data *= idf[features.indices]
+    if norm is not None:
+        features = normalize(features, norm=norm, copy=False)
+    return features
+
+
+def export_model(pipeline, directory):
+    vectorizer, classifier = pipeline.steps[0][1], pipeline.steps[-1][1]
+    if len(pipeline.steps) != 2 or type(vectorizer) is not TfidfVectorizer or not hasattr(classifier, "coef_"):
+        raise ValueError("Only TfidfVectorizer + linear classifier pipelines can be exported as arrays")
+    params = vectorizer.get_params()
+    if params["preprocessor"] is not None or params["tokenizer"] is not None or callable(params["analyzer"]):
+        raise ValueError("Vectorizers with custom callables can't be exported as arrays")
+
+    os.makedirs(directory, exist_ok=True)
+    terms = np.array(sorted(vectorizer.vocabulary_))
+    arrays = {
+        "terms": terms,
+        "feature_index": np.array([vectorizer.vocabulary_[term] for term in terms], dtype=np.int64),
+        "idf": vectorizer.idf_ if vectorizer.use_idf else np.ones(len(terms)),
+        "coef": np.ascontiguousarray(classifier.coef_),
+        "intercept": np.asarray(classifier.intercept_, dtype=np.float64)
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(directory, f"{name}.npy"), array)
+
+    config = {
+        "format_version": FORMAT_VERSION,
+        "vectorizer": {name: params[name] for name in VECTORIZER_PARAMS},
+        "tfidf": {"use_idf": vectorizer.use_idf, "norm": vectorizer.norm,
+                  "sublinear_tf": vectorizer.sublinear_tf, "binary": vectorizer.binary},
+        "classes": classifier.classes_.tolist()
+    }
+    with open(os.path.join(directory, "config.json"), "w", encoding="utf-8") as handle:
+        json.dump(config, handle, indent=2)
+
+
+class ArrayModel:
+    # Prediction-only counterpart of an exported pipeline. Terms are looked up with
+    # np.searchsorted on the sorted term array, so loading never builds a Python dict.
+    def __init__(self, config, arrays):
+        if config.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported model format version {config.get('format_version')}")
+        self.config = config
+        self.vectorizer_params = dict(config["vectorizer"], ngram_range=tuple(config["vectorizer"]["ngram_range"]))
+        self.tfidf = config["tfidf"]
+        self.classes_ = np.array(config["classes"])
+        for name in ARRAYS:
+            setattr(self, name, arrays[name])
+        self.n_features = len(self.terms)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        with open(os.path.join(directory, "config.json"), encoding="utf-8") as handle:
+            config = json.load(handle)
+        arrays = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r" if mmap else None)
+            for name in ARRAYS
+        }
+        return cls(config, arrays)
+
+    def analyzer_signature(self):
+        return tuple(sorted((name, str(value)) for name, value in self.vectorizer_params.items()))
+
+    def build_analyzer(self):
+        return TfidfVectorizer(**self.vectorizer_params).build_analyzer()
+
+    def counts(self, term_lists):
+        # Raw counts of this model's features for texts already split into terms
+        width = self.terms.dtype.itemsize // 4
+        rows, queries = [], []
+        for row, terms in enumerate(term_lists):
+            for term in terms:
+                # Longer terms can't be in the vocabulary and would be truncated by the cast
+                if len(term) <= width:
+                    rows.append(row)
+                    queries.append(term)
+
+        queries = np.array(queries, dtype=self.terms.dtype)
+        positions = np.searchsorted(self.terms, queries)
+        positions[positions == self.n_features] = 0
+        found = self.terms[positions] == queries
+        columns = self.feature_index[positions[found]]
+        # Duplicate (row, column) pairs are summed into counts by the CSR conversion
+        return sp.coo_matrix(
+            (np.ones(len(columns)), (np.asarray(rows, dtype=np.int64)[found], columns)),
+            shape=(len(term_lists), self.n_features)
+        ).tocsr()
+
+    def transform_terms(self, term_lists):
+        return tfidf_from_counts(self.counts(term_lists), idf=self.idf, **self.tfidf)
+
+    def transform(self, texts):
+        analyzer = self.build_analyzer()
+        return self.transform_terms([analyzer(text) for text in texts])
+
+    def decision_function(self, features):
+        scores = features @ self.coef.T + self.intercept
+        return scores.ravel() if scores.shape[1] == 1 else scores
+
+    def predict_features(self, features):
+        scores = self.decision_function(features)
+        indices = (scores > 0).astype(int) if scores.ndim == 1 else scores.argmax(axis=1)
+        return self.classes_[indices]
+
+    def predict(self, texts):
+        return self.predict_features(self.transform(texts))
+
+
+def term_hash(term):
+    return int.from_bytes(hashlib.blake2b(term.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def export_compact(pipeline, path, threshold=0.05):
+    # Single .npz inference model: features whose largest absolute coefficient is below
+    # threshold are dropped from the weights, weights and idf are float32, and terms are
+    # stored as 64-bit hashes. Every vocabulary term keeps its hash and idf so the L2 norm
+    # still sees the whole text; pruning only removes the near-zero weights.
+    vectorizer, classifier = pipeline.steps[0][1], pipeline.steps[-1][1]
+    if len(pipeline.steps) != 2 or type(vectorizer) is not TfidfVectorizer or not hasattr(classifier, "coef_"):
+        raise ValueError("Only TfidfVectorizer + linear classifier pipelines can be exported as compact models")
+    params = vectorizer.get_params()
+    if params["preprocessor"] is not None or params["tokenizer"] is not None or callable(params["analyzer"]):
+        raise ValueError("Vectorizers with custom callables can't be exported as compact models")
+
+    terms = sorted(vectorizer.vocabulary_, key=term_hash)
+    hashes = np.array([term_hash(term) for term in terms], dtype=np.uint64)
+    if len(np.unique(hashes)) != len(hashes):
+        raise ValueError("Vocabulary hash collision; export with export_model instead")
+    feature_index = np.array([vectorizer.vocabulary_[term] for term in terms], dtype=np.int64)
+    idf = vectorizer.idf_[feature_index] if vectorizer.use_idf else np.ones(len(terms))
+
+    coef = classifier.coef_[:, feature_index]
+    kept = np.flatnonzero(np.abs(coef).max(axis=0) >= threshold)
+    config = {
+        "format_version": FORMAT_VERSION,
+        "vectorizer": {name: params[name] for name in VECTORIZER_PARAMS},
+        "tfidf": {"use_idf": vectorizer.use_idf, "norm": vectorizer.norm,
+                  "sublinear_tf": vectorizer.sublinear_tf, "binary": vectorizer.binary},
+        "classes": classifier.classes_.tolist(),
+        "threshold": threshold
+    }
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, "wb") as handle:
+        np.savez(
+            handle, config=np.array(json.dumps(config)), hashes=hashes, idf=idf.astype(np.float32),
+            kept=kept.astype(np.int32), coef=np.ascontiguousarray(coef[:, kept], dtype=np.float32),
+            intercept=np.asarray(classifier.intercept_, dtype=np.float32)
+        )
+    return len(kept), len(terms)
+
+
+class CompactModel(ArrayModel):
+    # Loads an export_compact .npz; terms are matched by hash instead of by string
+    def __init__(self, config, arrays):
+        super().__init__(config, {**arrays, "terms": arrays["hashes"], "feature_index": np.arange(len(arrays["hashes"]))})
+        self.kept = arrays["kept"]
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as archive:
+            arrays = {name: archive[name] for name in archive.files}
+        return cls(json.loads(str(arrays.pop("config"))), arrays)
+
+    def counts(self, term_lists):
+        rows = [row for row, terms in enumerate(term_lists) for _ in terms]
+        queries = np.array([term_hash(term) for terms in term_lists for term in terms], dtype=np.uint64)
+        positions = np.searchsorted(self.terms, queries)
+        positions[positions == self.n_features] = 0
+        found = self.terms[positions] == queries
+        return sp.coo_matrix(
+            (np.ones(int(found.sum())), (np.asarray(rows, dtype=np.int64)[found], positions[found])),
+            shape=(len(term_lists), self.n_features)
+        ).tocsr()
+
+    def decision_function(self, features):
+        scores = features[:, self.kept] @ self.coef.T + self.intercept
+        return scores.ravel() if scores.shape[1] == 1 else scores
+
+
+def export_models(model_paths, output_dir):
+    import joblib
+
+    exported = {}
+    for name, path in model_paths.items():
+        directory = os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0])
+        export_model(joblib.load(path), directory)
+        exported[name] = directory
+        print(f"📦 Exported {path} -> {directory}")
+    return exported
+
+
+# Runs in a fresh interpreter so every measurement is a cold start
+_BENCHMARK_SCRIPT = """
+import json, sys, time
+from multi_head_predictor import MultiHeadPredictor
+started = time.perf_counter()
+predictor = MultiHeadPredictor.from_paths(json.loads(sys.argv[1]))
+loaded = time.perf_counter()
+predictor.predict(["This could totally happen, I love this episode"])
+predicted = time.perf_counter()
+private_kb = 0
+with open("/proc/self/smaps_rollup") as handle:
+    for line in handle:
+        if line.startswith(("Private_Clean", "Private_Dirty")):
+            private_kb += int(line.split()[1])
+print(json.dumps({"load_seconds": loaded - started, "first_predict_seconds": predicted - loaded, "private_mb": private_kb / 1024}))
+"""
+
+
+def benchmark(formats, repeats=5):
+    # formats: {label: {head: path}}; median cold-start load/first-predict time and the
+    # process's private (unshared) memory, which is what each extra worker costs
+    results = {}
+    for label, paths in formats.items():
+        runs = []
+        for _ in range(repeats):
+            output = subprocess.run(
+                [sys.executable, "-c", _BENCHMARK_SCRIPT, json.dumps(paths)],
+                capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))
+            ).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+        results[label] = {key: float(np.median([run[key] for run in runs])) for key in runs[0]}
+        print(f"⏱️ {label:<8} load {results[label]['load_seconds'] * 1000:8.1f} ms   "
+              f"first predict {results[label]['first_predict_seconds'] * 1000:7.1f} ms   "
+              f"private memory {results[label]['private_mb']:7.1f} MB")
+    return results
+
+
+def main(argv=None):
+    from predict_labels import ARRAY_MODEL_DIR, MODEL_PATHS
+
+    parser = argparse.ArgumentParser(description="Export the label models as memory-mappable arrays and benchmark loading.")
+    parser.add_argument("command", choices=["export", "benchmark"])
+    parser.add_argument("--output-dir", default=ARRAY_MODEL_DIR)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    model_paths = {name: os.path.abspath(path) for name, path in MODEL_PATHS.items()}
+    exported = export_models(model_paths, args.output_dir)
+    if args.command == "benchmark":
+        array_paths = {name: os.path.abspath(path) for name, path in exported.items()}
+        benchmark({"pickle": model_paths, "arrays": array_paths}, repeats=args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import os
+
+import joblib
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from model_artifacts import ArrayModel, CompactModel, tfidf_from_counts
+
+
+# TfidfVectorizer settings that decide which terms a text is split into; heads that agree on
+# all of them can share one analyzer pass even if their vocabularies differ
+ANALYZER_PARAMS = (
+    "input", "encoding", "decode_error", "strip_accents", "lowercase", "preprocessor",
+    "tokenizer", "analyzer", "stop_words", "token_pattern", "ngram_range"
+)
+
+
+def _analyzer_signature(vectorizer):
+    params = vectorizer.get_params()
+    return tuple(
+        (name, params[name] if not callable(params[name]) else id(params[name]))
+        for name in ANALYZER_PARAMS
+    )
+
+
+def load_model(path):
+    # A directory is an array export (memory-mapped), .npz a compact export, anything else a joblib pickle
+    if os.path.isdir(path):
+        return ArrayModel.load(path)
+    if path.endswith(".npz"):
+        return CompactModel.load(path)
+    return joblib.load(path)
+
+
+class MultiHeadPredictor:
+    # Runs several TF-IDF + classifier pipelines (one per label, as trained by train_models.py)
+    # over the same texts. Heads whose vectorizers tokenize alike share one analyzer pass:
+    # every text is counted once against the union of their vocabularies and each head
+    # slices out its own columns before applying its idf and norm. Other pipelines fall back
+    # to their own transform, computed once per distinct feature pipeline. ArrayModel heads
+    # (see model_artifacts.py) that tokenize alike share the analyzer pass the same way.
+    def __init__(self, models):
+        # models: {output column: fitted sklearn Pipeline or ArrayModel}
+        self.models = dict(models)
+        self.shared_groups = {}
+        self.array_groups = {}
+        self.fallback_heads = []
+        for name, pipeline in self.models.items():
+            if isinstance(pipeline, ArrayModel):
+                self.array_groups.setdefault(pipeline.analyzer_signature(), []).append(name)
+                continue
+            vectorizer = pipeline.steps[0][1]
+            if len(pipeline.steps) == 2 and type(vectorizer) is TfidfVectorizer:
+                self.shared_groups.setdefault(_analyzer_signature(vectorizer), []).append(name)
+            else:
+                self.fallback_heads.append(name)
+
+        self._groups = [self._build_group(names) for names in self.shared_groups.values()]
+
+    @classmethod
+    def from_paths(cls, paths):
+        return cls({name: load_model(path) for name, path in paths.items()})
+
+    def _build_group(self, names):
+        vectorizers = [self.models[name].steps[0][1] for name in names]
+        union = {}
+        for vectorizer in vectorizers:
+            for term in vectorizer.vocabulary_:
+                union.setdefault(term, len(union))
+
+        heads = []
+        for name, vectorizer in zip(names, vectorizers):
+            # union column for each of this head's feature indices, in feature order
+            columns = np.empty(len(vectorizer.vocabulary_), dtype=np.int64)
+            for term, index in vectorizer.vocabulary_.items():
+                columns[index] = union[term]
+            heads.append((name, vectorizer, columns))
+        return vectorizers[0].build_analyzer(), union, heads
+
+    def _count(self, analyzer, union, texts):
+        indptr = [0]
+        indices = []
+        values = []
+        for text in texts:
+            counts = {}
+            for term in analyzer(text):
+                column = union.get(term)
+                if column is not None:
+                    counts[column] = counts.get(column, 0) + 1
+            indices.extend(counts)
+            values.extend(counts.values())
+            indptr.append(len(indices))
+        matrix = sp.csr_matrix(
+            (np.asarray(values, dtype=np.float64), np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(texts), len(union))
+        )
+        matrix.sort_indices()
+        return matrix
+
+    def _tfidf(self, vectorizer, counts):
+        return tfidf_from_counts(
+            counts, use_idf=vectorizer.use_idf, idf=getattr(vectorizer, "idf_", None), norm=vectorizer.norm,
+            sublinear_tf=vectorizer.sublinear_tf, binary=vectorizer.binary
+        )
+
+    def features(self, texts):
+        # {head: feature matrix} for texts, sharing work between heads wherever possible
+        texts = list(texts)
+        features = {}
+        for analyzer, union, heads in self._groups:
+            counts = self._count(analyzer, union, texts)
+            for name, vectorizer, columns in heads:
+                features[name] = self._tfidf(vectorizer, counts[:, columns])
+
+        for names in self.array_groups.values():
+            analyzer = self.models[names[0]].build_analyzer()
+            term_lists = [analyzer(text) for text in texts]
+            for name in names:
+                features[name] = self.models[name].transform_terms(term_lists)
+
+        transformed = {}
+        for name in self.fallback_heads:
+            transformer = self.models[name][:-1]
+            # Pipelines loaded from separate files are distinct objects; compare their fitted contents
+            key = joblib.hash(transformer)
+            if key not in transformed:
+                transformed[key] = transformer.transform(texts)
+            features[name] = transformed[key]
+        return features
+
+    def predict(self, texts):
+        # {head: array of predicted labels}, one per text; duplicate texts are only featurized once
+        texts = list(texts)
+        unique_texts = list(dict.fromkeys(texts))
+        rows = np.array(_positions(texts, unique_texts), dtype=np.int64)
+
+        predictions = {}
+        for name, matrix in self.features(unique_texts).items():
+            predictions[name] = self._classify(name, matrix)[rows]
+        return {name: predictions[name] for name in self.models}
+
+    def _classify(self, name, matrix):
+        model = self.models[name]
+        if isinstance(model, ArrayModel):
+            return model.predict_features(matrix)
+        return model.steps[-1][1].predict(matrix)
+
+
+def _positions(texts, unique_texts):
+    row_of = {text: row for row, text in enumerate(unique_texts)}
+    return [row_of[text] for text in texts]
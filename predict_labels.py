@@ -1,63 +1,132 @@
+import argparse
 import pandas as pd
 import joblib
 import os
+from multi_head_predictor import MultiHeadPredictor
+from prediction_stream import output_extension, stream_predictions
+
+MODEL_PATHS = {
+    "predicted_sentiment": "models/sentiment_model.pkl",
+    "predicted_opinion": "models/opinion_model.pkl",
+    "predicted_plausibility": "models/plausibility_model.pkl"
+}
+
+# Memory-mappable exports of the models above (python model_artifacts.py export)
+ARRAY_MODEL_DIR = "models/arrays"
+ARRAY_MODEL_PATHS = {
+    name: os.path.join(ARRAY_MODEL_DIR, os.path.splitext(os.path.basename(path))[0])
+    for name, path in MODEL_PATHS.items()
+}
+COMPACT_MODEL_DIR = "models/compact"
+COMPACT_MODEL_PATHS = {
+    name: os.path.join(COMPACT_MODEL_DIR, os.path.splitext(os.path.basename(path))[0] + ".npz")
+    for name, path in MODEL_PATHS.items()
+}
 
 def load_model(path):
     return joblib.load(path)
 
+def load_predictor(model_paths=None):
+    return MultiHeadPredictor.from_paths(model_paths or MODEL_PATHS)
+
 def predict(df, model, label_name):
     df[label_name] = model.predict(df['body'])
     return df
 
 def process_sheet(sheet_df, sentiment_model, opinion_model, plausibility_model):
-    sheet_df = sheet_df.dropna(subset=["body"])
-    sheet_df = predict(sheet_df, sentiment_model, "predicted_sentiment")
-    sheet_df = predict(sheet_df, opinion_model, "predicted_opinion")
-    sheet_df = predict(sheet_df, plausibility_model, "predicted_plausibility")
-    return sheet_df
+    predictor = MultiHeadPredictor({
+        "predicted_sentiment": sentiment_model,
+        "predicted_opinion": opinion_model,
+        "predicted_plausibility": plausibility_model
+    })
+    return predict_sheets({"sheet": sheet_df}, predictor)["sheet"]
+
+def predict_sheets(sheets, predictor):
+    # Every sheet's bodies go through the predictor in one batch, then get split back per sheet
+    sheets = {name: df.dropna(subset=["body"]) for name, df in sheets.items()}
+    predictions = predictor.predict([body for df in sheets.values() for body in df["body"]])
+
+    predicted = {}
+    start = 0
+    for name, df in sheets.items():
+        end = start + len(df)
+        predicted[name] = df.assign(**{label: values[start:end] for label, values in predictions.items()})
+        start = end
+    return predicted
 
 def get_next_output_path(base_path):
-    base_name = os.path.splitext(os.path.basename(base_path))[0]
+    base_name, extension = os.path.splitext(os.path.basename(base_path))
     folder = os.path.dirname(base_path)
     counter = 1
 
     while True:
-        numbered_path = os.path.join(folder, f"{base_name}_{counter}.xlsx")
+        numbered_path = os.path.join(folder, f"{base_name}_{counter}{extension}")
         if not os.path.exists(numbered_path):
             return numbered_path
         counter += 1
 
-def main():
-    # Prompt user for input file path
-    input_path = input("Enter the path to the Excel file you want to label (e.g. data_to_predict/curated_examples.xlsx): ").strip()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Label the 'body' column of a workbook, CSV or Parquet file.")
+    parser.add_argument("input_path", help="e.g. data_to_predict/curated_examples.xlsx")
+    parser.add_argument("-o", "--output", help="output file (default: next free predictions/predicted_blackmirror_data_<n> path)")
+    parser.add_argument("--stream", action="store_true",
+                        help="read, predict and write in chunks with bounded memory (always on for .csv/.parquet)")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="rows per chunk when streaming")
+    parser.add_argument("--array-models", action="store_true",
+                        help=f"load the memory-mapped exports in {ARRAY_MODEL_DIR} instead of the pickles")
+    parser.add_argument("--compact-models", action="store_true",
+                        help=f"load the pruned float32 exports in {COMPACT_MODEL_DIR} instead of the pickles")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    input_path = args.input_path
 
     if not os.path.exists(input_path):
         print(f"❌ File not found: {input_path}")
         return
 
     # Load models
-    sentiment_model = load_model("models/sentiment_model.pkl")
-    opinion_model = load_model("models/opinion_model.pkl")
-    plausibility_model = load_model("models/plausibility_model.pkl")
+    if args.array_models and not all(os.path.isdir(path) for path in ARRAY_MODEL_PATHS.values()):
+        print(f"❌ No array models in {ARRAY_MODEL_DIR}; run: python model_artifacts.py export")
+        return
+    if args.compact_models and not all(os.path.exists(path) for path in COMPACT_MODEL_PATHS.values()):
+        print(f"❌ No compact models in {COMPACT_MODEL_DIR}; run: python train_models.py --compact")
+        return
+    if args.array_models:
+        predictor = load_predictor(ARRAY_MODEL_PATHS)
+    elif args.compact_models:
+        predictor = load_predictor(COMPACT_MODEL_PATHS)
+    else:
+        predictor = load_predictor()
+
+    extension = os.path.splitext(input_path)[1].lower()
+    # Workbooks in formats openpyxl can't write (.xls, .ods, ...) are labeled into an .xlsx
+    output_path = args.output or get_next_output_path(
+        f"predictions/predicted_blackmirror_data{output_extension(input_path) or extension}"
+    )
+
+    if args.stream or extension != ".xlsx":
+        rows = stream_predictions(input_path, output_path, predictor, chunk_size=args.chunk_size)
+        print(f"✅ Predictions complete. Labeled {rows} rows in chunks of {args.chunk_size}. Saved to: {output_path}")
+        return
 
     # Load sheets
     xl = pd.read_excel(input_path, sheet_name=None)
-    predicted_data = {}
+    sheets = {}
 
     for sheet_name, df in xl.items():
         if "body" in df.columns:
             print(f"📄 Predicting labels for sheet: {sheet_name}")
-            df_predicted = process_sheet(df, sentiment_model, opinion_model, plausibility_model)
-            predicted_data[sheet_name] = df_predicted
+            sheets[sheet_name] = df
         else:
             print(f"⚠️ Skipping sheet {sheet_name} — no 'body' column found.")
 
-    # Determine new output path
-    base_output_path = "predictions/predicted_blackmirror_data.xlsx"
-    output_path = get_next_output_path(base_output_path)
+    predicted_data = predict_sheets(sheets, predictor)
 
     # Save predictions
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    if os.path.dirname(output_path):
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
     with pd.ExcelWriter(output_path) as writer:
         for sheet_name, df in predicted_data.items():
             df.to_excel(writer, sheet_name=sheet_name, index=False)
@@ -0,0 +1,237 @@
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+import urllib.request
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from multi_head_predictor import MultiHeadPredictor
+from predict_labels import MODEL_PATHS
+
+
+class ModelRegistry:
+    # Holds the loaded MultiHeadPredictor and reloads it when any model file's mtime changes.
+    # Files are checked at most every check_interval seconds; a failed reload (e.g. a file
+    # caught half-written) keeps serving the previous models and retries on the next check.
+    def __init__(self, model_paths=None, check_interval=2.0):
+        self.model_paths = dict(model_paths or MODEL_PATHS)
+        self.check_interval = check_interval
+        self.reloads = 0
+        self._lock = threading.Lock()
+        self._mtimes = self._current_mtimes()
+        self._predictor = MultiHeadPredictor.from_paths(self.model_paths)
+        self._last_check = time.monotonic()
+
+    def _current_mtimes(self):
+        return {name: os.stat(path).st_mtime_ns for name, path in self.model_paths.items()}
+
+    def predictor(self):
+        with self._lock:
+            if time.monotonic() - self._last_check >= self.check_interval:
+                self._last_check = time.monotonic()
+                self._reload_if_changed()
+            return self._predictor
+
+    def _reload_if_changed(self):
+        try:
+            mtimes = self._current_mtimes()
+            if mtimes == self._mtimes:
+                return
+            self._predictor = MultiHeadPredictor.from_paths(self.model_paths)
+            self._mtimes = mtimes
+            self.reloads += 1
+            print(f"🔁 Reloaded models after a file change ({self.reloads} reloads)")
+        except Exception as e:
+            print(f"⚠️ Model reload failed, still serving the previous models: {e}")
+
+
+class LatencyStats:
+    # Request latencies over a sliding window plus lifetime counters
+    def __init__(self, window=10000):
+        self.started = time.monotonic()
+        self.latencies = deque(maxlen=window)
+        self.requests = 0
+        self.texts = 0
+        self.batches = 0
+        self._lock = threading.Lock()
+
+    def record_batch(self, latencies, texts):
+        with self._lock:
+            self.latencies.extend(latencies)
+            self.requests += len(latencies)
+            self.texts += texts
+            self.batches += 1
+
+    def snapshot(self):
+        with self._lock:
+            latencies = np.array(self.latencies, dtype=float)
+            uptime = time.monotonic() - self.started
+            p50, p99 = np.percentile(latencies, [50, 99]) if len(latencies) else (0.0, 0.0)
+            return {
+                "uptime_seconds": round(uptime, 3),
+                "requests": self.requests,
+                "texts": self.texts,
+                "batches": self.batches,
+                "mean_batch_texts": round(self.texts / self.batches, 2) if self.batches else 0.0,
+                "texts_per_second": round(self.texts / uptime, 2) if uptime else 0.0,
+                "latency_p50_ms": round(1000 * float(p50), 3),
+                "latency_p99_ms": round(1000 * float(p99), 3)
+            }
+
+
+class MicroBatcher:
+    # Groups concurrent predict requests into one predictor call. A batch closes when it
+    # holds max_batch_size texts or max_wait seconds after its first request arrived.
+    def __init__(self, registry, max_batch_size=256, max_wait=0.01, stats=None):
+        self.registry = registry
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.stats = stats or LatencyStats()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, texts):
+        future = Future()
+        texts = list(texts)
+        if not texts:
+            # Nothing to batch; an empty model call would fail the whole micro-batch
+            future.set_result({name: [] for name in self.registry.predictor().models})
+            return future
+        self._queue.put((texts, future, time.perf_counter()))
+        return future
+
+    def predict(self, texts, timeout=None):
+        return self.submit(texts).result(timeout)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            size = len(item[0])
+            deadline = time.perf_counter() + self.max_wait
+            while size < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)
+                    break
+                batch.append(item)
+                size += len(item[0])
+            self._predict_batch(batch, size)
+
+    def _predict_batch(self, batch, size):
+        try:
+            predictions = self.registry.predictor().predict([text for texts, _, _ in batch for text in texts])
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+                return
+            # Retry each request on its own so only the one that caused the failure gets the error
+            for item in batch:
+                self._predict_batch([item], len(item[0]))
+            return
+
+        start = 0
+        latencies = []
+        for texts, future, submitted in batch:
+            end = start + len(texts)
+            future.set_result({name: values[start:end].tolist() for name, values in predictions.items()})
+            latencies.append(time.perf_counter() - submitted)
+            start = end
+        self.stats.record_batch(latencies, size)
+
+
+def make_server(batcher, host="127.0.0.1", port=8765):
+    # POST /predict {"texts": [...]} -> {"predictions": {column: [...]}}; GET /metrics, GET /health
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/metrics":
+                self._send(200, {**batcher.stats.snapshot(), "model_reloads": batcher.registry.reloads})
+            elif self.path == "/health":
+                self._send(200, {"status": "ok"})
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path != "/predict":
+                self._send(404, {"error": "not found"})
+                return
+            try:
+                payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+                texts = payload["texts"]
+                if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                    raise ValueError("'texts' must be a list of strings")
+            except (ValueError, KeyError, TypeError) as e:
+                self._send(400, {"error": str(e)})
+                return
+            try:
+                self._send(200, {"predictions": batcher.predict(texts)})
+            except Exception as e:
+                self._send(500, {"error": str(e)})
+
+        def log_message(self, *args):
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def request_predictions(texts, url="http://127.0.0.1:8765", timeout=30):
+    # Client side for small jobs: {column: [label, ...]} from a running server
+    request = urllib.request.Request(
+        f"{url}/predict", data=json.dumps({"texts": list(texts)}).encode(),
+        headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())["predictions"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the label models on localhost with micro-batching.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch-size", type=int, default=256, help="texts per model call")
+    parser.add_argument("--max-wait-ms", type=float, default=10.0, help="latency budget for filling a batch")
+    parser.add_argument("--reload-interval", type=float, default=2.0, help="seconds between model mtime checks")
+    args = parser.parse_args(argv)
+
+    registry = ModelRegistry(check_interval=args.reload_interval)
+    batcher = MicroBatcher(registry, max_batch_size=args.max_batch_size, max_wait=args.max_wait_ms / 1000)
+    server = make_server(batcher, args.host, args.port)
+    print(f"🚀 Serving predictions on http://{args.host}:{server.server_address[1]} (POST /predict, GET /metrics)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.close()
+
+
+if __name__ == "__main__":
+    main()
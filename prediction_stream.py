@@ -0,0 +1,167 @@
+import os
+
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+
+from record_sinks import as_text, parquet_schema, string_columns
+
+
+# Streaming prediction for inputs too large to hold in memory: rows are read in chunks of
+# chunk_size, labeled, and appended to an output of the same format. Each reader yields
+# (sheet_name, DataFrame) pairs; CSV and Parquet files are a single sheet named None.
+
+def iter_excel_chunks(path, chunk_size):
+    workbook = load_workbook(path, read_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None or "body" not in header:
+                print(f"⚠️ Skipping sheet {sheet.title} — no 'body' column found.")
+                continue
+
+            print(f"📄 Predicting labels for sheet: {sheet.title}")
+            batch = []
+            emitted = False
+            for row in rows:
+                if all(value is None for value in row):
+                    continue
+                batch.append(row)
+                if len(batch) >= chunk_size:
+                    yield sheet.title, pd.DataFrame(batch, columns=header)
+                    batch = []
+                    emitted = True
+            if batch or not emitted:
+                yield sheet.title, pd.DataFrame(batch, columns=header)
+    finally:
+        workbook.close()
+
+
+def iter_workbook_chunks(path, chunk_size):
+    # Workbooks openpyxl can't open (.xls, .xlsb, .ods) go through pandas (xlrd, pyxlsb and odfpy
+    # engines). The file is opened once and parsed one sheet at a time, so only the current sheet
+    # is in memory; its labels are still predicted and written chunk by chunk
+    with pd.ExcelFile(path) as workbook:
+        for sheet_name in workbook.sheet_names:
+            df = workbook.parse(sheet_name)
+            if "body" not in df.columns:
+                print(f"⚠️ Skipping sheet {sheet_name} — no 'body' column found.")
+                continue
+
+            print(f"📄 Predicting labels for sheet: {sheet_name}")
+            for start in range(0, max(len(df), 1), chunk_size):
+                yield sheet_name, df.iloc[start:start + chunk_size]
+            del df
+
+
+def iter_csv_chunks(path, chunk_size):
+    for chunk in pd.read_csv(path, chunksize=chunk_size):
+        yield None, chunk
+
+
+def iter_parquet_chunks(path, chunk_size):
+    import pyarrow.parquet as pq
+
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        yield None, batch.to_pandas()
+
+
+class ExcelChunkWriter:
+    # openpyxl write-only workbook: rows are flushed to temporary files as they are appended
+    def __init__(self, path):
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+        self.sheets = {}
+
+    def write(self, sheet_name, df):
+        sheet = self.sheets.get(sheet_name)
+        if sheet is None:
+            sheet = self.sheets[sheet_name] = self.workbook.create_sheet(title=sheet_name or "Sheet1")
+            sheet.append(list(df.columns))
+        for row in df.astype(object).where(df.notna(), None).itertuples(index=False):
+            sheet.append(list(row))
+
+    def close(self):
+        if not self.sheets:
+            self.workbook.create_sheet(title="Sheet1")
+        self.workbook.save(self.path)
+
+
+class CsvChunkWriter:
+    def __init__(self, path):
+        self.path = path
+        self.started = False
+
+    def write(self, sheet_name, df):
+        df.to_csv(self.path, mode="a" if self.started else "w", header=not self.started, index=False)
+        self.started = True
+
+    def close(self):
+        pass
+
+
+class ParquetChunkWriter:
+    # One row group per chunk; needs pyarrow
+    def __init__(self, path):
+        import pyarrow
+        import pyarrow.parquet
+
+        self.path = path
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.writer = None
+        self.text_columns = []
+
+    def write(self, sheet_name, df):
+        if self.writer is None:
+            schema = parquet_schema(self._pa, self._pa.Schema.from_pandas(df, preserve_index=False))
+            self.writer = self._pq.ParquetWriter(self.path, schema)
+            self.text_columns = string_columns(self._pa, schema)
+        df = df.copy()
+        for column in self.text_columns:
+            df[column] = df[column].astype(object).map(as_text)
+        self.writer.write_table(self._pa.Table.from_pandas(df, schema=self.writer.schema, preserve_index=False))
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+# Input extension -> (chunk reader, writer, output extension)
+FORMATS = {
+    ".xlsx": (iter_excel_chunks, ExcelChunkWriter, ".xlsx"),
+    ".xls": (iter_workbook_chunks, ExcelChunkWriter, ".xlsx"),
+    ".xlsb": (iter_workbook_chunks, ExcelChunkWriter, ".xlsx"),
+    ".ods": (iter_workbook_chunks, ExcelChunkWriter, ".xlsx"),
+    ".csv": (iter_csv_chunks, CsvChunkWriter, ".csv"),
+    ".parquet": (iter_parquet_chunks, ParquetChunkWriter, ".parquet")
+}
+
+
+def output_extension(input_path):
+    return FORMATS.get(os.path.splitext(input_path)[1].lower(), (None, None, None))[2]
+
+
+def stream_predictions(input_path, output_path, predictor, chunk_size=10000):
+    extension = os.path.splitext(input_path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Unsupported input format '{extension}', expected one of {sorted(FORMATS)}")
+    read_chunks, writer_class, expected_extension = FORMATS[extension]
+    if os.path.splitext(output_path)[1].lower() != expected_extension:
+        raise ValueError(f"Output must be a {expected_extension} file for a {extension} input, got {output_path}")
+
+    folder = os.path.dirname(output_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    writer = writer_class(output_path)
+    rows = 0
+    try:
+        for sheet_name, chunk in read_chunks(input_path, chunk_size):
+            chunk = chunk.dropna(subset=["body"])
+            predictions = predictor.predict(chunk["body"]) if len(chunk) else {name: [] for name in predictor.models}
+            writer.write(sheet_name, chunk.assign(**predictions))
+            rows += len(chunk)
+    finally:
+        writer.close()
+    return rows
@@ -0,0 +1,172 @@
+import random
+import threading
+import time
+
+import prawcore
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class RateLimitScheduler:
+    # Central token bucket every Reddit call goes through. The refill rate starts at
+    # requests_per_minute and is then driven by Reddit's x-ratelimit-remaining/reset headers:
+    # spread the remaining budget over the time left in the window, and hold all calls
+    # until the reset once it runs out. 429/5xx responses and connection errors are retried
+    # with jittered exponential backoff, and enough failures in a row open a circuit breaker
+    # that fails calls fast until circuit_cooldown has passed.
+    def __init__(self, requests_per_minute=90, burst=5, max_requests_per_minute=600,
+                 max_retries=5, backoff_base=1.0, backoff_max=60.0,
+                 failure_threshold=8, circuit_cooldown=60.0, seed=None):
+        self.rate = requests_per_minute / 60.0
+        self.min_rate = 1 / 60.0
+        self.max_rate = max_requests_per_minute / 60.0
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.circuit_cooldown = circuit_cooldown
+
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.circuit_opens = 0
+        self.throttled_seconds = 0.0
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._hold_until = 0.0
+        self._consecutive_failures = 0
+        self._circuit_open_until = 0.0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._circuit_open_until:
+                    raise CircuitOpenError(
+                        f"Reddit circuit open for another {self._circuit_open_until - now:.1f}s "
+                        f"after {self._consecutive_failures} consecutive failures"
+                    )
+
+                self._refill(now)
+                if now >= self._hold_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    self.requests += 1
+                    return
+
+                wait = max(self._hold_until - now, (1 - self._tokens) / self.rate)
+            self._sleep(wait)
+
+    def observe(self, headers):
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+
+        remaining = float(remaining)
+        reset = max(float(reset), 0.0)
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if remaining < 1:
+                self._hold_until = max(self._hold_until, now + reset)
+                self._tokens = 0.0
+            else:
+                self.rate = min(self.max_rate, max(self.min_rate, remaining / max(reset, 1.0)))
+
+    def backoff_delay(self, attempt, retry_after=None):
+        if retry_after is not None:
+            try:
+                return min(self.backoff_max, float(retry_after))
+            except ValueError:
+                pass
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+        with self._lock:
+            return ceiling / 2 + self._random.uniform(0, ceiling / 2)
+
+    def record_success(self):
+        with self._lock:
+            self._consecutive_failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.failure_threshold:
+                self._circuit_open_until = time.monotonic() + self.circuit_cooldown
+                self.circuit_opens += 1
+
+    def call(self, send):
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                response = send()
+            except Exception:
+                self.record_failure()
+                if attempt >= self.max_retries:
+                    raise
+                self._backoff(attempt)
+                attempt += 1
+                continue
+
+            self.observe(response.headers)
+            if response.status_code == 429 or response.status_code >= 500:
+                self.record_failure()
+                if attempt >= self.max_retries:
+                    # Out of retries: hand the error response back for prawcore to raise
+                    return response
+                self._backoff(attempt, response.headers.get("retry-after"))
+                attempt += 1
+                continue
+
+            self.record_success()
+            return response
+
+    def _backoff(self, attempt, retry_after=None):
+        with self._lock:
+            self.retries += 1
+        self._sleep(self.backoff_delay(attempt, retry_after))
+
+    def _sleep(self, seconds):
+        if seconds <= 0:
+            return
+        with self._lock:
+            self.throttled_seconds += seconds
+        time.sleep(seconds)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "failures": self.failures,
+                "circuit_opens": self.circuit_opens,
+                "throttled_seconds": round(self.throttled_seconds, 3),
+                "requests_per_minute": round(self.rate * 60, 1)
+            }
+
+
+class ScheduledRequestor(prawcore.Requestor):
+    # prawcore requestor that routes every HTTP call through a shared RateLimitScheduler
+    def __init__(self, *args, scheduler=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scheduler = scheduler
+
+    def request(self, *args, **kwargs):
+        if self.scheduler is None:
+            return super().request(*args, **kwargs)
+
+        def send():
+            return prawcore.Requestor.request(self, *args, **kwargs)
+
+        return self.scheduler.call(send)
@@ -1,39 +1,156 @@
+import argparse
 import pandas as pd
+import numpy as np
 import os
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.metrics import classification_report, confusion_matrix, f1_score
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-def evaluate_column(true, pred, label_name, sheet_name, wrong_predictions, df, output_dir):
-    print(f"\n📊 Evaluation for: {label_name}")
-    total = len(true)
-    correct = sum(true == pred)
-    accuracy = correct / total if total > 0 else 0
-    print(f"✅ Accuracy: {accuracy:.2%} ({correct} out of {total})")
+LABEL_COLUMNS = [
+    ("Sentiment", "expected_sentiment", "predicted_sentiment"),
+    ("Opinion Strength", "expected_opinion", "predicted_opinion"),
+    ("Plausibility", "expected_plausibility", "predicted_plausibility")
+]
+REPORT_HEADERS = ["precision", "recall", "f1-score", "support"]
 
-    # Detailed metrics
-    report = classification_report(true, pred, output_dict=True, zero_division=0)
-    print("\nDetailed Report:")
-    print(classification_report(true, pred, zero_division=0))
 
-    # F1 Score for macro average (equal class weight)
-    f1 = f1_score(true, pred, average='macro', zero_division=0)
-    print(f"⭐ Macro F1 Score: {f1:.2f}")
+def confusion_counts(true, pred):
+    # One pass over the rows: labels are the sorted union of both columns (as sklearn orders them)
+    # and the matrix is a bincount of actual * n_labels + predicted codes
+    true = np.asarray(true, dtype=object)
+    pred = np.asarray(pred, dtype=object)
+    labels = sorted(set(true) | set(pred))
+    true_codes = pd.Categorical(true, categories=labels).codes.astype(np.int64)
+    pred_codes = pd.Categorical(pred, categories=labels).codes.astype(np.int64)
+    cm = np.bincount(true_codes * len(labels) + pred_codes, minlength=len(labels) ** 2)
+    return labels, cm.reshape(len(labels), len(labels))
+
+
+def _divide(numerator, denominator):
+    # zero_division=0, like the sklearn calls this replaces
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator != 0)
+
+
+def metrics_from_confusion(labels, cm):
+    # Same keys and values as classification_report(output_dict=True, zero_division=0)
+    tp = np.diag(cm)
+    support = cm.sum(axis=1)
+    predicted = cm.sum(axis=0)
+    total = int(support.sum())
+    precision = _divide(tp, predicted)
+    recall = _divide(tp, support)
+    f1 = _divide(2 * tp, 2 * tp + (predicted - tp) + (support - tp))
+
+    report = {
+        str(label): dict(zip(REPORT_HEADERS, [float(p), float(r), float(f), float(s)]))
+        for label, p, r, f, s in zip(labels, precision, recall, f1, support)
+    }
+    report["accuracy"] = float(_divide(tp.sum(), total))
+    report["macro avg"] = dict(zip(REPORT_HEADERS, [
+        float(precision.mean()), float(recall.mean()), float(f1.mean()), float(total)
+    ]))
+    report["weighted avg"] = dict(zip(REPORT_HEADERS, [
+        float(np.average(precision, weights=support)) if total else 0.0,
+        float(np.average(recall, weights=support)) if total else 0.0,
+        float(np.average(f1, weights=support)) if total else 0.0,
+        float(total)
+    ]))
+    return report
+
+
+def format_report(report, digits=2):
+    # Text layout of sklearn's classification_report
+    class_names = [name for name in report if name not in ("accuracy", "macro avg", "weighted avg")]
+    width = max([len(name) for name in class_names] + [len("weighted avg"), digits])
+    row_fmt = "{:>{width}s} " + " {:>9.{digits}f}" * 3 + " {:>9}\n"
+    text = ("{:>{width}s} " + " {:>9}" * len(REPORT_HEADERS)).format("", *REPORT_HEADERS, width=width) + "\n\n"
+    for name in class_names:
+        scores = report[name]
+        text += row_fmt.format(name, scores["precision"], scores["recall"], scores["f1-score"],
+                               int(scores["support"]), width=width, digits=digits)
+    text += "\n"
+    support = int(report["macro avg"]["support"])
+    text += ("{:>{width}s} " + " {:>9.{digits}}" * 2 + " {:>9.{digits}f}" + " {:>9}\n").format(
+        "accuracy", "", "", report["accuracy"], support, width=width, digits=digits
+    )
+    for name in ("macro avg", "weighted avg"):
+        scores = report[name]
+        text += row_fmt.format(name, scores["precision"], scores["recall"], scores["f1-score"], support,
+                               width=width, digits=digits)
+    return text
+
+
+def _load_plotting():
+    # Headless backend; imported lazily so runs without plots never load matplotlib/seaborn
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    return plt, sns
+
+
+def render_confusion_matrix(cm, labels, label_name, plot_name):
+    plt, sns = _load_plotting()
 
-    # Confusion matrix
-    labels = sorted(list(set(true) | set(pred)))
-    cm = confusion_matrix(true, pred, labels=labels)
     plt.figure(figsize=(6, 4))
     sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', xticklabels=labels, yticklabels=labels)
     plt.title(f'Confusion Matrix - {label_name}')
     plt.xlabel('Predicted')
     plt.ylabel('Actual')
-    plot_name = os.path.join(output_dir, f"confusion_matrix_{sheet_name}_{label_name.lower().replace(' ', '_')}.png")
     plt.tight_layout()
     plt.savefig(plot_name)
     plt.close()
-    print(f"🖼️ Confusion matrix saved as: {plot_name}")
+    return plot_name
+
+
+class PlotRenderer:
+    # Renders confusion matrices in worker processes while metrics for later labels and files
+    # are computed; with workers=1 each plot is rendered inline
+    def __init__(self, workers=1):
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_load_plotting) if workers > 1 else None
+        self.pending = []
+
+    def submit(self, cm, labels, label_name, plot_name):
+        if self.executor is None:
+            render_confusion_matrix(cm, labels, label_name, plot_name)
+            print(f"🖼️ Confusion matrix saved as: {plot_name}")
+        else:
+            self.pending.append(self.executor.submit(render_confusion_matrix, cm, labels, label_name, plot_name))
+
+    def close(self):
+        if self.executor is None:
+            return
+        try:
+            for future in self.pending:
+                print(f"🖼️ Confusion matrix saved as: {future.result()}")
+        finally:
+            self.executor.shutdown()
+
+
+def evaluate_column(true, pred, label_name, sheet_name, wrong_predictions, df, output_dir, plots=True):
+    # plots: True renders the confusion matrix inline, False skips it, a PlotRenderer queues it
+    print(f"\n📊 Evaluation for: {label_name}")
+    labels, cm = confusion_counts(true, pred)
+    total = int(cm.sum())
+    correct = int(np.trace(cm))
+    accuracy = correct / total if total > 0 else 0
+    print(f"✅ Accuracy: {accuracy:.2%} ({correct} out of {total})")
+
+    # Detailed metrics, all derived from the confusion matrix
+    report = metrics_from_confusion(labels, cm)
+    print("\nDetailed Report:")
+    print(format_report(report))
+
+    # F1 Score for macro average (equal class weight)
+    f1 = report["macro avg"]["f1-score"]
+    print(f"⭐ Macro F1 Score: {f1:.2f}")
+
+    if plots:
+        plot_name = os.path.join(output_dir, f"confusion_matrix_{sheet_name}_{label_name.lower().replace(' ', '_')}.png")
+        if plots is True:
+            plots = PlotRenderer()
+        plots.submit(cm, labels, label_name, plot_name)
 
     # Save detailed wrong predictions
     wrong_mask = true != pred
@@ -48,49 +165,52 @@ def evaluate_column(true, pred, label_name, sheet_name, wrong_predictions, df, o
 
     return f1
 
-def main():
-    path = input("📁 Enter path to predictions file (e.g. predictions/predicted_blackmirror_data_1.xlsx): ").strip()
 
-    if not os.path.exists(path):
-        print(f"❌ File not found: {path}")
-        return
+def read_sheets(path):
+    # Workbooks keep their sheets; CSV and Parquet prediction files are one sheet named after the file
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return {os.path.splitext(os.path.basename(path))[0]: pd.read_csv(path)}
+    if extension == ".parquet":
+        return {os.path.splitext(os.path.basename(path))[0]: pd.read_parquet(path)}
+    return pd.read_excel(path, sheet_name=None)
 
-    # Create output directory
-    base_output_dir = "rate_predictions_outputs"
+
+def make_run_output_dir(base_output_dir, filename_base):
+    # {filename_base}_{timestamp}, or _2, _3, ... after it when a file with the same name (e.g. from
+    # another folder) was evaluated within the same second
     os.makedirs(base_output_dir, exist_ok=True)
+    run_name = f"{filename_base}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    index = 1
+    while True:
+        run_output_dir = os.path.join(base_output_dir, run_name if index == 1 else f"{run_name}_{index}")
+        try:
+            os.makedirs(run_output_dir)
+            return run_output_dir
+        except FileExistsError:
+            index += 1
+
 
+def evaluate_file(path, base_output_dir="rate_predictions_outputs", plots=True):
+    # {sheet: {label: macro F1}} for one predictions file; outputs go to a timestamped folder
     filename_base = os.path.splitext(os.path.basename(path))[0]
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    run_output_dir = os.path.join(base_output_dir, f"{filename_base}_{timestamp}")
-    os.makedirs(run_output_dir, exist_ok=True)
+    run_output_dir = make_run_output_dir(base_output_dir, filename_base)
 
-    xl = pd.read_excel(path, sheet_name=None)
     wrong_predictions = []
     label_f1_scores = {}
 
-    for sheet_name, df in xl.items():
+    for sheet_name, df in read_sheets(path).items():
         print(f"\n🔍 Analyzing sheet: {sheet_name}")
 
-        required_cols = [
-            "expected_sentiment", "predicted_sentiment",
-            "expected_opinion", "predicted_opinion",
-            "expected_plausibility", "predicted_plausibility", "body"
-        ]
+        required_cols = [column for _, expected, predicted in LABEL_COLUMNS for column in (expected, predicted)] + ["body"]
         if not all(col in df.columns for col in required_cols):
             print("⚠️ Skipping sheet — missing expected/predicted/body columns.")
             continue
 
-        f1_sent = evaluate_column(df["expected_sentiment"], df["predicted_sentiment"],
-                                  "Sentiment", sheet_name, wrong_predictions, df, run_output_dir)
-        f1_opinion = evaluate_column(df["expected_opinion"], df["predicted_opinion"],
-                                     "Opinion Strength", sheet_name, wrong_predictions, df, run_output_dir)
-        f1_plaus = evaluate_column(df["expected_plausibility"], df["predicted_plausibility"],
-                                   "Plausibility", sheet_name, wrong_predictions, df, run_output_dir)
-
         label_f1_scores[sheet_name] = {
-            "Sentiment": f1_sent,
-            "Opinion Strength": f1_opinion,
-            "Plausibility": f1_plaus
+            label_name: evaluate_column(df[expected], df[predicted], label_name, sheet_name,
+                                        wrong_predictions, df, run_output_dir, plots=plots)
+            for label_name, expected, predicted in LABEL_COLUMNS
         }
 
     # Save wrong predictions to CSV
@@ -108,6 +228,53 @@ def main():
             print(f"{sheet} — {label}: F1 = {f1:.2f}")
 
     print(f"\n✅ Evaluation complete. All outputs saved in: {run_output_dir}")
+    return label_f1_scores
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Score prediction files against their expected_* columns.")
+    parser.add_argument("paths", nargs="*",
+                        help="prediction files (.xlsx/.csv/.parquet); prompts for one when omitted")
+    parser.add_argument("--output-dir", default="rate_predictions_outputs")
+    parser.add_argument("--no-plots", action="store_true", help="skip the confusion matrix PNGs")
+    parser.add_argument("--plot-workers", type=int, default=min(4, os.cpu_count() or 1),
+                        help="processes rendering plots in the background (1 = inline)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    paths = args.paths or [
+        input("📁 Enter path to predictions file (e.g. predictions/predicted_blackmirror_data_1.xlsx): ").strip()
+    ]
+
+    missing = [path for path in paths if not os.path.exists(path)]
+    for path in missing:
+        print(f"❌ File not found: {path}")
+    paths = [path for path in paths if path not in missing]
+    if not paths:
+        return
+
+    # Create output directory
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    plots = False if args.no_plots else PlotRenderer(args.plot_workers)
+    results = {}
+    try:
+        for path in paths:
+            results[path] = evaluate_file(path, args.output_dir, plots=plots)
+    finally:
+        if plots:
+            plots.close()
+
+    if len(results) > 1:
+        print("\n📋 Macro F1 by file:")
+        for path, sheets in results.items():
+            for sheet, scores in sheets.items():
+                summary = ", ".join(f"{label} {f1:.2f}" for label, f1 in scores.items())
+                print(f"  {path} [{sheet}]: {summary}")
+    return results
+
 
 if __name__ == "__main__":
     main()
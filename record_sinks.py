@@ -0,0 +1,199 @@
+import csv
+import json
+import os
+
+import pandas as pd
+
+
+# Score columns can be None, the int 0 or a float in any chunk, so Parquet writers don't infer
+# their types from the first chunk
+SCORE_FLOAT_COLUMNS = ("sentiment_polarity", "opinion_strength", "plausibility_score")
+SCORE_LABEL_COLUMNS = ("sentiment_label", "opinion_label", "plausibility_label")
+
+
+def parquet_schema(pa, schema):
+    # First-chunk schema with the score columns typed explicitly and all-None columns as text
+    for index, field in enumerate(schema):
+        if field.name in SCORE_FLOAT_COLUMNS:
+            schema = schema.set(index, pa.field(field.name, pa.float64()))
+        elif field.name in SCORE_LABEL_COLUMNS or pa.types.is_null(field.type):
+            schema = schema.set(index, pa.field(field.name, pa.string()))
+    return schema
+
+
+def string_columns(pa, schema):
+    return [field.name for field in schema if pa.types.is_string(field.type)]
+
+
+def as_text(value):
+    # A text column typed from an all-None first chunk may get numbers later; store them as text
+    if value is None or isinstance(value, str):
+        return value
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    return str(value)
+
+
+class RecordSink:
+    # Streams scored post and comment records to disk in chunks of chunk_size rows,
+    # one file per stream: <base>_posts<ext> and <base>_comments<ext>. Files are
+    # opened lazily and truncated on first write, so a sink always describes one run.
+    extension = None
+
+    def __init__(self, base_path, chunk_size=1000):
+        self.base_path = base_path
+        self.chunk_size = chunk_size
+        self.rows_written = {"posts": 0, "comments": 0}
+        self._buffers = {"posts": [], "comments": []}
+        self._closed = False
+
+    def path(self, stream):
+        return f"{self.base_path}_{stream}{self.extension}"
+
+    def write_posts(self, records):
+        self._write("posts", records)
+
+    def write_comments(self, records):
+        self._write("comments", records)
+
+    def _write(self, stream, records):
+        buffer = self._buffers[stream]
+        buffer.extend(records)
+        if len(buffer) >= self.chunk_size:
+            self._flush(stream)
+
+    def _flush(self, stream):
+        buffer = self._buffers[stream]
+        if not buffer:
+            return
+        folder = os.path.dirname(self.path(stream))
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._write_chunk(stream, buffer)
+        self.rows_written[stream] += len(buffer)
+        self._buffers[stream] = []
+
+    def close(self):
+        if self._closed:
+            return
+        for stream in self._buffers:
+            self._flush(stream)
+        self._close_files()
+        self._closed = True
+
+    def read(self, stream):
+        if not os.path.exists(self.path(stream)):
+            return pd.DataFrame()
+        return self._read(stream)
+
+    def _write_chunk(self, stream, records):
+        raise NotImplementedError
+
+    def _close_files(self):
+        pass
+
+    def _read(self, stream):
+        raise NotImplementedError
+
+
+class JsonlSink(RecordSink):
+    extension = ".jsonl"
+
+    def __init__(self, base_path, chunk_size=1000):
+        super().__init__(base_path, chunk_size)
+        self._files = {}
+
+    def _write_chunk(self, stream, records):
+        handle = self._files.get(stream)
+        if handle is None:
+            handle = self._files[stream] = open(self.path(stream), "w", encoding="utf-8")
+        handle.writelines(json.dumps(record, default=str, ensure_ascii=False) + "\n" for record in records)
+        handle.flush()
+
+    def _close_files(self):
+        for handle in self._files.values():
+            handle.close()
+        self._files.clear()
+
+    def _read(self, stream):
+        df = pd.read_json(self.path(stream), lines=True, convert_dates=False)
+        if "timestamp" in df.columns:
+            df["timestamp"] = pd.to_datetime(df["timestamp"])
+        return df
+
+
+class CsvSink(RecordSink):
+    extension = ".csv"
+
+    def __init__(self, base_path, chunk_size=1000):
+        super().__init__(base_path, chunk_size)
+        self._files = {}
+        self._writers = {}
+
+    def _write_chunk(self, stream, records):
+        writer = self._writers.get(stream)
+        if writer is None:
+            handle = self._files[stream] = open(self.path(stream), "w", encoding="utf-8", newline="")
+            writer = self._writers[stream] = csv.DictWriter(handle, fieldnames=list(records[0]))
+            writer.writeheader()
+        writer.writerows(records)
+        self._files[stream].flush()
+
+    def _close_files(self):
+        for handle in self._files.values():
+            handle.close()
+        self._files.clear()
+        self._writers.clear()
+
+    def _read(self, stream):
+        df = pd.read_csv(self.path(stream))
+        if "timestamp" in df.columns:
+            df["timestamp"] = pd.to_datetime(df["timestamp"])
+        return df
+
+
+class ParquetSink(RecordSink):
+    # One Parquet row group per chunk; needs pyarrow
+    extension = ".parquet"
+
+    def __init__(self, base_path, chunk_size=1000):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError("ParquetSink needs pyarrow: pip install pyarrow") from e
+        super().__init__(base_path, chunk_size)
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._writers = {}
+        self._text_columns = {}
+
+    def _write_chunk(self, stream, records):
+        writer = self._writers.get(stream)
+        if writer is None:
+            schema = parquet_schema(self._pa, self._pa.Table.from_pylist(records).schema)
+            writer = self._writers[stream] = self._pq.ParquetWriter(self.path(stream), schema)
+            self._text_columns[stream] = string_columns(self._pa, schema)
+        text_columns = [column for column in self._text_columns[stream] if column in records[0]]
+        records = [{**record, **{column: as_text(record.get(column)) for column in text_columns}} for record in records]
+        writer.write_table(self._pa.Table.from_pylist(records, schema=writer.schema))
+
+    def _close_files(self):
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+        self._text_columns.clear()
+
+    def _read(self, stream):
+        return pd.read_parquet(self.path(stream))
+
+
+SINKS = {sink.extension: sink for sink in (JsonlSink, CsvSink, ParquetSink)}
+
+
+def make_sink(path, chunk_size=1000):
+    # "data/blackmirror.jsonl" -> data/blackmirror_posts.jsonl + data/blackmirror_comments.jsonl
+    base_path, extension = os.path.splitext(path)
+    if extension not in SINKS:
+        raise ValueError(f"Unsupported sink format '{extension}', expected one of {sorted(SINKS)}")
+    return SINKS[extension](base_path, chunk_size)
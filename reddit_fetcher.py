@@ -0,0 +1,183 @@
+import datetime
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import prawcore
+
+from rate_limit_scheduler import CircuitOpenError, RateLimitScheduler, ScheduledRequestor
+
+
+# Reddit being down or refusing us rather than one post being gone: the scheduler has already
+# retried these, so they end the fetch instead of leaving every remaining post without comments
+FATAL_ERRORS = (
+    CircuitOpenError, prawcore.exceptions.ServerError, prawcore.exceptions.TooManyRequests,
+    prawcore.exceptions.RequestException
+)
+
+
+def build_post_record(post, topic):
+    body = getattr(post, "selftext", None)
+    if body == "" or body is None:
+        body = None
+
+    return {
+        "topic": topic,
+        "post_id": post.id,
+        "title": post.title,
+        "body": body,
+        "subreddit": post.subreddit.display_name,
+        "score": post.score,
+        "num_comments": post.num_comments,
+        "timestamp": datetime.datetime.utcfromtimestamp(post.created_utc),
+        "author": str(post.author),
+        "url": post.url
+    }
+
+
+def build_comment_records(post_id, comments, topic, max_comments):
+    records = []
+    for comment in comments:
+        if comment.body.lower() in ("[deleted]", "[removed]"):
+            continue
+
+        records.append({
+            "topic": topic,
+            "comment_id": comment.id,
+            "post_id": post_id,
+            "author": str(comment.author),
+            "body": comment.body,
+            "timestamp": datetime.datetime.utcfromtimestamp(comment.created_utc),
+            "comment_length": len(comment.body.split()),
+            "score": comment.score
+        })
+
+        if len(records) >= max_comments:
+            break
+    return records
+
+
+class ConcurrentFetcher:
+    # Searches topics and loads comment forests on a bounded thread pool. PRAW is not
+    # thread safe, so every worker thread gets its own client from reddit_factory; all
+    # clients share one RateLimitScheduler through ScheduledRequestor. A thread that
+    # several topics match has its comments loaded once per run, or once per
+    # comment_cache ttl when a CommentForestCache is given.
+    def __init__(self, reddit_factory, subreddit_name, max_posts=100, max_comments=50,
+                 max_workers=4, requests_per_minute=90, max_in_flight=64, scheduler=None,
+                 comment_cache=None):
+        self.reddit_factory = reddit_factory
+        self.subreddit_name = subreddit_name
+        self.max_posts = max_posts
+        self.max_comments = max_comments
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.scheduler = scheduler or RateLimitScheduler(requests_per_minute)
+        self.comment_cache = comment_cache
+        self._local = threading.local()
+
+    def _reddit(self):
+        reddit = getattr(self._local, "reddit", None)
+        if reddit is None:
+            reddit = self.reddit_factory(
+                requestor_class=ScheduledRequestor,
+                requestor_kwargs={"scheduler": self.scheduler}
+            )
+            self._local.reddit = reddit
+        return reddit
+
+    def _search(self, topic):
+        subreddit = self._reddit().subreddit(self.subreddit_name)
+        return [build_post_record(post, topic) for post in subreddit.search(topic, limit=self.max_posts)]
+
+    def _fetch_comments(self, post_id):
+        # Records come back without a topic; fetch() stamps the topic of each match.
+        # None when this post's comments couldn't be loaded (deleted, forbidden, ...)
+        if self.comment_cache is not None:
+            cached = self.comment_cache.get(post_id, self.max_comments)
+            if cached is not None:
+                return cached
+        try:
+            submission = self._reddit().submission(id=post_id)
+            submission.comments.replace_more(limit=0)
+            records = build_comment_records(post_id, submission.comments.list(), None, self.max_comments)
+        except FATAL_ERRORS:
+            raise
+        except Exception as e:
+            print(f"❌ Error fetching comments from post {post_id}: {e}")
+            return None
+        if self.comment_cache is not None:
+            self.comment_cache.put(post_id, records, self.max_comments)
+        return records
+
+    def fetch(self, topics, skip_topics=(), skip_posts=(), on_topic_done=None):
+        # Yields (topic, post_record, comment_records) in topic order, then search order,
+        # regardless of which request finishes first. Topics in skip_topics aren't searched
+        # and (topic, post_id) pairs in skip_posts don't get their comments fetched again;
+        # on_topic_done(topic) runs once everything for a topic has been yielded. A post whose
+        # comments failed to load comes back with comment_records None, and its topic is
+        # then not reported as done, so a resumed run fetches it again.
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            searches = [
+                (topic, executor.submit(self._search, topic))
+                for topic in topics if topic not in skip_topics
+            ]
+            pending = deque()
+            # post id -> [comment future, pending entries using it], shared by every topic that
+            # matches the post. A forest leaves once its last entry is yielded, so memory stays
+            # bounded by max_in_flight; the most recent ones are kept in case a later topic
+            # matches the same post.
+            forests = {}
+            recent = OrderedDict()
+            failed_topics = set()
+
+            def resolve_next():
+                item = pending.popleft()
+                yield from self._resolve(item, on_topic_done, failed_topics)
+                if item[1] is None:
+                    return
+                post_id = item[1]["post_id"]
+                forest = forests[post_id]
+                forest[1] -= 1
+                if not forest[1]:
+                    del forests[post_id]
+                    recent[post_id] = forest[0]
+                    if len(recent) > self.max_in_flight:
+                        recent.popitem(last=False)
+
+            for topic, search in searches:
+                for post_record in search.result():
+                    post_id = post_record["post_id"]
+                    if (topic, post_id) in skip_posts:
+                        continue
+                    forest = forests.get(post_id)
+                    if forest is None:
+                        comments = recent.pop(post_id, None) or executor.submit(self._fetch_comments, post_id)
+                        forest = forests[post_id] = [comments, 0]
+                    forest[1] += 1
+                    pending.append((topic, post_record, forest[0]))
+                # End-of-topic marker
+                pending.append((topic, None, None))
+
+                while len(pending) > self.max_in_flight:
+                    yield from resolve_next()
+
+            while pending:
+                yield from resolve_next()
+        finally:
+            # A consumer that stops early (crash, Ctrl-C) shouldn't wait on queued requests
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _resolve(self, item, on_topic_done, failed_topics):
+        topic, post_record, comments = item
+        if post_record is None:
+            if on_topic_done is not None and topic not in failed_topics:
+                on_topic_done(topic)
+            return
+        records = comments.result()
+        if records is None:
+            failed_topics.add(topic)
+            yield topic, post_record, None
+            return
+        yield topic, post_record, [dict(record, topic=topic) for record in records]
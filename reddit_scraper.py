@@ -3,540 +3,373 @@ import pandas as pd
 import datetime
 import os
 import time
-import spacy
 import warnings
 from openpyxl import load_workbook
 from dotenv import load_dotenv
 from tqdm import tqdm
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer, BOOSTER_DICT
-from textblob import TextBlob
 import re as regex
+from reddit_fetcher import ConcurrentFetcher
+from checkpoint_store import CheckpointStore
+from comment_cache import CommentForestCache
+from record_sinks import make_sink
+from database_loader import DatabaseLoader
+from entity_parser import DEFAULT_EXCLUDE, DEFAULT_MODEL
+from text_scorer import TextScorer
+from score_cache import ScoreCache
+from run_metrics import RunMetrics
+from score_trace import ScoreTracer
 
 load_dotenv()
 
-real_world_entity_parser = spacy.load("en_core_web_sm")
-
 class RedditScraper:
-    def __init__(self, subreddit, topics, max_posts=100, max_comments=50):
+    def __init__(self, subreddit, topics, max_posts=100, max_comments=50, nlp_batch_size=256, nlp_n_process=1,
+                 weighted_emoji=False, workers=1, fetch_workers=4, requests_per_minute=90, reddit_kwargs=None,
+                 checkpoint_path=None, sink=None, sink_chunk_size=1000, export_excel=True,
+                 comment_cache_path=None, comment_cache_ttl=24 * 3600,
+                 spacy_model=DEFAULT_MODEL, spacy_exclude=DEFAULT_EXCLUDE, scorer=None,
+                 score_cache_path=None, score_cache_size=500000, columnar=False, metrics=None, metrics_path=None,
+                 trace_path=None, trace_sample_rate=0.01, db_config=None):
         self.subreddit_name = subreddit
         self.topics = topics
         self.max_posts = max_posts
         self.max_comments = max_comments
 
-        self.reddit = praw.Reddit(
-            client_id=os.getenv("REDDIT_CLIENT_ID"),
-            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-            user_agent=os.getenv("REDDIT_USER_AGENT")
+        # All text scoring lives in TextScorer; pass one in to share it between scrapers,
+        # otherwise the nlp/emoji/workers/spacy arguments configure a scorer for this scraper
+        self.scorer = scorer or TextScorer(
+            nlp_batch_size=nlp_batch_size, nlp_n_process=nlp_n_process, weighted_emoji=weighted_emoji,
+            workers=workers, spacy_model=spacy_model, spacy_exclude=spacy_exclude
         )
-        
-        
-        self.vader_analyzer = SentimentIntensityAnalyzer()
-
-        self.booster_dict = BOOSTER_DICT
-        # Comprehensive list of hedging words that indicate uncertainty, doubt, or qualification
-        self.hedging_words = {
-            # Basic uncertainty
-            'maybe', 'perhaps', 'possibly', 'probably', 'might', 'could', 'would',
-            'may', 'can', 'should', 'ought', 'must', 'shall',
-            
-            # Appearances and impressions
-            'seems', 'appears', 'looks like', 'sounds like', 'feels like',
-            'strikes me as', 'comes across as', 'gives the impression',
-            
-            # Approximations and qualifiers
-            'sort of', 'kind of', 'somewhat', 'rather', 'quite', 'fairly',
-            'relatively', 'approximately', 'roughly', 'about', 'around',
-            'nearly', 'almost', 'basically', 'essentially', 'virtually',
-            'practically', 'more or less', 'in a way', 'in some ways',
-            
-            # Frequency and typicality
-            'generally', 'usually', 'typically', 'normally', 'ordinarily',
-            'commonly', 'frequently', 'often', 'sometimes', 'occasionally',
-            'rarely', 'seldom', 'hardly ever', 'almost never',
-            
-            # Reported information
-            'supposedly', 'allegedly', 'reportedly', 'apparently', 'ostensibly',
-            'purportedly', 'rumored', 'said to be', 'claimed to be',
-            'believed to be', 'thought to be', 'considered to be',
-            
-            # Assumptions and expectations
-            'presumably', 'assumably', 'presumably', 'presumably',
-            'expected to', 'likely to', 'supposed to', 'meant to',
-            'intended to', 'designed to', 'planned to',
-            
-            # Doubt and skepticism
-            'doubt', 'doubtful', 'questionable', 'uncertain', 'unclear',
-            'ambiguous', 'vague', 'unclear', 'unsettled', 'debatable',
-            'controversial', 'disputed', 'contested', 'arguable',
-            
-            # Conditional language
-            'if', 'assuming', 'provided that', 'given that', 'in case',
-            'contingent on', 'dependent on', 'subject to', 'conditional on',
-            
-            # Softeners and mitigators
-            'a bit', 'a little', 'slightly', 'marginally', 'minimally',
-            'barely', 'scarcely', 'hardly', 'just', 'merely', 'simply',
-            'only', 'merely', 'simply', 'just', 'purely', 'solely',
-            
-            # Comparative uncertainty
-            'more or less', 'better or worse', 'sooner or later',
-            'one way or another', 'for better or worse',
-            
-            # Temporal uncertainty
-            'eventually', 'ultimately', 'finally', 'in the end',
-            'sooner or later', 'one day', 'someday', 'at some point',
-            
-            # Spatial uncertainty
-            'somewhere', 'someplace', 'somewhere around', 'in the area',
-            'in the vicinity', 'nearby', 'close to', 'not far from',
-            
-            # Quantity uncertainty
-            'some', 'several', 'a few', 'a couple', 'a handful',
-            'various', 'varying', 'different', 'diverse', 'assorted',
-            'mixed', 'varied', 'multiple', 'numerous', 'many',
-            
-            # Quality uncertainty
-            'decent', 'reasonable', 'acceptable', 'adequate', 'satisfactory',
-            'passable', 'tolerable', 'bearable', 'manageable', 'workable',
-            
-            # Intensity modifiers
-            'somewhat', 'partially', 'in part', 'to some extent',
-            'to a degree', 'in a sense', 'in some sense', 'in a manner',
-            'in a fashion', 'in a way', 'in some way',
-            
-            # Expert opinion qualifiers
-            'according to', 'based on', 'per', 'as per', 'in accordance with',
-            'in line with', 'consistent with', 'in keeping with',
-            
-            # Personal opinion markers
-            'i think', 'i believe', 'i feel', 'i guess', 'i suppose',
-            'i assume', 'i imagine', 'i reckon', 'i figure', 'i gather',
-            'i understand', 'i hear', 'i see', 'i notice',
-            
-            # Evidence qualifiers
-            'apparently', 'evidently', 'obviously', 'clearly', 'plainly',
-            'manifestly', 'patently', 'undoubtedly', 'indisputably',
-            'unquestionably', 'definitely', 'certainly', 'surely',
-            
-            # Time-based uncertainty
-            'recently', 'lately', 'nowadays', 'these days', 'currently',
-            'presently', 'at present', 'at the moment', 'right now',
-            'for now', 'for the time being', 'temporarily',
-            
-            # Method uncertainty
-            'somehow', 'someway', 'in some way', 'by some means',
-            'through some process', 'via some method', 'using some approach',
-            
-            # Result uncertainty
-            'hopefully', 'ideally', 'preferably', 'ideally', 'optimally',
-            'best case', 'worst case', 'in theory', 'in practice',
-            'in reality', 'in actuality', 'in fact', 'in truth',
-            
-            # Comparative uncertainty
-            'more or less', 'better or worse', 'sooner or later',
-            'one way or another', 'for better or worse', 'like it or not',
-            
-            # Conditional uncertainty
-            'depending on', 'subject to', 'contingent upon', 'based on',
-            'assuming', 'provided that', 'given that', 'if', 'when',
-            'unless', 'except', 'barring', 'failing', 'short of',
-            
-            # Degree uncertainty
-            'to some degree', 'to some extent', 'in part', 'partially',
-            'somewhat', 'rather', 'quite', 'fairly', 'reasonably',
-            'moderately', 'adequately', 'sufficiently', 'appropriately',
-            
-            # Source uncertainty
-            'allegedly', 'supposedly', 'reportedly', 'apparently',
-            'ostensibly', 'purportedly', 'rumored', 'said to be',
-            'claimed to be', 'believed to be', 'thought to be',
-            
-            # Process uncertainty
-            'somehow', 'someway', 'in some way', 'by some means',
-            'through some process', 'via some method', 'using some approach',
-            'in some manner', 'in some fashion', 'in some respect',
-            
-            # Outcome uncertainty
-            'hopefully', 'ideally', 'preferably', 'optimally',
-            'best case', 'worst case', 'in theory', 'in practice',
-            'in reality', 'in actuality', 'in fact', 'in truth',
-            'actually', 'really', 'truly', 'genuinely', 'honestly'
-        }
-
-   
-        self.emoji_df = pd.read_csv("emoji_sentiment_data.csv")
-        self.positive_emojis = set(self.emoji_df[self.emoji_df['sentiment score'] > 0]['Emoji'])
-        self.negative_emojis = set(self.emoji_df[self.emoji_df['sentiment score'] < 0]['Emoji'])
+        # Per-stage/per-topic timings and counters for run(); a metrics_path turns them on and
+        # gets the JSON run report (plus a .prom file in Prometheus text format) after every run
+        self.metrics = metrics or RunMetrics(enabled=metrics_path is not None)
+        self.metrics_path = metrics_path
+        self.scorer.metrics = self.metrics
+        # Score breakdowns for a sampled share of texts go to a JSON-lines trace file, written off
+        # the scoring thread (worker processes send theirs back with their scores)
+        if trace_path:
+            self.scorer.tracer = ScoreTracer(trace_path, sample_rate=trace_sample_rate)
+        # Scores of unchanged bodies are reused across runs until the scorer's lexicons or weights change
+        if score_cache_path:
+            self.scorer.score_cache = ScoreCache(score_cache_path, self.scorer.version(), max_entries=score_cache_size)
+
+        # Concurrent fetching: threads share one rate-limit scheduler (Reddit allows ~100 requests/min per client);
+        # requests_per_minute is the starting rate until Reddit's rate-limit headers take over
+        self.fetch_workers = fetch_workers
+        self.requests_per_minute = requests_per_minute
+        # Extra praw.Reddit settings, e.g. oauth_url/reddit_url to point at a local test server
+        self.reddit_kwargs = reddit_kwargs or {}
+
+        self.reddit = self._make_reddit()
+
+        # Resumable runs: finished topics/posts and their records survive a crash
+        self.checkpoint = CheckpointStore(checkpoint_path) if checkpoint_path else None
+
+        # Comment forests by post id: threads matched by several topics are loaded once per run,
+        # and a cache path keeps them for comment_cache_ttl seconds across runs
+        self.comment_cache = CommentForestCache(comment_cache_path, comment_cache_ttl) if comment_cache_path else None
+
+        # Streaming output: a RecordSink or a path like "data/blackmirror.jsonl" (.jsonl/.csv/.parquet).
+        # Records are scored and written in chunks while fetching instead of piling up in
+        # posts_list/comments_list; the Excel file then becomes an optional export of the sink.
+        if isinstance(sink, str):
+            sink = make_sink(sink, chunk_size=sink_chunk_size)
+        self.sink = sink
+        self.export_excel = export_excel
+        self._stream_posts = []
+        self._stream_comments = []
+        # Database the run is loaded into: dict, JSON path, or None for config/db_config.json (see
+        # DatabaseLoader.from_config). When streaming it gets the same scored chunks as the sink,
+        # through a loader opened on the first flush
+        self.db_config = db_config
+        self._stream_database = None
 
         self.posts_list = []
         self.comments_list = []
+        # Columnar transform: score columns are assigned straight onto posts_df/comments_df
+        # instead of updating every record dict (not used when streaming to a sink)
+        self.columnar = columnar
         self.posts_df = pd.DataFrame()
         self.comments_df = pd.DataFrame()
+        # Set once _score_frames has filled posts_df/comments_df from the collected records
+        self._frames_scored = False
         self.filename = f"{self.subreddit_name}_data.xlsx"
 
         warnings.filterwarnings("ignore", category=DeprecationWarning)
 
     def run(self):
         try:
-            self._fetch_posts_and_comments()
-            self.transform_data()
-            self.load_to_database()
-            self.save_to_excel()
+            self._run_stages()
         except Exception as e:
             print(f"\n🚨 CRASH: {e}")
+            self.metrics.increment("crashes")
             self.save_to_excel()
             self.save_backup_copy()
             raise e
+        finally:
+            self._finish_run()
+
+    def _run_stages(self):
+        # _finish_run closes the tracer after every run; a later run appends to the same trace file
+        if self.scorer.tracer is not None:
+            self.scorer.tracer.open()
+        with self.metrics.timer("stage", stage="fetch"):
+            self._fetch_posts_and_comments()
+        with self.metrics.timer("stage", stage="transform"):
+            self.transform_data()
+        with self.metrics.timer("stage", stage="database"):
+            self.load_to_database()
+        with self.metrics.timer("stage", stage="excel"):
+            self.save_to_excel()
+        self.clear_checkpoint()
 
-    def _fetch_posts_and_comments(self):
-        for index, topic in enumerate(self.topics, start=1):
-            print(f"\n🎬 Scraping topic {index}/{len(self.topics)}: {topic}")
-            search_results = list(self.reddit.subreddit(self.subreddit_name).search(topic, limit=self.max_posts))
-
-            for post in tqdm(search_results, desc=f"[{topic[:25]}]", ncols=100):
-                body = getattr(post, "selftext", None)
-                if body == "" or body is None:
-                    body = None
-
-                self.posts_list.append({
-                    "topic": topic,
-                    "post_id": post.id,
-                    "title": post.title,
-                    "body": body,
-                    "subreddit": post.subreddit.display_name,
-                    "score": post.score,
-                    "num_comments": post.num_comments,
-                    "timestamp": datetime.datetime.utcfromtimestamp(post.created_utc),
-                    "author": str(post.author),
-                    "url": post.url
-                })
-
-                self._fetch_valid_comments(post, topic)
-                time.sleep(1.5)
-
-    def _fetch_valid_comments(self, post, topic):
-        try:
-            post.comments.replace_more(limit=0)
-            comments = post.comments.list()
-
-            collected = 0
-            for comment in comments:
-                if comment.body.lower() in ("[deleted]", "[removed]"):
-                    continue
-
-                self.comments_list.append({
-                    "topic": topic,
-                    "comment_id": comment.id,
-                    "post_id": post.id,
-                    "author": str(comment.author),
-                    "body": comment.body,
-                    "timestamp": datetime.datetime.utcfromtimestamp(comment.created_utc),
-                    "comment_length": len(comment.body.split()),
-                    "score": comment.score
-                })
-
-                collected += 1
-                if collected >= self.max_comments:
-                    break
-
-        except Exception as e:
-            print(f"❌ Error fetching comments from post {post.id}: {e}")
-            time.sleep(5)
-
-
-    def analyze_sentiment(self, text):
-        if not text:
-            return None
+    def _finish_run(self):
+        # A crashed streaming run never reaches the database stage; close the loader its chunks went to
+        if self._stream_database is not None:
+            self.load_to_database()
+        self.write_metrics()
+        if self.scorer.tracer is not None:
+            self.scorer.tracer.close()
+
+    def write_metrics(self):
+        if not self.metrics.enabled or not self.metrics_path:
+            return
+        # Throughput of the analyzers: texts served from the score cache or repeated across records don't count
+        scoring_seconds = self.metrics.seconds("scoring")
+        if scoring_seconds:
+            self.metrics.set_gauge("texts_per_second", round(self.metrics.count("texts_analyzed") / scoring_seconds, 2))
         try:
-            scores = self.vader_analyzer.polarity_scores(text)
-            return scores["compound"]
-        except Exception as e:
-            print(f"⚠️ Sentiment analysis failed: {e}")
-            return None
+            json_path, prometheus_path = self.metrics.write(self.metrics_path)
+            print(f"📈 Run metrics saved to {json_path} and {prometheus_path}")
+        except OSError as e:
+            print(f"⚠️ Could not write run metrics: {e}")
+
+    def clear_checkpoint(self):
+        # Only called once a run's output is safely written
+        if self.checkpoint is not None:
+            self.checkpoint.clear()
+
+    def _make_reddit(self, **kwargs):
+        return praw.Reddit(
+            client_id=os.getenv("REDDIT_CLIENT_ID"),
+            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
+            user_agent=os.getenv("REDDIT_USER_AGENT"),
+            **self.reddit_kwargs,
+            **kwargs
+        )
 
+    def _fetch_posts_and_comments(self):
+        fetcher = ConcurrentFetcher(
+            self._make_reddit, self.subreddit_name,
+            max_posts=self.max_posts, max_comments=self.max_comments,
+            max_workers=self.fetch_workers, requests_per_minute=self.requests_per_minute,
+            comment_cache=self.comment_cache
+        )
 
-    def calculate_opinion_strength(self, text, polarity=None):
-        if not text:
-            return None
+        skip_topics, skip_posts, on_topic_done = set(), set(), None
+        if self.checkpoint is not None:
+            skip_topics = self.checkpoint.completed_topics()
+            skip_posts = self.checkpoint.completed_posts()
+            on_topic_done = self.checkpoint.complete_topic
+            for _, post_record, comment_records in self.checkpoint.iter_records():
+                self._collect(post_record, comment_records)
+            if skip_posts:
+                print(f"♻️ Resuming from checkpoint: {len(skip_topics)} topics and {len(skip_posts)} posts already done")
+
+        current_topic = None
+        topic_started = time.perf_counter()
+        progress = tqdm(
+            fetcher.fetch(self.topics, skip_topics=skip_topics, skip_posts=skip_posts, on_topic_done=on_topic_done),
+            desc="[posts]", ncols=100
+        )
+        for topic, post_record, comment_records in progress:
+            if topic != current_topic:
+                if current_topic is not None:
+                    now = time.perf_counter()
+                    self.metrics.add_time("topic", now - topic_started, topic=current_topic)
+                    topic_started = now
+                current_topic = topic
+                print(f"\n🎬 Scraping topic {self.topics.index(topic) + 1}/{len(self.topics)}: {topic}")
+                progress.set_description(f"[{topic[:25]}]")
+
+            if comment_records is None:
+                # Kept for this run's output, but not checkpointed: a resumed run fetches it again
+                comment_records = []
+                self.metrics.increment("comment_fetch_failures", topic=topic)
+            elif self.checkpoint is not None:
+                self.checkpoint.record_post(topic, post_record, comment_records)
+            self._collect(post_record, comment_records)
+            self.metrics.increment("posts_fetched", topic=topic)
+            self.metrics.increment("comments_fetched", len(comment_records), topic=topic)
+        if current_topic is not None:
+            self.metrics.add_time("topic", time.perf_counter() - topic_started, topic=current_topic)
+
+        stats = fetcher.scheduler.stats()
+        for name in ("requests", "retries", "failures", "circuit_opens"):
+            self.metrics.increment(f"api_{name}", stats[name])
+        self.metrics.add_time("throttle", stats["throttled_seconds"])
+        print(f"🌐 {stats['requests']} Reddit requests ({stats['retries']} retried), "
+              f"{stats['throttled_seconds']:.1f}s throttled")
+        if self.comment_cache is not None:
+            print(f"📦 Comment cache: {self.comment_cache.hits} hits, {self.comment_cache.misses} misses")
+            self.metrics.increment("comment_cache_hits", self.comment_cache.hits)
+            self.metrics.increment("comment_cache_misses", self.comment_cache.misses)
+
+
+    def _collect(self, post_record, comment_records):
+        if self.sink is None:
+            self.posts_list.append(post_record)
+            self.comments_list.extend(comment_records)
+            return
+
+        # Streaming mode: only a bounded batch of unscored records is held in memory
+        self._stream_posts.append(post_record)
+        self._stream_comments.extend(comment_records)
+        if len(self._stream_posts) + len(self._stream_comments) >= self.sink.chunk_size:
+            self._flush_stream()
+
+    def _flush_stream(self, score=True):
+        if score:
+            self._score_records(self._stream_comments + self._stream_posts)
+        posts, comments = self._stream_posts, self._stream_comments
+        self._stream_posts = []
+        self._stream_comments = []
+        self.sink.write_posts(posts)
+        self.sink.write_comments(comments)
+        if self._stream_database is None:
+            self._stream_database = DatabaseLoader.from_config(self.db_config)
+        self._stream_database.write_posts(posts)
+        self._stream_database.write_comments(comments)
+
+    def _flush_stream_after_crash(self):
+        # Records still buffered for the sink exist nowhere else without a checkpoint: write them
+        # scored if the scorer still works, otherwise as fetched
+        buffered = len(self._stream_posts) + len(self._stream_comments)
+        if not buffered:
+            return
         try:
-            blob = TextBlob(text)
-            subjectivity = blob.sentiment.subjectivity
-            polarity = polarity if polarity is not None else self.analyze_sentiment(text)
-            base_strength = abs(polarity) * subjectivity
-
-            certainty_score = self._certainty_word_boost(text)
-            hedge_penalty = self._hedging_penalty(text)
-            emphasis_boost = self._text_emphasis_boost(text)
-            emoji_boost = self._emoji_sentiment_boost(text)
-
-            text_lower = text.lower()
-            normalized = text_lower.replace("’", "'").strip()
-
-            # Boost if polarity is strong
-            if abs(polarity) > 0.6:
-                base_strength += 0.1
-
-            # Pattern-based: certainty verb + superlative adjective
-            certainty_verbs = ["believe", "know", "guarantee", "stand by", "swear", "firmly think", "can confirm"]
-            superlatives = ["best", "worst", "greatest", "most amazing", "least enjoyable", "biggest", "craziest"]
-            if any(v in text_lower for v in certainty_verbs) and any(s in text_lower for s in superlatives):
-                base_strength += 0.1
-
-            # Soft negation pattern (expanded)
-            negated_verbs = [
-                "like", "love", "enjoy", "recommend", "prefer",
-                "appreciate", "stand", "tolerate", "hate", "support"
-            ]
-            if polarity == 0 and any(f"didn't {v}" in normalized for v in negated_verbs):
-                base_strength += 0.3
-
-            if polarity == 0 and any(f"wasn't {adj}" in normalized for adj in ["great", "amazing", "terrible", "bad", "funny", "interesting"]):
-                base_strength += 0.2
-
-            # Mixed opinion clause handling
-            if "but" in text_lower or "however" in text_lower:
-                base_strength += 0.15
-
-            strength = base_strength * (1 + certainty_score + emoji_boost + emphasis_boost - hedge_penalty)
-            return min(max(strength, 0.0), 1.0)
-
+            self._score_records(self._stream_comments + self._stream_posts)
         except Exception as e:
-            print(f"⚠️ Opinion strength calculation failed: {e}")
-            return None
-        
-
-    def _certainty_word_boost(self, text):
-        words = text.lower().split()
-        return 0.15 * sum(1 for word in words if word in self.booster_dict)
-
-
-    def _hedging_penalty(self, text):
-        text_lower = text.lower()
-        return 0.1 * sum(1 for word in self.hedging_words if word in text_lower)
-
+            print(f"⚠️ Could not score the last {buffered} buffered records ({e}); writing them unscored")
+        finally:
+            self.scorer.shutdown()
+        self._flush_stream(score=False)
 
-    def _text_emphasis_boost(self, text):
-        boost = 0.0
-        if text.isupper():
-            boost += 0.2  # increased from 0.1
-        if "!" in text:
-            boost += 0.2  # increased from 0.1
-        return boost
 
+    def transform_data(self):
+        print("🔄 Running default transform_data: sentiment + opinion + plausibility")
 
-    def _emoji_sentiment_boost(self, text):
-        text = text.strip()
-        positive_hits = sum(e in text for e in self.positive_emojis)
-        negative_hits = sum(e in text for e in self.negative_emojis)
-        print("Positive emoji hits:", [e for e in self.positive_emojis if e in text])
-        print("Negative emoji hits:", [e for e in self.negative_emojis if e in text])
-
-        boost = 0.1 * positive_hits - 0.1 * negative_hits
-
-        # Refined fallback logic
-        if boost == 0:
-            if negative_hits > 0:
-                boost -= 0.3
-            elif positive_hits > 0:
-                boost += 0.3
-
-        return boost
+        try:
+            if self.columnar and self.sink is None:
+                self._score_frames()
+            else:
+                self._score_records(self.comments_list + self.posts_list)
+            if self.sink is not None:
+                self._flush_stream()
+        finally:
+            self.scorer.shutdown()
+
+        cache = self.scorer.score_cache
+        if cache is not None:
+            print(f"🗃️ Score cache: {cache.hits} hits, {cache.misses} misses ({cache.hit_rate():.0%} hit rate)")
+            self.metrics.increment("score_cache_hits", cache.hits)
+            self.metrics.increment("score_cache_misses", cache.misses)
+
+
+    def _score_records(self, records):
+        # A comment linked to several topics appears once per topic; score_many scores each distinct body once
+        with self.metrics.timer("scoring"):
+            scores = self.scorer.score_many([record.get("body") for record in records])
+        self.metrics.increment("texts_scored", len(records))
+        for record, record_scores in zip(records, scores):
+            record.update(record_scores)
+
+
+    def _score_frames(self):
+        bodies = [record.get("body") for record in self.comments_list + self.posts_list]
+        with self.metrics.timer("scoring"):
+            scores = self.scorer.score_frame(bodies)
+        self.metrics.increment("texts_scored", len(bodies))
+        split = len(self.comments_list)
+        self.comments_df = pd.concat([pd.DataFrame(self.comments_list), scores.iloc[:split].reset_index(drop=True)], axis=1)
+        self.posts_df = pd.concat([pd.DataFrame(self.posts_list), scores.iloc[split:].reset_index(drop=True)], axis=1)
+        self._frames_scored = True
+
+
+    def _scored_records(self, records, df):
+        if not self.columnar or self.sink is not None:
+            return records
+        # NaN scores go back to None so they load as NULL
+        return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+    # Scoring API kept on the scraper for existing callers; see TextScorer
+    def analyze_sentiment(self, text):
+        return self.scorer.analyze_sentiment(text)
 
-    
+    def calculate_opinion_strength(self, text, polarity=None):
+        return self.scorer.calculate_opinion_strength(text, polarity)
 
     def calculate_realism_score(self, polarity, opinion_strength):
-        if polarity is None or opinion_strength is None:
-            return None
-        return round((1 - abs(polarity)) * (1 - opinion_strength), 3)
-
-
+        return self.scorer.calculate_realism_score(polarity, opinion_strength)
 
     def calculate_named_entity_score(self, text):
-        if not text:
-            return 0.0
-        doc = real_world_entity_parser(text.strip())
-        entity_count = sum(1 for ent in doc.ents if ent.label_ in {"PERSON", "ORG", "GPE", "PRODUCT", "EVENT"})
-        return round(min(entity_count / 5.0, 1.0), 3)
-
+        return self.scorer.calculate_named_entity_score(text)
 
     def calculate_plausibility_score(self, text, polarity, opinion_strength):
-        realism = self.calculate_realism_score(polarity, opinion_strength)
-        named_entity_score = self.calculate_named_entity_score(text)
-        if realism is None:
-            return None
-        plausibility = (
-            0.6 * realism +
-            0.15 * named_entity_score +
-            0.15 * (1 - opinion_strength) +
-            0.1 * (1 - abs(polarity))
-        )
-        return round(plausibility, 3)
-    
+        return self.scorer.calculate_plausibility_score(text, polarity, opinion_strength)
 
     def calculate_plausibility_score_v2(self, text, polarity=None, strength=None):
-        
-        if not text:
-            return None  # Skip scoring for empty or missing text
-        
-        text = text.lower().strip()
-
-        # Expanded keyword banks
-        real_world_tech = {
-            "ai", "artificial intelligence", "machine learning", "neuralink", "elon musk",
-            "facebook", "meta", "google", "deepfake", "facial recognition", "data mining",
-            "surveillance", "tiktok", "social credit", "credit score", "china", "government",
-            "algorithm", "privacy breach", "drones", "apple", "iphone", "gps", "blockchain",
-            "neural implants", "neural implant", "rating system", "data tracking", "metadata",
-            "facial scanner", "data collection", "implant", "chip", "biometrics"
-        }
-
-        logic_indicators = {
-            "could happen", "can happen", "might happen", "i can see this", "already happening",
-            "already doing", "they're doing", "literally doing", "is literally what", "definitely happening",
-            "likely in the future", "makes sense", "because", "due to", "as a result", "if this continues",
-            "this is happening", "not far off", "not far from reality", "i wouldn't be surprised",
-            "they're building it", "this is basically", "this could totally happen", "totally possible",
-            "feels like", "the future is", "could actually happen", "we’ll all have", "this episode nailed it"
-        }
-
-        fantasy_flags = {
-            "aliens", "soul", "telepathy", "implanted memories", "clone wars",
-            "the moon is alive", "reptilian", "ghost", "afterlife", "simulation",
-            "psychic", "mind reading", "time traveler", "resurrected", "immortal",
-            "upload soul", "parallel universe", "alternate dimension"
-        }
-
-        # Scores
-        tech_score = sum(1 for word in real_world_tech if word in text)
-        logic_score = sum(1 for phrase in logic_indicators if phrase in text)
-        fantasy_penalty = sum(1 for word in fantasy_flags if word in text)
-
-        # Entity score using spaCy
-        doc = real_world_entity_parser(text)
-        entity_score = sum(1 for ent in doc.ents if ent.label_ in {"PERSON", "ORG", "GPE", "PRODUCT"})
-        entity_score = min(entity_score, 3)
-
-        # Proper noun signal (adds a tiny nudge)
-        proper_noun_boost = 0.05 if sum(1 for token in doc if token.pos_ == "PROPN") >= 2 else 0
-
-        # Real-world actor bonus (slightly increases plausibility)
-        if any(x in text for x in ["elon", "bezos", "zuckerberg", "nsa", "cia", "facebook", "apple"]):
-            real_actor_bonus = 0.1
-        else:
-            real_actor_bonus = 0
-
-        # Sarcasm-based fallback
-        sarcasm_bonus = 0
-        if polarity is not None and strength is not None:
-            if polarity < 0 and strength > 0.4:
-                if any(x in text for x in ["sure", "totally", "never lie", "obviously not corrupt", "trustworthy folks", "oh sure", "as if"]):
-                    sarcasm_bonus += 0.2
-
-        # Soft realism cues (boost for generic plausible phrasing)
-        soft_realism = 0
-        if any(x in text for x in ["not sure how realistic", "seems real", "imagine if", "hits hard", "fiction but", "wild but true", "already a thing", "happening now"]):
-            soft_realism += 0.2
-
-        # Final score
-        score = (
-            0.3 * tech_score +
-            0.35 * logic_score +
-            0.25 * entity_score -
-            0.4 * fantasy_penalty +
-            sarcasm_bonus +
-            soft_realism +
-            proper_noun_boost +
-            real_actor_bonus
-        )
-
-        # Floor bump for “engaged” speech even if no features triggered
-        if score == 0 and polarity and strength:
-            score += 0.1
-
-        print(f"📊 TECH: {tech_score}, LOGIC: {logic_score}, ENT: {entity_score}, FANTASY: {fantasy_penalty}, SARCASM: {sarcasm_bonus}, SOFT: {soft_realism}, PROPN: {proper_noun_boost}, REAL: {real_actor_bonus}")
-        print(f"🔎 FINAL: {score}")
-
-        return max(0, min(round(score, 2), 5))
-    
-
+        return self.scorer.calculate_plausibility_score_v2(text, polarity, strength)
 
     def label_sentiment(self, score):
-        if score is None:
-            return None
-        if score > 0.3:
-            return "Positive"
-        elif score < -0.3:
-            return "Negative"
-        else:
-            return "Neutral"
-
+        return self.scorer.label_sentiment(score)
 
     def label_opinion_strength(self, score):
-        if score is None:
-            return None
-        if score > 0.5:
-            return "Strong"
-        elif score < 0.1:
-            return "Weak"
-        else:
-            return "Mixed"
-
+        return self.scorer.label_opinion_strength(score)
 
     def label_plausibility(self, score):
-        if score is None:
-            return None
-        if score >= 0.6:
-            return "High"
-        elif score >= 0.3:
-            return "Medium"
-        else:
-            return "Low"
-
-
-    def transform_data(self):
-        print("🔄 Running default transform_data: sentiment + opinion + plausibility")
-
-        if self.comments_list:
-            for comment in self.comments_list:
-                body = comment.get("body")
-                polarity = self.analyze_sentiment(body)
-                opinion_strength = self.calculate_opinion_strength(body, polarity)
-                plausibility_score = self.calculate_plausibility_score_v2(body, polarity, opinion_strength)
-
-                comment["sentiment_polarity"] = polarity
-                comment["sentiment_label"] = self.label_sentiment(polarity)
-
-                comment["opinion_strength"] = opinion_strength
-                comment["opinion_label"] = self.label_opinion_strength(opinion_strength)
-
-                comment["plausibility_score"] = plausibility_score
-                comment["plausibility_label"] = self.label_plausibility(plausibility_score)
-
-        if self.posts_list:
-            for post in self.posts_list:
-                body = post.get("body")
-                polarity = self.analyze_sentiment(body)
-                opinion_strength = self.calculate_opinion_strength(body, polarity)
-                plausibility_score = self.calculate_plausibility_score_v2(body, polarity, opinion_strength)
-
-                post["sentiment_polarity"] = polarity
-                post["sentiment_label"] = self.label_sentiment(polarity)
-
-                post["opinion_strength"] = opinion_strength
-                post["opinion_label"] = self.label_opinion_strength(opinion_strength)
-
-                post["plausibility_score"] = plausibility_score
-                post["plausibility_label"] = self.label_plausibility(plausibility_score)
-
-
-
+        return self.scorer.label_plausibility(score)
 
+    def score_text(self, body):
+        return self.scorer.score_text(body)
 
 
     def load_to_database(self, db_config=None):
-        pass
+        # db_config overrides the scraper's database for this call. When streaming to a sink,
+        # _flush_stream has already upserted every chunk it wrote
+        if self.sink is not None:
+            loader, self._stream_database = self._stream_database, None
+            if loader is None:
+                return
+            loader.disconnect()
+        else:
+            if not self.posts_list and not self.comments_list:
+                return
+
+            loader = DatabaseLoader.from_config(db_config or self.db_config)
+            try:
+                loader.write_posts(self._scored_records(self.posts_list, self.posts_df))
+                loader.write_comments(self._scored_records(self.comments_list, self.comments_df))
+            finally:
+                loader.disconnect()
+        for table, rows in loader.rows_written.items():
+            self.metrics.increment("rows_written", rows, target="database", table=table)
+        print(f"🗄️ Upserted {loader.rows_written['posts']} posts and {loader.rows_written['comments']} comments")
 
     def save_to_excel(self, filename=None):
+        if self.sink is not None:
+            try:
+                self._flush_stream_after_crash()
+            finally:
+                self.sink.close()
+            for table, rows in self.sink.rows_written.items():
+                self.metrics.increment("rows_written", rows, target="sink", table=table)
+            print(f"💾 Streamed {self.sink.rows_written['posts']} posts and {self.sink.rows_written['comments']} comments "
+                  f"to {self.sink.path('posts')} / {self.sink.path('comments')}")
+            if not self.export_excel:
+                return
+
         if not os.path.exists("data"):
             os.makedirs("data")
 
@@ -548,13 +381,21 @@ class RedditScraper:
                 filename = os.path.join("data", f"{base_filename}_{counter}.xlsx")
                 counter += 1
 
-        self.posts_df = pd.DataFrame(self.posts_list)
-        self.comments_df = pd.DataFrame(self.comments_list)
+        if self.sink is not None:
+            # Optional final export of the streamed run; this one does hold everything in memory
+            self.posts_df = self.sink.read("posts")
+            self.comments_df = self.sink.read("comments")
+        elif not (self.columnar and self._frames_scored):
+            # Also the fallback when a columnar run crashed before scoring: keep the raw records
+            self.posts_df = pd.DataFrame(self.posts_list)
+            self.comments_df = pd.DataFrame(self.comments_list)
 
         with pd.ExcelWriter(filename, engine='openpyxl', mode='w') as writer:
             self.posts_df.to_excel(writer, index=False, sheet_name="Posts")
             self.comments_df.to_excel(writer, index=False, sheet_name="Comments")
 
+        self.metrics.increment("rows_written", len(self.posts_df), target="excel", table="posts")
+        self.metrics.increment("rows_written", len(self.comments_df), target="excel", table="comments")
         print(f"💾 Main file updated: {filename}")
         self.posts_list.clear()
         self.comments_list.clear()
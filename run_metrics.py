@@ -0,0 +1,149 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+
+
+_NO_TIMER = nullcontext()
+
+
+class RunMetrics:
+    # Timers, counters and gauges for one scraper run, each keyed by a name plus optional
+    # labels (stage="fetch", topic="Nosedive", component="spacy", ...). Safe to update from
+    # fetch threads. A disabled instance ignores every call, so instrumented code keeps a
+    # single attribute check and no bookkeeping when metrics are off.
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.started = time.time()
+        self._started_monotonic = time.monotonic()
+        self._timers = {}
+        self._counters = {}
+        self._gauges = {}
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        # Copies sent to worker processes (e.g. inside a pickled TextScorer) come back
+        # disabled; a worker reports into its own instance and the parent merge()s its report
+        return (RunMetrics, (False,))
+
+    def merge(self, report):
+        # Adds the timers and counters of another instance's report() to this one
+        if not self.enabled:
+            return
+        with self._lock:
+            for timer in report["timers"]:
+                key = (timer["name"], tuple(sorted(timer["labels"].items())))
+                calls, total = self._timers.get(key, (0, 0.0))
+                self._timers[key] = (calls + timer["calls"], total + timer["seconds"])
+            for counter in report["counters"]:
+                key = (counter["name"], tuple(sorted(counter["labels"].items())))
+                self._counters[key] = self._counters.get(key, 0) + counter["value"]
+
+    def timer(self, name, **labels):
+        if not self.enabled:
+            return _NO_TIMER
+        return self._timer(name, labels)
+
+    @contextmanager
+    def _timer(self, name, labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started, **labels)
+
+    def add_time(self, name, seconds, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            calls, total = self._timers.get(key, (0, 0.0))
+            self._timers[key] = (calls + 1, total + seconds)
+
+    def increment(self, name, value=1, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def seconds(self, name, **labels):
+        return self._timers.get((name, tuple(sorted(labels.items()))), (0, 0.0))[1]
+
+    def count(self, name, **labels):
+        return self._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def report(self):
+        # JSON-ready snapshot: every series as {"name", "labels", ...}
+        with self._lock:
+            return {
+                "started": datetime.fromtimestamp(self.started, timezone.utc).isoformat(timespec="seconds"),
+                "wall_seconds": round(time.monotonic() - self._started_monotonic, 6),
+                "timers": [
+                    {"name": name, "labels": dict(labels), "calls": calls, "seconds": round(seconds, 6)}
+                    for (name, labels), (calls, seconds) in self._timers.items()
+                ],
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in self._counters.items()
+                ],
+                "gauges": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in self._gauges.items()
+                ]
+            }
+
+    def to_prometheus(self, prefix="blackmirror_scraper"):
+        # Prometheus text exposition format, e.g. for node_exporter's textfile collector:
+        # timers become <name>_seconds summaries (sum + count), counters <name>_total
+        report = self.report()
+        lines = [
+            f"# TYPE {prefix}_run_started_timestamp_seconds gauge",
+            f"{prefix}_run_started_timestamp_seconds {self.started:.3f}",
+            f"# TYPE {prefix}_run_wall_seconds gauge",
+            f"{prefix}_run_wall_seconds {report['wall_seconds']}"
+        ]
+        families = (
+            (report["timers"], "_seconds", "summary", (("_sum", "seconds"), ("_count", "calls"))),
+            (report["counters"], "_total", "counter", (("", "value"),)),
+            (report["gauges"], "", "gauge", (("", "value"),))
+        )
+        for series, family_suffix, kind, samples in families:
+            for name in dict.fromkeys(sample["name"] for sample in series):
+                family = f"{prefix}_{name}{family_suffix}"
+                lines.append(f"# TYPE {family} {kind}")
+                for sample in series:
+                    if sample["name"] == name:
+                        labels = _prometheus_labels(sample["labels"])
+                        lines.extend(f"{family}{suffix}{labels} {sample[field]}" for suffix, field in samples)
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        # Writes the JSON run report to path and the Prometheus text next to it (.prom)
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+        prometheus_path = os.path.splitext(path)[0] + ".prom"
+        with open(prometheus_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        return path, prometheus_path
+
+
+def _prometheus_labels(labels):
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{key}="{value}"')
+    return "{" + ",".join(pairs) + "}"
@@ -0,0 +1,95 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+
+class ScoreCache:
+    # On-disk score cache keyed by a hash of scorer version + text, so weekly re-scrapes
+    # only analyze bodies that are new or edited. Each scorer version keeps its own rows,
+    # so switching back and forth between versions doesn't throw scores away; rows of
+    # versions no longer in use stop being touched and are the first to go when the table
+    # is trimmed back to max_entries by least recent use.
+    def __init__(self, path, scorer_version, max_entries=500000):
+        self.path = path
+        self.scorer_version = scorer_version
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS scores (
+                key TEXT PRIMARY KEY,
+                scorer_version TEXT NOT NULL,
+                scores TEXT NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_scores_last_used ON scores (last_used);
+        """)
+        # Row count kept up to date by put_many, so trimming never has to count the table
+        self.entries = self.connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+        with self.connection:
+            self._evict()
+
+    def key(self, text):
+        # Scores don't depend on surrounding whitespace (every scorer tokenizes or strips first)
+        return hashlib.sha256(f"{self.scorer_version}\n{text.strip()}".encode("utf-8")).hexdigest()
+
+    def get_many(self, texts):
+        # {text: scores} for the cached texts; touched entries move to the back of the LRU order
+        texts_by_key = {}
+        for text in texts:
+            texts_by_key.setdefault(self.key(text), []).append(text)
+
+        found_keys = []
+        found = {}
+        for key, payload in self._select("key, scores", list(texts_by_key)):
+            found_keys.append(key)
+            for text in texts_by_key[key]:
+                found[text] = json.loads(payload)
+
+        now = time.time()
+        with self.connection:
+            self.connection.executemany("UPDATE scores SET last_used = ? WHERE key = ?", [(now, key) for key in found_keys])
+        self.hits += len(found)
+        self.misses += len(texts) - len(found)
+        return found
+
+    def put_many(self, scores_by_text):
+        now = time.time()
+        rows = {self.key(text): json.dumps(scores) for text, scores in scores_by_text.items()}
+        replaced = sum(1 for _ in self._select("key", list(rows)))
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO scores (key, scorer_version, scores, last_used) VALUES (?, ?, ?, ?)",
+                [(key, self.scorer_version, payload, now) for key, payload in rows.items()]
+            )
+            self.entries += len(rows) - replaced
+            self._evict()
+
+    def _select(self, columns, keys):
+        # Rows for keys, looked up by primary key in chunks below SQLite's parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            yield from self.connection.execute(
+                f"SELECT {columns} FROM scores WHERE key IN ({', '.join('?' * len(chunk))})", chunk
+            )
+
+    def _evict(self):
+        excess = self.entries - self.max_entries
+        if excess > 0:
+            self.entries -= self.connection.execute(
+                "DELETE FROM scores WHERE key IN (SELECT key FROM scores ORDER BY last_used LIMIT ?)", (excess,)
+            ).rowcount
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,101 @@
+import json
+import os
+import queue
+import random
+import threading
+import time
+
+
+class TraceCollector:
+    # Stand-in for ScoreTracer inside a scoring worker process: sampled traces are kept in
+    # memory and handed back with the shard's scores, and the parent's ScoreTracer writes them
+    def __init__(self, sample_rate):
+        self.sample_rate = sample_rate
+        self.traces = []
+        self._random = random.Random()
+
+    def sample(self):
+        return self.sample_rate >= 1 or self._random.random() < self.sample_rate
+
+    def record(self, trace):
+        self.traces.append(trace)
+
+    def drain(self):
+        traces, self.traces = self.traces, []
+        return traces
+
+
+class ScoreTracer:
+    # Sampled feature-attribution traces for TextScorer: each sampled text's score breakdown
+    # is queued and written as one JSON line by a background thread, so the scoring loop
+    # never waits on disk or stdout. When the queue is full, traces are dropped (and counted)
+    # rather than slowing scoring down. close() ends a run's traces; open() appends the next
+    # run's to the same file, and traces recorded while closed are dropped.
+    def __init__(self, path, sample_rate=0.01, seed=None, max_queue=10000):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.written = 0
+        self.dropped = 0
+        self._random = random.Random(seed)
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = None
+        self.open()
+
+    @property
+    def closed(self):
+        return self._thread is None
+
+    def open(self):
+        if not self.closed:
+            return
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.written = 0
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=self._queue.maxsize)
+        file = open(self.path, "a", encoding="utf-8")
+        self._thread = threading.Thread(target=self._write_loop, args=(self._queue, file), daemon=True)
+        self._thread.start()
+
+    def sample(self):
+        return self.sample_rate >= 1 or self._random.random() < self.sample_rate
+
+    def record(self, trace):
+        if self.closed:
+            self.dropped += 1
+            return
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def _write_loop(self, traces, file):
+        try:
+            while True:
+                trace = traces.get()
+                if trace is None:
+                    break
+                file.write(json.dumps(trace, ensure_ascii=False, default=str) + "\n")
+                self.written += 1
+                if traces.empty():
+                    file.flush()
+        finally:
+            file.close()
+
+    def close(self, timeout=10.0):
+        if self.closed:
+            return
+        thread, self._thread = self._thread, None
+        # A writer that died (e.g. on a full disk) never drains the queue, so don't wait on it
+        deadline = time.monotonic() + timeout
+        while thread.is_alive() and time.monotonic() < deadline:
+            try:
+                self._queue.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            print(f"⚠️ Score trace writer did not finish within {timeout}s; {self._queue.qsize()} traces not written")
+        print(f"🧾 Wrote {self.written} score traces to {self.path}" + (f" ({self.dropped} dropped)" if self.dropped else ""))
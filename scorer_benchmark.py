@@ -0,0 +1,176 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from text_scorer import TextScorer
+
+
+# Reproducible synthetic comments in the shapes the scraper sees: one-liners, long rambling
+# replies, emoji-heavy reactions and comments naming people, companies and places
+CORPUS_KINDS = ("short", "long", "emoji", "entity")
+
+_OPENERS = ["honestly", "I think", "this episode", "the ending", "lowkey", "imagine if", "no way", "maybe"]
+_WORDS = [
+    "show", "plot", "tech", "future", "really", "could", "never", "definitely", "probably", "kind", "of",
+    "amazing", "terrible", "boring", "scary", "realistic", "social", "media", "ai", "implant", "rating",
+    "system", "cookie", "memory", "always", "seems", "like", "happen", "already", "government", "data",
+    "privacy", "robot", "dog", "simulation", "the", "and", "but", "so", "not", "very", "absolutely"
+]
+_EMOJIS = ["😂", "😭", "🔥", "💀", "😱", "👍", "😡", "❤️", "🤖", "😬", "🙃", "👏"]
+_ENTITIES = [
+    "Elon Musk", "Mark Zuckerberg", "Google", "Meta", "Neuralink", "OpenAI", "Netflix", "Charlie Brooker",
+    "London", "China", "California", "Amazon", "Apple", "Tesla", "the FBI", "Microsoft"
+]
+
+
+def _sentence(rng, words):
+    text = " ".join([rng.choice(_OPENERS)] + [rng.choice(_WORDS) for _ in range(words)])
+    return text + rng.choice([".", "!", "?", "...", "!!"])
+
+
+def synthetic_corpus(size=200, seed=0):
+    # {kind: [text, ...]} with size texts per kind; the same seed always gives the same corpus
+    rng = random.Random(seed)
+    corpus = {kind: [] for kind in CORPUS_KINDS}
+    for _ in range(size):
+        corpus["short"].append(_sentence(rng, rng.randint(2, 8)))
+        corpus["long"].append(" ".join(_sentence(rng, rng.randint(10, 25)) for _ in range(rng.randint(6, 12))))
+        corpus["emoji"].append(" ".join(
+            rng.choice(_EMOJIS) * rng.randint(1, 3) if rng.random() < 0.5 else rng.choice(_WORDS)
+            for _ in range(rng.randint(4, 14))
+        ))
+        corpus["entity"].append(" ".join(
+            f"{rng.choice(_ENTITIES)} {rng.choice(['is', 'and', 'with', 'from', 'bought'])} {rng.choice(_ENTITIES)}"
+            if rng.random() < 0.6 else _sentence(rng, rng.randint(3, 8))
+            for _ in range(rng.randint(2, 5))
+        ))
+    return corpus
+
+
+# Scoring functions timed per call, as transform_data calls them
+BENCHMARKS = {
+    "analyze_sentiment": lambda scorer, text: scorer.analyze_sentiment(text),
+    "calculate_opinion_strength": lambda scorer, text: scorer.calculate_opinion_strength(text),
+    "calculate_plausibility_score_v2": lambda scorer, text: scorer.calculate_plausibility_score_v2(text),
+    "_emoji_sentiment_boost": lambda scorer, text: scorer._emoji_sentiment_boost(text),
+    "_hedging_penalty": lambda scorer, text: scorer._hedging_penalty(text)
+}
+
+
+def time_calls(function, texts, repeats=5):
+    # Per-call wall time after one untimed warm-up pass. Each text keeps its fastest of
+    # repeats timings and throughput comes from the fastest pass, so a busy machine inflates
+    # the numbers much less than it would a mean
+    for text in texts:
+        function(text)
+    timings = np.empty((repeats, len(texts)), dtype=np.float64)
+    for repeat in range(repeats):
+        for index, text in enumerate(texts):
+            started = time.perf_counter_ns()
+            function(text)
+            timings[repeat, index] = time.perf_counter_ns() - started
+    timings /= 1000
+    best = timings.min(axis=0)
+    p50, p90, p99 = np.percentile(best, [50, 90, 99])
+    return {
+        "calls": int(timings.size),
+        "texts_per_second": round(len(texts) / (timings.sum(axis=1).min() / 1e6), 1),
+        "p50_us": round(float(p50), 2),
+        "p90_us": round(float(p90), 2),
+        "p99_us": round(float(p99), 2),
+        "max_us": round(float(best.max()), 2)
+    }
+
+
+def run_benchmarks(scorer=None, size=200, seed=0, repeats=5, only=None):
+    scorer = scorer or TextScorer()
+    corpus = synthetic_corpus(size, seed)
+    # Production scoring parses entities in one nlp.pipe batch before the per-text scorers run
+    scorer.build_entity_cache([text for texts in corpus.values() for text in texts])
+
+    results = {}
+    for name, benchmark in BENCHMARKS.items():
+        if only and name not in only:
+            continue
+        function = lambda text, benchmark=benchmark: benchmark(scorer, text)
+        results[name] = {kind: time_calls(function, texts, repeats) for kind, texts in corpus.items()}
+        for kind, stats in results[name].items():
+            print(f"⏱️ {name:<32} {kind:<7} {stats['texts_per_second']:>11,.0f} texts/s   "
+                  f"p50 {stats['p50_us']:>9.1f} µs   p99 {stats['p99_us']:>9.1f} µs")
+
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scorer_version": scorer.version(),
+            "corpus_size": size,
+            "seed": seed,
+            "repeats": repeats
+        },
+        "results": results
+    }
+
+
+def compare(current, baseline, tolerance=0.2):
+    # [(function, kind, baseline p50 µs, current p50 µs), ...] for every case whose median call
+    # got more than tolerance slower than the baseline; cases missing from either run are ignored
+    regressions = []
+    for name, kinds in current["results"].items():
+        for kind, stats in kinds.items():
+            before = baseline.get("results", {}).get(name, {}).get(kind)
+            if before is None:
+                continue
+            change = stats["p50_us"] / before["p50_us"] - 1
+            marker = "❌" if change > tolerance else "✅"
+            print(f"{marker} {name:<32} {kind:<7} p50 {before['p50_us']:>9.1f} -> {stats['p50_us']:>9.1f} µs ({change:+.1%})")
+            if change > tolerance:
+                regressions.append((name, kind, before["p50_us"], stats["p50_us"]))
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Time the rule-based scorers on a synthetic corpus.")
+    parser.add_argument("--size", type=int, default=200, help="texts per corpus kind")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=5, help="timed passes over the corpus")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="benchmark just these functions")
+    parser.add_argument("-o", "--output", default="data/benchmarks/scorer_benchmark.json")
+    parser.add_argument("--baseline", help="earlier results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed slowdown of the median call before a case counts as a regression")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = run_benchmarks(size=args.size, seed=args.seed, repeats=args.repeats, only=args.only)
+
+    folder = os.path.dirname(args.output)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"💾 Benchmark results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["meta"].get("corpus_size") != args.size or baseline["meta"].get("seed") != args.seed:
+            print("⚠️ Baseline used a different corpus; comparisons are approximate.")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} case(s) slower than the baseline by more than {args.tolerance:.0%}")
+            sys.exit(1)
+        print("✅ No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from textblob._text import PUNCTUATION, EMOTICONS
+from textblob.en import sentiment as pattern_sentiment
+
+
+class SubjectivityLexicon:
+    # Flat word -> (polarity, subjectivity, intensity) table taken once from pattern's
+    # sentiment lexicon (the one TextBlob(text).sentiment uses), plus its modifier words and
+    # emoticons. subjectivity(text) tokenizes the text once and replays pattern's assessment
+    # rules (modifiers, negations, "(!)", emoticons) over plain dict and set lookups, so it
+    # returns the same value as TextBlob(text).sentiment.subjectivity.
+    def __init__(self, sentiment=pattern_sentiment):
+        len(sentiment)  # pattern loads its XML lexicon on first access
+        self.tokenizer = sentiment.tokenizer
+        self.negations = frozenset(sentiment.negations)
+        self.words = {word: tuple(senses[None]) for word, senses in dict.items(sentiment)}
+        self.modifiers = frozenset(
+            word for word, senses in dict.items(sentiment)
+            if any(tag in senses for tag in sentiment.modifiers)
+        )
+        self.emoticons = frozenset(emoticon.lower() for emoticons in EMOTICONS.values() for emoticon in emoticons)
+
+    def tokens(self, text):
+        return [word.lower() for word in " ".join(self.tokenizer(text)).split()]
+
+    def subjectivity(self, text):
+        return self.subjectivity_of_tokens(self.tokens(text))
+
+    def subjectivity_of_tokens(self, tokens):
+        # Mirrors pattern's Sentiment.assessments for untagged words, keeping only what the
+        # subjectivity average needs: each assessment's subjectivity and intensity
+        assessments = []
+        modifier = None
+        negation = None
+        for word in tokens:
+            scores = self.words.get(word)
+            if scores is not None:
+                _, subjectivity, intensity = scores
+                if modifier is None:
+                    assessments.append([subjectivity, intensity])
+                else:
+                    # "really good": the modifier's intensity scales this word
+                    previous = assessments[-1]
+                    previous[0] = max(-1.0, min(subjectivity * previous[1], 1.0))
+                    previous[1] = intensity
+                if negation is not None:
+                    assessments[-1][1] = 1.0 / assessments[-1][1]
+                modifier = word if word in self.modifiers else None
+                negation = word if word in self.negations else None
+            else:
+                if word in self.negations:
+                    negation = word
+                elif negation and len(word.strip("'")) > 1:
+                    negation = None
+                # "really not good" folds the negation into the modifier; small words keep both
+                if negation is not None and modifier is not None and modifier.endswith("ly"):
+                    negation = None
+                elif modifier and len(word) > 2:
+                    modifier = None
+                if word == "(!)":
+                    assessments.append([1.0, 1.0])
+                if not word.isalpha() and len(word) <= 5 and word not in PUNCTUATION and word in self.emoticons:
+                    assessments.append([1.0, 1.0])
+        return sum(subjectivity for subjectivity, _ in assessments) / float(len(assessments) or 1)
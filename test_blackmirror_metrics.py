@@ -1,12 +1,12 @@
 import pytest
-from black_mirror_scraper import BlackMirrorScraper  # Adjust path if needed
+from text_scorer import TextScorer
 import logging
 import re as regex
 
 
 
 # Setup
-scraper = BlackMirrorScraper(topics=["test"])
+scorer = TextScorer()
 
 
 
@@ -14,97 +14,97 @@ scraper = BlackMirrorScraper(topics=["test"])
 
 @pytest.mark.sentiment
 def test_high_positive_sentiment():
-    polarity = scraper.analyze_sentiment("I absolutely love this show! It's perfect.")
+    polarity = scorer.analyze_sentiment("I absolutely love this show! It's perfect.")
     logging.info(f"[High Positive] Got polarity = {polarity:.4f} | Expected: > 0.5")
     assert polarity > 0.3  # Positive sentiment
 
 @pytest.mark.sentiment
 def test_high_negative_sentiment():
-    polarity = scraper.analyze_sentiment("This was horrible. I hated every second.")
+    polarity = scorer.analyze_sentiment("This was horrible. I hated every second.")
     logging.info(f"[High Negative] Got polarity = {polarity:.4f} | Expected: < -0.5")
     assert polarity < -0.3  # Negative sentiment
 
 @pytest.mark.sentiment
 def test_neutral_sentiment():
-    polarity = scraper.analyze_sentiment("The episode was released last year.")
+    polarity = scorer.analyze_sentiment("The episode was released last year.")
     logging.info(f"[Neutral] Got polarity = {polarity:.4f} | Expected: between -0.2 and 0.2")
     assert -0.2 <= polarity <= 0.2
 
 @pytest.mark.sentiment
 def test_sarcastic_positive_sentiment():
-    polarity = scraper.analyze_sentiment("Oh great, another disasterpiece. Just what we needed.")
+    polarity = scorer.analyze_sentiment("Oh great, another disasterpiece. Just what we needed.")
     logging.info(f"[Sarcastic Positive] Got polarity = {polarity:.4f} | Expected: between 0.6 and 0.7")
     assert 0.6 <= polarity <= 0.7
 
 @pytest.mark.sentiment
 def test_sarcastic_negative_sentiment():# Sarcasm reads as positive in VADER despite negative tone
-    polarity = scraper.analyze_sentiment("Wow, perfect plan! Ruin everything again!")
+    polarity = scorer.analyze_sentiment("Wow, perfect plan! Ruin everything again!")
     logging.info(f"[Sarcastic Negative] Got polarity = {polarity:.4f} | Expected: between 0.5 and 0.7")
     assert 0.5 <= polarity <= 0.7
 
 @pytest.mark.sentiment
 def test_emoji_positive_sentiment():
-    polarity = scraper.analyze_sentiment("This was amazing! 😍🔥💯")
+    polarity = scorer.analyze_sentiment("This was amazing! 😍🔥💯")
     logging.info(f"[Emoji Positive] Got polarity = {polarity:.4f} | Expected: > 0.6")
     assert polarity > 0.6
 
 @pytest.mark.sentiment
 def test_emoji_negative_sentiment():
-    polarity = scraper.analyze_sentiment("This episode sucked 😡🤬")
+    polarity = scorer.analyze_sentiment("This episode sucked 😡🤬")
     logging.info(f"[Emoji Negative] Got polarity = {polarity:.4f} | Expected: between -0.55 and -0.4")
     assert -0.55 <= polarity <= -0.4
 
 @pytest.mark.sentiment
 def test_emoji_neutral_sentiment():
-    polarity = scraper.analyze_sentiment("It aired last night. 📺")
+    polarity = scorer.analyze_sentiment("It aired last night. 📺")
     logging.info(f"[Emoji Neutral] Got polarity = {polarity:.4f} | Expected: between -0.3 and 0.3")
     assert -0.3 <= polarity <= 0.3
 
 @pytest.mark.sentiment
 def test_mixed_sentiment():
-    polarity = scraper.analyze_sentiment("This episode was fun but the ending sucked.")
+    polarity = scorer.analyze_sentiment("This episode was fun but the ending sucked.")
     logging.info(f"[Mixed] Got polarity = {polarity:.4f} | Expected: between -0.5 and 0.4")
     assert -0.5 <= polarity <= 0.4
 
 @pytest.mark.sentiment
 def test_question_sentiment():
-    polarity = scraper.analyze_sentiment("Did anyone else think that was weird?")
+    polarity = scorer.analyze_sentiment("Did anyone else think that was weird?")
     logging.info(f"[Question Sentiment] Got polarity = {polarity:.4f} | Expected: between -0.3 and 0.3")
     assert -0.3 <= polarity <= 0.3
 
 @pytest.mark.sentiment
 def test_shouting_negative_sentiment():
-    polarity = scraper.analyze_sentiment("I HATED THIS EPISODE SO MUCH")
+    polarity = scorer.analyze_sentiment("I HATED THIS EPISODE SO MUCH")
     logging.info(f"[Shouting Negative] Got polarity = {polarity:.4f} | Expected: < -0.3")
     assert polarity < -0.3
 
 @pytest.mark.sentiment
 def test_negation_handling():
-    polarity = scraper.analyze_sentiment("I didn’t like it.")
+    polarity = scorer.analyze_sentiment("I didn’t like it.")
     logging.info(f"[Negation Handling] Got polarity = {polarity:.4f} | Expected: < 0.4")
     assert polarity < 0.4
 
 @pytest.mark.sentiment
 def test_double_negative_flips_positive():
-    polarity = scraper.analyze_sentiment("It wasn't that bad.")
+    polarity = scorer.analyze_sentiment("It wasn't that bad.")
     logging.info(f"[Double Negative] Got polarity = {polarity:.4f} | Expected: >= 0.0")
     assert polarity >= 0.0
 
 @pytest.mark.sentiment
 def test_emoji_only_positive():
-    polarity = scraper.analyze_sentiment("😍🔥💯")
+    polarity = scorer.analyze_sentiment("😍🔥💯")
     logging.info(f"[Emoji-Only Positive] Got polarity = {polarity:.4f} | Expected: > 0.1")
     assert polarity > 0.1
 
 @pytest.mark.sentiment
 def test_emoji_only_negative():
-    polarity = scraper.analyze_sentiment("😡🤬💀")
+    polarity = scorer.analyze_sentiment("😡🤬💀")
     logging.info(f"[Emoji-Only Negative] Got polarity = {polarity:.4f} | Expected: <= 0.1")
     assert polarity <= 0.1
 
 @pytest.mark.sentiment
 def test_capslock_positive_sentiment():
-    polarity = scraper.analyze_sentiment("THIS WAS SO GOOD OMG")
+    polarity = scorer.analyze_sentiment("THIS WAS SO GOOD OMG")
     logging.info(f"[Capslock Positive] Got polarity = {polarity:.4f} | Expected: >= 0.4")
     assert polarity >= 0.4
 
@@ -115,8 +115,8 @@ def test_capslock_positive_sentiment():
 @pytest.mark.opinion
 def test_strong_positive_opinion():
     text = "I firmly believe this is the best episode ever made."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Strong Positive] Got strength = {strength:.4f} | Expected: > 0.5")
     assert strength > 0.4  # Strong opinion
 
@@ -124,80 +124,80 @@ def test_strong_positive_opinion():
 @pytest.mark.opinion
 def test_strong_negative_opinion():
     text = "This is absolutely the worst episode I've ever seen."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Strong Negative] Got strength = {strength:.4f} | Expected: > 0.5")
     assert strength > 0.5
 
 @pytest.mark.opinion
 def test_weak_opinion():
     text = "Maybe it's okay. Some people might like it."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Weak Opinion] Got strength = {strength:.4f} | Expected: 0.1 <= strength <= 0.4")
     assert 0.1 <= strength <= 0.5
 
 @pytest.mark.opinion
 def test_objective_fact_opinion_strength():
     text = "The show has six seasons."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Objective Fact] Got strength = {strength:.4f} | Expected: < 0.1")
     assert strength < 0.1
 
 @pytest.mark.opinion
 def test_uncertain_expression_opinion_strength():
     text = "I’m not really sure what I think about this."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Uncertain Expression] Got strength = {strength:.4f} | Expected: < 0.3")
     assert strength < 0.3
 
 @pytest.mark.opinion
 def test_sarcastic_positive_opinion_strength():
     text = "Oh great, another disasterpiece. Just what we needed."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Sarcastic Positive] Got strength = {strength:.4f} | Expected: > 0.4")
     assert strength > 0.4
 
 @pytest.mark.opinion
 def test_sarcastic_negative_opinion_strength():
     text = "Wow, perfect plan! Ruin everything again!"
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Sarcastic Negative] Got strength = {strength:.4f} | Expected: > 0.4")
     assert strength > 0.4
 
 @pytest.mark.opinion
 def test_capslock_shouting_opinion_strength():
     text = "I HATED THIS EPISODE SO MUCH"
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Capslock Shouting] Got strength = {strength:.4f} | Expected: > 0.5")
     assert strength > 0.5
 
 @pytest.mark.opinion
 def test_question_opinion_strength():
     text = "Did anyone else think that was weird?"
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Question] Got strength = {strength:.4f} | Expected: < 0.3")
     assert strength < 0.3
 
 @pytest.mark.opinion
 def test_mixed_opinion_strength():
     text = "This episode was fun but the ending sucked."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Mixed] Got strength = {strength:.4f} | Expected: 0.2 <= strength <= 0.6")
     assert 0.2 <= strength <= 0.6
 
 @pytest.mark.opinion
 def test_negation_softening_opinion_strength():
     text = "I didn’t like it."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Negation Softening] Got strength = {strength:.4f} | Expected: 0.2 <= strength <= 0.5")
     assert strength < 0.1  # Neutral/flat tone
 
@@ -205,40 +205,40 @@ def test_negation_softening_opinion_strength():
 @pytest.mark.opinion
 def test_double_negative_opinion_strength():
     text = "It wasn't that bad."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Double Negative] Got strength = {strength:.4f} | Expected: 0.1 <= strength <= 0.4")
     assert 0.1 <= strength <= 0.4
 
 @pytest.mark.opinion
 def test_emoji_heavy_positive_opinion_strength():
     text = "This was amazing! 😍🔥💯"
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Emoji Positive] Got strength = {strength:.4f} | Expected: > 0.4")
     assert strength > 0.4
 
 @pytest.mark.opinion
 def test_emoji_heavy_negative_opinion_strength():
     text = "This episode sucked 😡🤬"
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Emoji Negative] Got strength = {strength:.4f} | Expected: > 0.3")
     assert strength < 0.1  # Not emotionally committed (function didn't pick up strong signal)
 
 @pytest.mark.opinion
 def test_shouting_emoji_combination_strength():
     text = "I HATED THIS 😡🤬 IT WAS AWFUL!!!"
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Shouting + Emoji] Got strength = {strength:.4f} | Expected: > 0.6")
     assert strength > 0.6
 
 @pytest.mark.opinion
 def test_politely_disagree_opinion_strength():
     text = "It’s not really my thing, but I can see why others might enjoy it."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
     logging.info(f"[Polite Dislike] Got strength = {strength:.4f} | Expected: 0.2 <= strength <= 0.5")
     assert 0.2 <= strength <= 0.5
 
@@ -251,199 +251,199 @@ def test_politely_disagree_opinion_strength():
 @pytest.mark.plausibility
 def test_realistic_blackmail_scenario():
     text = "A politician was blackmailed using deepfake videos."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert score > 0.6
 
 @pytest.mark.plausibility
 def test_fantasy_upload_to_cloud_after_death():
     text = "After death, he uploaded his soul to the cloud and became immortal."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert score < 0.4
 
 @pytest.mark.plausibility
 def test_ambiguous_predictive_policing():
     text = "The AI system knows your crimes before you commit them."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert 0.2 <= score <= 0.5  # Adjusted down from 0.4–0.8 since it hit 0.3
 
 @pytest.mark.plausibility
 def test_named_entities_but_unrealistic_context():
     text = "Elon Musk built a satellite that reads your memories and sells them."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert 0.6 <= score <= 0.8
 
 @pytest.mark.plausibility
 def test_sarcastic_realistic_statement():
     text = "Oh sure, like politicians never lie — totally trustworthy folks."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert 0.1 <= score <= 0.4  # Adjusted down from 0.3–0.7 since score was 0.1
 
 
 @pytest.mark.plausibility
 def test_tiktok_tracking():
     text = "This could totally happen with how TikTok tracks data."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert score > 0.6
 
 @pytest.mark.plausibility
 def test_china_surveillance():
     text = "Feels like China is already building this system."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert score > 0.6
 
 @pytest.mark.plausibility
 def test_elon_implants():
     text = "Elon Musk is probably doing this already."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert score > 0.6
 
 @pytest.mark.plausibility
 def test_facebook_data_use():
     text = "Dude this is literally what Facebook is doing with our info."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert score > 0.6
 
 @pytest.mark.plausibility
 def test_rating_system_existence():
     text = "Imagine if you could rate people in real life… oh wait."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert 0.3 <= score <= 0.6  # Adjusted to fit standardized 'medium' range
 
 @pytest.mark.plausibility
 def test_neural_implant_future():
     text = "Could actually happen with neural implants."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert score > 0.6
 
 @pytest.mark.plausibility
 def test_trend_projection():
     text = "If this keeps going, we’ll all have rating chips by 2030."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert score > 0.6
 
 @pytest.mark.plausibility
 def test_future_warning_comment():
     text = "The future is coming fast. This episode nailed it."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert score > 0.6  # Cleaned up to use standard 'high' threshold
 
 @pytest.mark.plausibility
 def test_skeptical_rejection():
     text = "I don’t think anyone would accept this system tbh."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert 0.0 <= score <= 0.3  # Very skeptical tone, fine if low
 
 @pytest.mark.plausibility
 def test_medium_doubt():
     text = "Kind of hard to believe this could work in practice."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert 0.1 <= score <= 0.4  # Adjusted for current output at 0.1
 
 def test_unsure_but_engaged():
     text = "Not sure how realistic this is, but it's wild."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert 0.2 <= score <= 0.5  # Output was 0.2, and the vibe is "low-medium"
 
 @pytest.mark.plausibility
 def test_hyped_but_vague():
     text = "This was insane bro. I’m scared but hyped."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert 0.1 <= score <= 0.4  # High emotion, low clarity. Output was 0.1
 
 @pytest.mark.plausibility
 def test_visual_opinion_only():
     text = "Loved the aesthetic, plot was meh."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert 0.1 <= score <= 0.4
 
 @pytest.mark.plausibility
 def test_conspiracy_aliens():
     text = "This episode proves the aliens are real."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert score < 0.4
 
 @pytest.mark.plausibility
 def test_paranoia_implanted_memories():
     text = "They’ve implanted memories in us already. Wake up."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert score < 0.4
 
 @pytest.mark.plausibility
 def test_simulation_overlords():
     text = "It’s all a simulation controlled by AI overlords."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert score < 0.4
 
 @pytest.mark.plausibility
 def test_full_fantasy_moon():
     text = "The moon is listening to our thoughts."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert score < 0.3
 
 @pytest.mark.plausibility
 def test_soul_technology():
     text = "Soul harvesting tech already exists."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert score < 0.4
 
 @pytest.mark.plausibility
 def test_generic_episode_comment():
     text = "Black Mirror hits hard."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert 0.2 <= score <= 0.5
 
 @pytest.mark.plausibility
 def test_it_s_just_fiction():
     text = "This is just fiction lol."
-    polarity = scraper.analyze_sentiment(text)
-    strength = scraper.calculate_opinion_strength(text, polarity)
-    score = scraper.calculate_plausibility_score_v2(text, polarity, strength)
+    polarity = scorer.analyze_sentiment(text)
+    strength = scorer.calculate_opinion_strength(text, polarity)
+    score = scorer.calculate_plausibility_score_v2(text, polarity, strength)
     assert 0.1 <= score <= 0.3  # It's explicitly downplaying realism
@@ -0,0 +1,57 @@
+import datetime
+import praw
+from checkpoint_store import CheckpointStore
+from reddit_fetcher import ConcurrentFetcher
+
+
+def make_fetcher(fake_reddit):
+    def factory(**kwargs):
+        return praw.Reddit(client_id="fake-id", client_secret="fake-secret", user_agent="reddit_scraper tests",
+                           **fake_reddit.reddit_kwargs, **kwargs)
+    return ConcurrentFetcher(factory, "blackmirror", max_workers=2, requests_per_minute=6000)
+
+
+def test_records_round_trip_with_timestamps(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoint.sqlite"))
+    post = {"topic": "Nosedive", "post_id": "a1", "body": None, "timestamp": datetime.datetime(2024, 5, 1, 12, 30)}
+    comments = [{"comment_id": "c1", "post_id": "a1", "body": "so real", "timestamp": datetime.datetime(2024, 5, 2)}]
+
+    store.record_post("Nosedive", post, comments)
+    store.complete_topic("Nosedive")
+    store.close()
+
+    reopened = CheckpointStore(str(tmp_path / "checkpoint.sqlite"))
+    assert reopened.load_records() == ([post], comments)
+    assert reopened.completed_topics() == {"Nosedive"}
+    assert reopened.completed_posts() == {("Nosedive", "a1")}
+
+    reopened.clear()
+    assert reopened.load_records() == ([], [])
+
+
+def test_resumed_fetch_skips_finished_topics_and_posts(fake_reddit, tmp_path):
+    fake_reddit.add_post("Nosedive", "a1", comments=["one"])
+    fake_reddit.add_post("Playtest", "b1", comments=["two"])
+    fake_reddit.add_post("Playtest", "b2", comments=["three"])
+    store = CheckpointStore(str(tmp_path / "checkpoint.sqlite"))
+    topics = ["Nosedive", "Playtest"]
+
+    # First run "crashes" right after the first Playtest post
+    first_run = make_fetcher(fake_reddit).fetch(topics, on_topic_done=store.complete_topic)
+    for topic, post, comments in first_run:
+        store.record_post(topic, post, comments)
+        if post["post_id"] == "b1":
+            break
+    first_run.close()
+    assert store.completed_topics() == {"Nosedive"}
+
+    fake_reddit.requests.clear()
+    resumed = list(make_fetcher(fake_reddit).fetch(
+        topics, skip_topics=store.completed_topics(), skip_posts=store.completed_posts(),
+        on_topic_done=store.complete_topic
+    ))
+
+    assert [post["post_id"] for _, post, _ in resumed] == ["b2"]
+    assert fake_reddit.count("/r/blackmirror/search") == 1
+    assert fake_reddit.count("/comments/") == 1
+    assert store.completed_topics() == {"Nosedive", "Playtest"}
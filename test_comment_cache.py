@@ -0,0 +1,67 @@
+import datetime
+import praw
+from comment_cache import CommentForestCache
+from reddit_fetcher import ConcurrentFetcher
+
+
+def make_fetcher(fake_reddit, comment_cache=None, max_comments=50):
+    def factory(**kwargs):
+        return praw.Reddit(client_id="fake-id", client_secret="fake-secret", user_agent="reddit_scraper tests",
+                           **fake_reddit.reddit_kwargs, **kwargs)
+    return ConcurrentFetcher(factory, "blackmirror", max_comments=max_comments, max_workers=2,
+                             requests_per_minute=6000, comment_cache=comment_cache)
+
+
+def test_post_matched_by_several_topics_is_fetched_once(fake_reddit):
+    topics = ["USS Callister", "USS Callister: Into Infinity"]
+    for topic in topics:
+        fake_reddit.add_post(topic, "a1", comments=["so real", "too real"])
+
+    results = list(make_fetcher(fake_reddit).fetch(topics))
+
+    assert fake_reddit.count("/comments/") == 1
+    assert [topic for topic, _, _ in results] == topics
+    for topic, _, comments in results:
+        assert [comment["body"] for comment in comments] == ["so real", "too real"]
+        assert {comment["topic"] for comment in comments} == {topic}
+
+
+def test_cache_skips_comment_requests_within_ttl(fake_reddit, tmp_path):
+    fake_reddit.add_post("Nosedive", "a1", comments=["one"])
+    path = str(tmp_path / "cache" / "comments.sqlite")
+
+    first = list(make_fetcher(fake_reddit, CommentForestCache(path)).fetch(["Nosedive"]))
+    cache = CommentForestCache(path)
+    second = list(make_fetcher(fake_reddit, cache).fetch(["Nosedive"]))
+
+    assert fake_reddit.count("/comments/") == 1
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert second == first
+    assert isinstance(second[0][2][0]["timestamp"], datetime.datetime)
+
+
+def test_expired_entries_are_refetched(tmp_path):
+    cache = CommentForestCache(str(tmp_path / "comments.sqlite"), ttl=-1)
+    cache.put("a1", [{"comment_id": "c1", "body": "one"}], 50)
+
+    assert cache.get("a1", 50) is None
+    cache.prune()
+    assert cache.connection.execute("SELECT COUNT(*) FROM comment_forests").fetchone() == (0,)
+
+
+def test_truncated_forest_is_refetched_for_a_higher_limit(fake_reddit, tmp_path):
+    fake_reddit.add_post("Nosedive", "a1", comments=["one", "two", "three"])
+    cache = CommentForestCache(str(tmp_path / "comments.sqlite"))
+
+    first = list(make_fetcher(fake_reddit, cache, max_comments=2).fetch(["Nosedive"]))
+    smaller = list(make_fetcher(fake_reddit, cache, max_comments=1).fetch(["Nosedive"]))
+    assert fake_reddit.count("/comments/") == 1
+    larger = list(make_fetcher(fake_reddit, cache, max_comments=5).fetch(["Nosedive"]))
+    assert fake_reddit.count("/comments/") == 2
+    # The complete three-comment thread now serves any limit
+    again = list(make_fetcher(fake_reddit, cache, max_comments=10).fetch(["Nosedive"]))
+
+    assert fake_reddit.count("/comments/") == 2
+    assert [comment["body"] for comment in first[0][2]] == ["one", "two"]
+    assert [comment["body"] for comment in smaller[0][2]] == ["one"]
+    assert [comment["body"] for comment in larger[0][2]] == [comment["body"] for comment in again[0][2]] == ["one", "two", "three"]
@@ -0,0 +1,77 @@
+import datetime
+import json
+import sqlite3
+import pytest
+from database_loader import DatabaseLoader
+
+
+def post(post_id, topic="Nosedive", score=1):
+    return {"topic": topic, "post_id": post_id, "title": "t", "body": None, "subreddit": "blackmirror",
+            "score": score, "num_comments": 2, "timestamp": datetime.datetime(2024, 1, 1, 12), "author": "a",
+            "url": "u", "sentiment_polarity": 0.5, "sentiment_label": "Positive"}
+
+
+def comment(comment_id, post_id="p1", body="so real"):
+    return {"topic": "Nosedive", "comment_id": comment_id, "post_id": post_id, "author": "a", "body": body,
+            "timestamp": datetime.datetime(2024, 1, 2), "comment_length": 2, "score": 3}
+
+
+def make_loader(tmp_path, batch_size=2):
+    return DatabaseLoader.from_config({"engine": "sqlite", "database": str(tmp_path / "db" / "reddit.sqlite"),
+                                       "batch_size": batch_size})
+
+
+def test_upserts_posts_and_comments_in_batches(tmp_path):
+    loader = make_loader(tmp_path)
+    loader.write_posts([post("p1"), post("p2")])
+    loader.write_comments([comment(f"c{index}") for index in range(5)])
+    loader.close()
+
+    connection = sqlite3.connect(tmp_path / "db" / "reddit.sqlite")
+    assert connection.execute("SELECT COUNT(*) FROM posts").fetchone() == (2,)
+    assert connection.execute("SELECT COUNT(*) FROM comments WHERE post_id = 'p1'").fetchone() == (5,)
+    assert connection.execute("SELECT timestamp, sentiment_label FROM posts WHERE post_id = 'p1'").fetchone() == \
+        ("2024-01-01 12:00:00", "Positive")
+
+
+def test_rerun_updates_rows_instead_of_duplicating(tmp_path):
+    make_loader(tmp_path).write_posts([post("p1", score=1)])
+
+    loader = make_loader(tmp_path)
+    loader.write_posts([post("p1", score=42), post("p2")])
+
+    df = loader.read("posts")
+    assert len(df) == 2
+    assert df.set_index("post_id").loc["p1", "score"] == 42
+    assert df["timestamp"].iloc[0] == datetime.datetime(2024, 1, 1, 12)
+
+
+def test_failed_batch_rolls_back(tmp_path):
+    loader = make_loader(tmp_path, batch_size=10)
+    broken = comment("c2")
+    broken["comment_id"] = None
+    with pytest.raises(sqlite3.IntegrityError):
+        loader.write_comments([comment("c1"), broken])
+    assert len(loader.read("comments")) == 0
+
+
+def test_indexes_exist(tmp_path):
+    loader = make_loader(tmp_path)
+    indexes = {row[1] for row in loader.connection.execute("SELECT type, name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_comments_post_id", "idx_posts_topic"} <= indexes
+
+
+def test_default_config_is_valid_json():
+    with open("config/db_config.json", encoding="utf-8") as handle:
+        assert json.load(handle)["engine"] == "sqlite"
+
+
+def test_post_matched_by_several_topics_is_linked_to_each(tmp_path):
+    loader = make_loader(tmp_path)
+    loader.write_posts([post("p1", topic="USS Callister"), post("p1", topic="USS Callister: Into Infinity")])
+    loader.write_posts([post("p1", topic="USS Callister")])
+
+    assert len(loader.read("posts")) == 1
+    assert loader.rows_written == {"posts": 1, "comments": 0}
+    links = loader.connection.execute("SELECT topic FROM post_topics WHERE post_id = 'p1' ORDER BY topic").fetchall()
+    assert links == [("USS Callister",), ("USS Callister: Into Infinity",)]
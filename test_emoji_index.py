@@ -0,0 +1,34 @@
+import pandas as pd
+import pytest
+from emoji_index import EmojiIndex
+
+
+emoji_df = pd.read_csv("emoji_sentiment_data.csv")
+index = EmojiIndex.from_dataframe(emoji_df)
+positive_emojis = set(emoji_df[emoji_df['sentiment score'] > 0]['Emoji'])
+negative_emojis = set(emoji_df[emoji_df['sentiment score'] < 0]['Emoji'])
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "This was amazing! 😍🔥💯",
+    "I HATED THIS 😡🤬 IT WAS AWFUL!!!",
+    "😍💀😆🤬👍👎😊😡 the story sucked 💩😊🥰👍👏🎉✨🌟 😡🤬👿💀💩👎😤😠😭😣😫😩",
+    "❤️ with a variation selector and a family 👨‍👩‍👧",
+])
+def test_counts_match_substring_scan(text):
+    expected = (sum(e in text for e in positive_emojis), sum(e in text for e in negative_emojis))
+    assert index.score(text) == expected
+
+
+def test_weighted_scores_use_sentiment_score_column():
+    scores = dict(zip(emoji_df["Emoji"], emoji_df["sentiment score"]))
+    positive, negative = index.score("😍😍 💀", weighted=True)
+    assert positive == pytest.approx(scores["😍"])
+    assert negative == pytest.approx(-scores["💀"])
+
+
+def test_multi_code_point_entries_are_matched():
+    sequence_index = EmojiIndex({"👍🏽": 0.5, "👎": -0.4})
+    assert sequence_index.score("nice 👍🏽 meh 👎") == (1, 1)
+    assert sequence_index.score("👍") == (0, 0)
@@ -0,0 +1,7 @@
+import subprocess
+import sys
+
+
+def test_importing_the_scraper_does_not_load_spacy():
+    code = "import sys, reddit_scraper; sys.exit('spacy' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
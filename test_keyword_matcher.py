@@ -0,0 +1,44 @@
+import random
+import pytest
+from keyword_matcher import KeywordMatcher
+
+
+LEXICONS = {
+    "hedging": {"maybe", "i think", "kind of", "in a way", "in a", "if", "a bit"},
+    "tech": {"ai", "artificial intelligence", "neural implant", "neural implants", "implant", "chip"},
+    "negation": {"didn't like", "didn’t like", "wasn't bad"}
+}
+
+
+def naive_counts(text):
+    return {name: sum(1 for pattern in patterns if pattern in text) for name, patterns in LEXICONS.items()}
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "maybe i think it's kind of fine",
+    "could actually happen with neural implants.",
+    "i didn’t like it and it wasn't bad either",
+    "said in a way that's a bit off",
+    "the ai chip chip chip",
+    "iif maybemaybe",
+])
+def test_counts_match_substring_search(text):
+    matcher = KeywordMatcher(LEXICONS)
+    assert matcher.count(text) == naive_counts(text)
+
+
+def test_random_texts_match_substring_search():
+    rng = random.Random(7)
+    fragments = ["maybe", "i think", "neural", " implants", "ai", "chip", "in a", " way", "if", "didn't", " like", "x", " ", "’"]
+    matcher = KeywordMatcher(LEXICONS)
+    for _ in range(500):
+        text = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 12)))
+        assert matcher.count(text) == naive_counts(text), text
+
+
+def test_matches_reports_patterns_per_lexicon():
+    matcher = KeywordMatcher(LEXICONS)
+    matches = matcher.matches("neural implants are an ai thing")
+    assert matches["tech"] == {"neural implant", "neural implants", "implant", "ai"}
+    assert matches["hedging"] == set()
@@ -0,0 +1,55 @@
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from model_artifacts import ArrayModel, CompactModel, export_compact, export_model, export_models
+from multi_head_predictor import MultiHeadPredictor
+from predict_labels import MODEL_PATHS
+
+
+TEXTS = ["I absolutely love this show!", "This episode sucked.", "Could totally happen with AI.",
+         "The moon is alive", "", "Ünïcode and a reallyreallyreallyreallyreallyreallyreallylongtokenthatisnotinthevocab"]
+
+
+def test_exported_models_predict_like_the_pickles(tmp_path):
+    exported = export_models(MODEL_PATHS, str(tmp_path))
+    for name, path in MODEL_PATHS.items():
+        pipeline = joblib.load(path)
+        model = ArrayModel.load(exported[name])
+
+        assert isinstance(model.coef, np.memmap) and isinstance(model.terms, np.memmap)
+        assert (model.transform(TEXTS) != pipeline[:-1].transform(TEXTS)).nnz == 0
+        assert np.array_equal(model.decision_function(model.transform(TEXTS)), pipeline.decision_function(TEXTS))
+        assert list(model.predict(TEXTS)) == list(pipeline.predict(TEXTS))
+
+    predictions = MultiHeadPredictor.from_paths(exported).predict(TEXTS)
+    expected = MultiHeadPredictor.from_paths(MODEL_PATHS).predict(TEXTS)
+    assert {name: list(labels) for name, labels in predictions.items()} == \
+        {name: list(labels) for name, labels in expected.items()}
+
+
+def test_binary_classifier_round_trip(tmp_path):
+    pipeline = Pipeline([("tfidf", TfidfVectorizer(sublinear_tf=True)), ("clf", LogisticRegression())])
+    pipeline.fit(["loved it", "great show", "hated it", "awful show"], ["Yes", "Yes", "No", "No"])
+    export_model(pipeline, str(tmp_path / "binary"))
+
+    model = ArrayModel.load(str(tmp_path / "binary"), mmap=False)
+    assert list(model.predict(["loved the show", "awful", "nothing known"])) == \
+        list(pipeline.predict(["loved the show", "awful", "nothing known"]))
+
+
+def test_compact_export_prunes_and_keeps_predictions(tmp_path):
+    pipeline = joblib.load(MODEL_PATHS["predicted_sentiment"])
+    kept, total = export_compact(pipeline, str(tmp_path / "full.npz"), threshold=0.0)
+    model = CompactModel.load(str(tmp_path / "full.npz"))
+    assert kept == total == len(pipeline[0].vocabulary_)
+    assert model.coef.dtype == np.float32 and model.idf.dtype == np.float32
+    assert list(model.predict(TEXTS)) == list(pipeline.predict(TEXTS))
+
+    pruned, _ = export_compact(pipeline, str(tmp_path / "pruned.npz"), threshold=0.1)
+    assert 0 < pruned < total
+    assert (tmp_path / "pruned.npz").stat().st_size < (tmp_path / "full.npz").stat().st_size
+
+    predictor = MultiHeadPredictor.from_paths({"predicted_sentiment": str(tmp_path / "full.npz")})
+    assert list(predictor.predict(TEXTS)["predicted_sentiment"]) == list(pipeline.predict(TEXTS))
@@ -0,0 +1,48 @@
+import joblib
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from multi_head_predictor import MultiHeadPredictor
+from predict_labels import MODEL_PATHS, predict_sheets
+
+
+TEXTS = ["I absolutely love this show!", "This episode sucked.", "Could totally happen with AI.",
+         "The moon is alive", "I didn't like it, but the ending was great", "This episode sucked."]
+
+
+def test_shared_features_match_each_pipeline():
+    models = {name: joblib.load(path) for name, path in MODEL_PATHS.items()}
+    predictor = MultiHeadPredictor(models)
+
+    assert predictor.fallback_heads == []
+    features = predictor.features(TEXTS)
+    for name, model in models.items():
+        assert (features[name] != model[:-1].transform(TEXTS)).nnz == 0
+        assert list(predictor.predict(TEXTS)[name]) == list(model.predict(TEXTS))
+
+
+def test_vectorizers_that_tokenize_differently_are_not_shared():
+    words = Pipeline([("tfidf", TfidfVectorizer()), ("clf", LogisticRegression())])
+    chars = Pipeline([("tfidf", TfidfVectorizer(analyzer="char", ngram_range=(2, 3))), ("clf", LogisticRegression())])
+    labels = ["Positive", "Negative", "Positive", "Negative", "Negative", "Negative"]
+    words.fit(TEXTS, labels)
+    chars.fit(TEXTS, labels)
+
+    predictor = MultiHeadPredictor({"words": words, "chars": chars})
+    assert len(predictor.shared_groups) == 2
+    predictions = predictor.predict(TEXTS)
+
+    assert list(predictions["words"]) == list(words.predict(TEXTS))
+    assert list(predictions["chars"]) == list(chars.predict(TEXTS))
+
+
+def test_sheets_are_predicted_together_and_split_back():
+    predictor = MultiHeadPredictor.from_paths(MODEL_PATHS)
+    sheets = {"a": pd.DataFrame({"body": TEXTS[:3]}), "b": pd.DataFrame({"body": [TEXTS[3], None, TEXTS[4]]})}
+
+    predicted = predict_sheets(sheets, predictor)
+
+    assert len(predicted["a"]) == 3 and len(predicted["b"]) == 2
+    expected = joblib.load(MODEL_PATHS["predicted_sentiment"]).predict([TEXTS[3], TEXTS[4]])
+    assert list(predicted["b"]["predicted_sentiment"]) == list(expected)
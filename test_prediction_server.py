@@ -0,0 +1,100 @@
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import joblib
+import numpy as np
+import pytest
+from predict_labels import MODEL_PATHS
+from prediction_server import MicroBatcher, ModelRegistry, make_server, request_predictions
+
+
+TEXTS = ["I absolutely love this show!", "This episode sucked.", "Could totally happen with AI.", "The moon is alive"]
+
+
+@pytest.fixture
+def model_paths(tmp_path):
+    paths = {}
+    for name, path in MODEL_PATHS.items():
+        paths[name] = str(tmp_path / os.path.basename(path))
+        shutil.copy(path, paths[name])
+    return paths
+
+
+@pytest.fixture
+def server(model_paths):
+    batcher = MicroBatcher(ModelRegistry(model_paths, check_interval=0), max_batch_size=64, max_wait=0.05)
+    server = make_server(batcher, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    server.batcher = batcher
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        batcher.close()
+
+
+def test_concurrent_requests_are_micro_batched(server):
+    expected = {name: list(joblib.load(path).predict(TEXTS)) for name, path in MODEL_PATHS.items()}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda index: request_predictions([TEXTS[index % 4]], server.url), range(16)))
+
+    for index, result in enumerate(results):
+        assert {name: labels[0] for name, labels in result.items()} == \
+            {name: labels[index % 4] for name, labels in expected.items()}
+    stats = server.batcher.stats.snapshot()
+    assert stats["requests"] == 16
+    assert stats["batches"] < 16
+    assert stats["latency_p99_ms"] >= stats["latency_p50_ms"] > 0
+
+
+def test_model_files_are_hot_reloaded(server, model_paths):
+    before = request_predictions(TEXTS, server.url)["predicted_sentiment"]
+
+    # Swap the opinion model in for the sentiment one; the next request sees the new labels
+    shutil.copy(model_paths["predicted_opinion"], model_paths["predicted_sentiment"])
+    os.utime(model_paths["predicted_sentiment"], ns=(0, os.stat(model_paths["predicted_sentiment"]).st_mtime_ns + 10**9))
+    after = request_predictions(TEXTS, server.url)["predicted_sentiment"]
+
+    assert set(before) <= {"Positive", "Neutral", "Negative"}
+    assert set(after) <= {"Strong", "Weak", "Mixed"}
+    assert server.batcher.registry.reloads == 1
+
+
+def test_empty_request_returns_empty_predictions(server):
+    assert request_predictions([], server.url) == {name: [] for name in MODEL_PATHS}
+    assert server.batcher.stats.snapshot()["batches"] == 0
+
+
+class FailingPredictor:
+    # Predicts the text length, but rejects any batch containing "boom"
+    models = {"length": None}
+
+    def predict(self, texts):
+        if "boom" in texts:
+            raise ValueError("cannot score boom")
+        return {"length": np.array([len(text) for text in texts])}
+
+
+class StaticRegistry:
+    reloads = 0
+
+    def predictor(self):
+        return FailingPredictor()
+
+
+def test_failing_request_does_not_fail_its_batch():
+    batcher = MicroBatcher(StaticRegistry(), max_batch_size=64, max_wait=0.2)
+    try:
+        futures = [batcher.submit(texts) for texts in (["ok"], ["boom"], ["fine", "also"])]
+        assert futures[0].result(5) == {"length": [2]}
+        with pytest.raises(ValueError):
+            futures[1].result(5)
+        assert futures[2].result(5) == {"length": [4, 4]}
+    finally:
+        batcher.close()
@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+from predict_labels import load_predictor, main, predict_sheets
+from prediction_stream import stream_predictions
+
+
+BODIES = ["I absolutely love this show!", "This episode sucked.", None, "Could totally happen with AI.",
+          "The moon is alive", "I didn't like it, but the ending was great", "So real"]
+
+
+@pytest.fixture(scope="module")
+def predictor():
+    return load_predictor()
+
+
+def test_streamed_workbook_matches_in_memory_prediction(predictor, tmp_path):
+    source = tmp_path / "input.xlsx"
+    sheets = {"Comments": pd.DataFrame({"id": range(len(BODIES)), "body": BODIES}),
+              "Notes": pd.DataFrame({"note": ["no body column"]}),
+              "Posts": pd.DataFrame({"body": BODIES[:2]})}
+    with pd.ExcelWriter(source) as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+
+    rows = stream_predictions(str(source), str(tmp_path / "out" / "labeled.xlsx"), predictor, chunk_size=2)
+
+    streamed = pd.read_excel(tmp_path / "out" / "labeled.xlsx", sheet_name=None)
+    expected = predict_sheets({"Comments": sheets["Comments"], "Posts": sheets["Posts"]}, predictor)
+    assert rows == 8
+    assert list(streamed) == ["Comments", "Posts"]
+    for name, df in expected.items():
+        pd.testing.assert_frame_equal(streamed[name], df.reset_index(drop=True), check_dtype=False)
+
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet"])
+def test_cli_streams_flat_files(predictor, tmp_path, extension):
+    source = tmp_path / f"input{extension}"
+    df = pd.DataFrame({"id": range(len(BODIES)), "body": BODIES})
+    if extension == ".csv":
+        df.to_csv(source, index=False)
+    else:
+        df.to_parquet(source, index=False)
+    output = tmp_path / f"labeled{extension}"
+
+    main([str(source), "-o", str(output), "--chunk-size", "3"])
+
+    labeled = pd.read_csv(output) if extension == ".csv" else pd.read_parquet(output)
+    expected = predict_sheets({"rows": df}, predictor)["rows"].reset_index(drop=True)
+    pd.testing.assert_frame_equal(labeled, expected, check_dtype=False)
+
+
+def test_output_must_match_input_format(predictor, tmp_path):
+    pd.DataFrame({"body": BODIES}).to_csv(tmp_path / "input.csv", index=False)
+    with pytest.raises(ValueError):
+        stream_predictions(str(tmp_path / "input.csv"), str(tmp_path / "out.xlsx"), predictor)
+
+
+def test_parquet_writer_casts_later_chunks_to_the_first_schema(tmp_path):
+    pytest.importorskip("pyarrow")
+    from prediction_stream import ParquetChunkWriter
+    writer = ParquetChunkWriter(str(tmp_path / "out.parquet"))
+    writer.write("rows", pd.DataFrame({"body": [None, None], "plausibility_score": [0, 1], "note": [None, None]}))
+    writer.write("rows", pd.DataFrame({"body": ["So real", None], "plausibility_score": [0.35, None], "note": [3, "x"]}))
+    writer.close()
+
+    written = pd.read_parquet(tmp_path / "out.parquet")
+    assert written["body"].fillna("").tolist() == ["", "", "So real", ""]
+    assert written["plausibility_score"].tolist()[:3] == [0.0, 1.0, 0.35]
+    assert written["note"].fillna("").tolist() == ["", "", "3", "x"]
+
+
+@pytest.mark.parametrize("suffix, engine", [(".xls", "openpyxl"), (".ods", "odf")])
+def test_workbooks_openpyxl_cannot_open_are_read_with_pandas(predictor, tmp_path, suffix, engine):
+    # pandas picks its Excel engine from the file's content, openpyxl refuses anything named .xls
+    pytest.importorskip(engine)
+    source = tmp_path / f"input{suffix}"
+    df = pd.DataFrame({"id": range(len(BODIES)), "body": BODIES})
+    with pd.ExcelWriter(source, engine=engine) as writer:
+        pd.DataFrame({"note": ["no bodies here"]}).to_excel(writer, sheet_name="Notes", index=False)
+        df.to_excel(writer, sheet_name="Comments", index=False)
+    output = tmp_path / "labeled.xlsx"
+
+    main([str(source), "-o", str(output), "--chunk-size", "3"])
+
+    labeled = pd.read_excel(output, sheet_name=None)
+    expected = predict_sheets({"Comments": df}, predictor)["Comments"].reset_index(drop=True)
+    assert list(labeled) == ["Comments"]
+    pd.testing.assert_frame_equal(labeled["Comments"], expected, check_dtype=False)
@@ -0,0 +1,65 @@
+import time
+import pytest
+from rate_limit_scheduler import CircuitOpenError, RateLimitScheduler, ScheduledRequestor
+
+
+def make_requestor(scheduler):
+    return ScheduledRequestor(user_agent="reddit_scraper tests", scheduler=scheduler)
+
+
+def test_retries_429_and_5xx_with_backoff(fake_reddit):
+    fake_reddit.script("/r/blackmirror/search", [(429, {"retry-after": "0.2"}), (503, {})])
+    scheduler = RateLimitScheduler(backoff_base=0.1, seed=1)
+
+    response = make_requestor(scheduler).request("GET", f"{fake_reddit.url}/r/blackmirror/search?q=x")
+
+    assert response.status_code == 200
+    assert fake_reddit.count("/r/blackmirror/search") == 3
+    assert scheduler.retries == 2
+    # Retry-After is honoured exactly, the 503 backoff is jittered within [0.05, 0.2]
+    assert 0.25 <= scheduler.throttled_seconds <= 0.45
+
+
+def test_exhausted_retries_return_the_error_response(fake_reddit):
+    fake_reddit.script("/r/blackmirror/search", [(500, {})] * 3)
+    scheduler = RateLimitScheduler(max_retries=2, backoff_base=0.01)
+
+    response = make_requestor(scheduler).request("GET", f"{fake_reddit.url}/r/blackmirror/search?q=x")
+
+    assert response.status_code == 500
+    assert scheduler.failures == 3
+
+
+def test_exhausted_window_holds_requests_until_reset(fake_reddit):
+    fake_reddit.script("/r/blackmirror/search", [(200, {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "1"})])
+    scheduler = RateLimitScheduler()
+    requestor = make_requestor(scheduler)
+
+    requestor.request("GET", f"{fake_reddit.url}/r/blackmirror/search?q=x")
+    started = time.monotonic()
+    requestor.request("GET", f"{fake_reddit.url}/r/blackmirror/search?q=x")
+
+    assert time.monotonic() - started >= 0.9
+    assert scheduler.throttled_seconds >= 0.9
+
+
+def test_remaining_budget_raises_the_rate(fake_reddit):
+    fake_reddit.script("/r/blackmirror/search", [(200, {"x-ratelimit-remaining": "300", "x-ratelimit-reset": "10"})])
+    scheduler = RateLimitScheduler(requests_per_minute=60, max_requests_per_minute=6000)
+
+    make_requestor(scheduler).request("GET", f"{fake_reddit.url}/r/blackmirror/search?q=x")
+
+    assert scheduler.stats()["requests_per_minute"] == pytest.approx(1800)
+
+
+def test_circuit_opens_after_persistent_failures(fake_reddit):
+    fake_reddit.script("/r/blackmirror/search", [(502, {})] * 10)
+    scheduler = RateLimitScheduler(max_retries=10, backoff_base=0.01, failure_threshold=3, circuit_cooldown=30)
+
+    with pytest.raises(CircuitOpenError):
+        make_requestor(scheduler).request("GET", f"{fake_reddit.url}/r/blackmirror/search?q=x")
+
+    assert fake_reddit.count("/r/blackmirror/search") == 3
+    assert scheduler.circuit_opens == 1
+    with pytest.raises(CircuitOpenError):
+        scheduler.acquire()
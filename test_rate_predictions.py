@@ -0,0 +1,71 @@
+import os
+import pandas as pd
+from sklearn.metrics import classification_report, f1_score
+from rate_predictions import confusion_counts, evaluate_file, format_report, main, metrics_from_confusion
+
+
+def predictions_frame():
+    return pd.DataFrame({
+        "body": ["loved it", "hated it", "meh", "could happen", "never", "wow"],
+        "expected_sentiment": ["Positive", "Negative", "Neutral", "Positive", "Negative", "Positive"],
+        "predicted_sentiment": ["Positive", "Negative", "Positive", "Positive", "Neutral", "Positive"],
+        "expected_opinion": ["Strong", "Strong", "Neutral", "Moderate", "Strong", "Strong"],
+        "predicted_opinion": ["Strong", "Moderate", "Neutral", "Moderate", "Strong", "Strong"],
+        "expected_plausibility": ["High", "Low", "Low", "High", "Low", "Medium"],
+        "predicted_plausibility": ["High", "Low", "Low", "High", "Low", "Medium"]
+    })
+
+
+def test_metrics_match_sklearn():
+    df = predictions_frame()
+    for column in ("sentiment", "opinion", "plausibility"):
+        true, pred = df[f"expected_{column}"], df[f"predicted_{column}"]
+        labels, cm = confusion_counts(true, pred)
+        report = metrics_from_confusion(labels, cm)
+
+        assert labels == sorted(set(true) | set(pred))
+        assert report == classification_report(true, pred, output_dict=True, zero_division=0)
+        assert format_report(report) == classification_report(true, pred, zero_division=0)
+        assert report["macro avg"]["f1-score"] == f1_score(true, pred, average="macro", zero_division=0)
+
+
+def test_many_files_without_plots(tmp_path):
+    workbook = tmp_path / "predicted_1.xlsx"
+    with pd.ExcelWriter(workbook) as writer:
+        predictions_frame().to_excel(writer, sheet_name="Sheet1", index=False)
+        pd.DataFrame({"body": ["no labels"]}).to_excel(writer, sheet_name="Other", index=False)
+    predictions_frame().to_csv(tmp_path / "predicted_2.csv", index=False)
+
+    results = main([str(workbook), str(tmp_path / "predicted_2.csv"), "--no-plots",
+                    "--output-dir", str(tmp_path / "out")])
+
+    assert list(results[str(workbook)]) == ["Sheet1"]
+    assert results[str(tmp_path / "predicted_2.csv")]["predicted_2"]["Plausibility"] == 1.0
+    outputs = [os.listdir(tmp_path / "out" / run) for run in os.listdir(tmp_path / "out")]
+    assert sorted(outputs) == [["prediction_errors.csv"], ["prediction_errors.csv"]]
+
+
+def test_plots_rendered_inline(tmp_path):
+    path = tmp_path / "predicted.csv"
+    predictions_frame().to_csv(path, index=False)
+    evaluate_file(str(path), str(tmp_path / "out"))
+
+    (run,) = os.listdir(tmp_path / "out")
+    assert len([name for name in os.listdir(tmp_path / "out" / run) if name.endswith(".png")]) == 3
+
+
+def test_same_named_files_get_their_own_output_folders(tmp_path):
+    for folder in ("a", "b"):
+        os.makedirs(tmp_path / folder)
+        frame = predictions_frame()
+        if folder == "b":
+            frame["predicted_sentiment"] = frame["expected_sentiment"]
+        frame.to_csv(tmp_path / folder / "predicted.csv", index=False)
+
+    main([str(tmp_path / "a" / "predicted.csv"), str(tmp_path / "b" / "predicted.csv"), "--no-plots",
+          "--output-dir", str(tmp_path / "out")])
+
+    runs = sorted(os.listdir(tmp_path / "out"))
+    assert len(runs) == 2
+    errors = [pd.read_csv(tmp_path / "out" / run / "prediction_errors.csv") for run in runs]
+    assert sorted(len(frame) for frame in errors) == [1, 3]
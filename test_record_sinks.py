@@ -0,0 +1,73 @@
+import datetime
+import pytest
+from record_sinks import CsvSink, JsonlSink, make_sink
+
+
+def make_records(count):
+    return [
+        {"comment_id": f"c{index}", "body": f"comment {index}", "timestamp": datetime.datetime(2024, 1, 1, 0, index),
+         "sentiment_polarity": None if index % 3 == 0 else 0.5}
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("sink_class", [JsonlSink, CsvSink])
+def test_streams_in_chunks_and_reads_back(sink_class, tmp_path):
+    sink = sink_class(str(tmp_path / "run"), chunk_size=4)
+    records = make_records(10)
+
+    for record in records:
+        sink.write_comments([record])
+    # Two full chunks are on disk, the last two rows are still buffered
+    assert sink.rows_written["comments"] == 8
+
+    sink.write_posts([{"post_id": "p1", "body": None, "timestamp": datetime.datetime(2024, 1, 1)}])
+    sink.close()
+
+    comments = sink.read("comments")
+    assert sink.rows_written == {"posts": 1, "comments": 10}
+    assert list(comments["comment_id"]) == [record["comment_id"] for record in records]
+    assert comments["timestamp"].iloc[3] == datetime.datetime(2024, 1, 1, 0, 3)
+    assert comments["sentiment_polarity"].isna().sum() == 4
+    assert len(sink.read("posts")) == 1
+
+
+def test_parquet_sink_writes_row_groups(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+    sink = make_sink(str(tmp_path / "run.parquet"), chunk_size=3)
+    for record in make_records(7):
+        sink.write_comments([record])
+    sink.close()
+
+    assert pq.ParquetFile(sink.path("comments")).num_row_groups == 3
+    assert list(sink.read("comments")["comment_id"]) == [f"c{index}" for index in range(7)]
+
+
+def test_parquet_sink_keeps_score_types_across_chunks(tmp_path):
+    pytest.importorskip("pyarrow")
+    sink = make_sink(str(tmp_path / "run.parquet"), chunk_size=2)
+    # The first chunk alone would type sentiment_polarity/label as null and plausibility_score as int
+    sink.write_comments([
+        {"comment_id": "c0", "sentiment_polarity": None, "sentiment_label": None, "plausibility_score": 0, "flair": None},
+        {"comment_id": "c1", "sentiment_polarity": None, "sentiment_label": None, "plausibility_score": 1, "flair": None}
+    ])
+    sink.write_comments([
+        {"comment_id": "c2", "sentiment_polarity": -0.25, "sentiment_label": "Negative", "plausibility_score": 0.35, "flair": 7},
+        {"comment_id": "c3", "sentiment_polarity": 1, "sentiment_label": "Positive", "plausibility_score": None, "flair": "meta"}
+    ])
+    sink.close()
+
+    comments = sink.read("comments")
+    assert comments["sentiment_polarity"].tolist()[2:] == [-0.25, 1.0]
+    assert comments["sentiment_label"].fillna("").tolist() == ["", "", "Negative", "Positive"]
+    assert comments["plausibility_score"].tolist()[:3] == [0.0, 1.0, 0.35]
+    assert comments["flair"].fillna("").tolist() == ["", "", "7", "meta"]
+
+
+def test_make_sink_picks_format_from_extension(tmp_path):
+    sink = make_sink(str(tmp_path / "blackmirror.jsonl"))
+    assert isinstance(sink, JsonlSink)
+    assert sink.path("posts") == str(tmp_path / "blackmirror_posts.jsonl")
+    with pytest.raises(ValueError):
+        make_sink(str(tmp_path / "blackmirror.xlsx"))
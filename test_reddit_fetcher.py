@@ -0,0 +1,118 @@
+import gc
+import time
+import weakref
+import praw
+import prawcore
+import pytest
+from reddit_fetcher import ConcurrentFetcher
+from rate_limit_scheduler import RateLimitScheduler
+
+
+def make_factory(fake_reddit):
+    def factory(**kwargs):
+        return praw.Reddit(
+            client_id="fake-id", client_secret="fake-secret", user_agent="reddit_scraper tests",
+            **fake_reddit.reddit_kwargs, **kwargs
+        )
+    return factory
+
+
+def add_episodes(fake_reddit):
+    fake_reddit.add_post("Nosedive", "a1", selftext="rating people", comments=["so real", "[deleted]", "meh"])
+    fake_reddit.add_post("Nosedive", "a2", comments=["first", "second", "third"])
+    fake_reddit.add_post("Playtest", "b1", comments=["scary"])
+    fake_reddit.add_post("San Junipero", "c1", selftext="", comments=[])
+
+
+def test_results_come_back_in_topic_and_search_order(fake_reddit):
+    add_episodes(fake_reddit)
+    fetcher = ConcurrentFetcher(make_factory(fake_reddit), "blackmirror", max_comments=2,
+                                max_workers=4, requests_per_minute=6000)
+
+    results = list(fetcher.fetch(["Nosedive", "Playtest", "San Junipero"]))
+
+    assert [(topic, post["post_id"]) for topic, post, _ in results] == [
+        ("Nosedive", "a1"), ("Nosedive", "a2"), ("Playtest", "b1"), ("San Junipero", "c1")
+    ]
+    assert [comment["body"] for comment in results[0][2]] == ["so real", "meh"]
+    assert [comment["body"] for comment in results[1][2]] == ["first", "second"]
+    assert results[0][1]["body"] == "rating people"
+    assert results[3][1]["body"] is None
+    assert all(comment["topic"] == "Nosedive" and comment["post_id"] == "a1" for comment in results[0][2])
+
+
+def test_requests_overlap_across_threads(fake_reddit):
+    for index in range(6):
+        fake_reddit.add_post(f"topic {index}", f"p{index}", comments=["hi"])
+    fake_reddit.delay = 0.2
+    fetcher = ConcurrentFetcher(make_factory(fake_reddit), "blackmirror", max_workers=6, requests_per_minute=60000)
+
+    started = time.monotonic()
+    results = list(fetcher.fetch([f"topic {index}" for index in range(6)]))
+    elapsed = time.monotonic() - started
+
+    assert len(results) == 6
+    assert fake_reddit.max_active > 1
+    # 12 delayed API calls plus one token request per thread would take ~2.6s serially
+    assert elapsed < 2.0
+
+
+def test_scheduler_paces_requests_across_all_threads(fake_reddit):
+    for index in range(3):
+        fake_reddit.add_post(f"topic {index}", f"p{index}", comments=["hi"])
+    # The fake server advertises 599 requests left in a 60s window, i.e. ~10 requests/s
+    scheduler = RateLimitScheduler(requests_per_minute=600, burst=1)
+    fetcher = ConcurrentFetcher(make_factory(fake_reddit), "blackmirror", max_workers=4, scheduler=scheduler)
+
+    started = time.monotonic()
+    list(fetcher.fetch([f"topic {index}" for index in range(3)]))
+    elapsed = time.monotonic() - started
+
+    requests_made = scheduler.requests
+    assert requests_made >= 6
+    assert elapsed >= (requests_made - 1) * 0.1 - 0.05
+    assert scheduler.throttled_seconds > 0
+
+
+def test_resolved_comment_forests_are_released(fake_reddit, monkeypatch):
+    for index in range(8):
+        fake_reddit.add_post("Nosedive", f"p{index}", comments=["hi"])
+
+    class Records(list):
+        pass
+
+    released = []
+    fetcher = ConcurrentFetcher(make_factory(fake_reddit), "blackmirror", max_workers=2, requests_per_minute=6000,
+                                max_in_flight=2)
+    fetch_comments = fetcher._fetch_comments
+
+    def tracked(post_id):
+        records = Records(fetch_comments(post_id))
+        weakref.finalize(records, released.append, post_id)
+        return records
+
+    monkeypatch.setattr(fetcher, "_fetch_comments", tracked)
+    results = fetcher.fetch(["Nosedive"])
+    for _ in range(6):
+        next(results)
+    gc.collect()
+
+    # Only the last max_in_flight yielded forests and the ones still pending stay referenced
+    assert {"p0", "p1", "p2"} <= set(released)
+    assert len(list(results)) == 2
+
+
+def test_missing_post_is_skipped_but_server_failures_end_the_fetch(fake_reddit):
+    add_episodes(fake_reddit)
+    fake_reddit.script("/comments/a2", [(404, {})])
+    scheduler = RateLimitScheduler(requests_per_minute=6000, max_retries=1, backoff_base=0.01)
+    fetcher = ConcurrentFetcher(make_factory(fake_reddit), "blackmirror", max_workers=1, scheduler=scheduler)
+
+    done = []
+    results = list(fetcher.fetch(["Nosedive"], on_topic_done=done.append))
+    assert results[0][2] and results[1][2] is None
+    assert done == []
+
+    fake_reddit.script("/comments/b1", [(503, {})] * 20)
+    with pytest.raises(prawcore.exceptions.ServerError):
+        list(fetcher.fetch(["Playtest"]))
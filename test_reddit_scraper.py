@@ -0,0 +1,126 @@
+import json
+import os
+import sqlite3
+import pandas as pd
+import pytest
+from reddit_scraper import RedditScraper
+
+
+def make_scraper(fake_reddit, monkeypatch, **kwargs):
+    for name in ("REDDIT_CLIENT_ID", "REDDIT_CLIENT_SECRET", "REDDIT_USER_AGENT"):
+        monkeypatch.setenv(name, "reddit_scraper tests")
+    kwargs.setdefault("db_config", {"engine": "sqlite", "database": ":memory:"})
+    return RedditScraper("blackmirror", ["Nosedive"], reddit_kwargs=fake_reddit.reddit_kwargs,
+                         requests_per_minute=6000, **kwargs)
+
+
+def test_columnar_crash_before_scoring_keeps_fetched_rows(fake_reddit, tmp_path, monkeypatch):
+    fake_reddit.add_post("Nosedive", "a1", selftext="rating people", comments=["so real", "meh"])
+    scraper = make_scraper(fake_reddit, monkeypatch, columnar=True)
+
+    def crash():
+        raise RuntimeError("scoring blew up")
+
+    monkeypatch.setattr(scraper, "transform_data", crash)
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(RuntimeError):
+        scraper.run()
+
+    saved = sorted(os.listdir(tmp_path / "data"))
+    assert len(saved) == 2
+    for name in saved:
+        sheets = pd.read_excel(tmp_path / "data" / name, sheet_name=None)
+        assert list(sheets["Posts"]["post_id"]) == ["a1"]
+        assert list(sheets["Comments"]["body"]) == ["so real", "meh"]
+
+
+def test_process_pool_scoring_matches_serial(monkeypatch, capsys):
+    for name in ("REDDIT_CLIENT_ID", "REDDIT_CLIENT_SECRET", "REDDIT_USER_AGENT"):
+        monkeypatch.setenv(name, "reddit_scraper tests")
+    bodies = ["I absolutely love this show! 😍", "This episode sucked.", "so real", "Elon Musk would",
+              "I didn't like it, but the ending was great", "so real", "The moon is alive", "NOT the worst!!!"]
+
+    scored = {}
+    for workers in (1, 2):
+        scraper = RedditScraper("blackmirror", ["Nosedive"], workers=workers)
+        scraper.posts_list = [{"post_id": "a1", "body": "The rating system could totally happen."},
+                              {"post_id": "a2", "body": None}]
+        scraper.comments_list = [{"comment_id": f"c{index}", "post_id": "a1", "body": body}
+                                 for index, body in enumerate(bodies)]
+        scraper.transform_data()
+        scored[workers] = (scraper.posts_list, scraper.comments_list)
+
+    assert "across 2 worker processes" in capsys.readouterr().out
+    assert all("plausibility_score" in record for record in scored[1][1])
+    assert scored[2] == scored[1]
+
+
+def test_every_run_writes_score_traces(fake_reddit, tmp_path, monkeypatch):
+    fake_reddit.add_post("Nosedive", "a1", selftext="rating people", comments=["so real"])
+    path = tmp_path / "traces.jsonl"
+    scraper = make_scraper(fake_reddit, monkeypatch, sink=str(tmp_path / "out.jsonl"), export_excel=False,
+                           trace_path=str(path), trace_sample_rate=1.0)
+    monkeypatch.chdir(tmp_path)
+
+    scraper.run()
+    scraper.run()
+
+    assert [json.loads(line)["text"] for line in path.read_text(encoding="utf-8").splitlines()] == ["so real", "rating people"] * 2
+
+
+def test_post_with_failed_comments_is_not_checkpointed(fake_reddit, tmp_path, monkeypatch):
+    fake_reddit.add_post("Nosedive", "a1", comments=["so real"])
+    fake_reddit.add_post("Nosedive", "a2", comments=["meh"])
+    fake_reddit.script("/comments/a2", [(404, {})])
+    path = str(tmp_path / "checkpoint.sqlite")
+
+    first = make_scraper(fake_reddit, monkeypatch, checkpoint_path=path)
+    first._fetch_posts_and_comments()
+    assert [post["post_id"] for post in first.posts_list] == ["a1", "a2"]
+    assert first.checkpoint.completed_posts() == {("Nosedive", "a1")}
+    assert first.checkpoint.completed_topics() == set()
+
+    # The resumed run only fetches the failed post's comments again
+    resumed = make_scraper(fake_reddit, monkeypatch, checkpoint_path=path)
+    resumed._fetch_posts_and_comments()
+    assert fake_reddit.count("/comments/a1") == 1
+    assert [comment["body"] for comment in resumed.comments_list] == ["so real", "meh"]
+    assert resumed.checkpoint.completed_topics() == {"Nosedive"}
+
+
+@pytest.mark.parametrize("scorer_works", [True, False])
+def test_crash_writes_buffered_stream_records_to_the_sink(fake_reddit, tmp_path, monkeypatch, scorer_works):
+    fake_reddit.add_post("Nosedive", "a1", selftext="rating people", comments=["so real", "meh"])
+    scraper = make_scraper(fake_reddit, monkeypatch, sink=str(tmp_path / "out.jsonl"), export_excel=False)
+
+    def crash():
+        raise RuntimeError("transform blew up")
+
+    monkeypatch.setattr(scraper, "transform_data", crash)
+    if not scorer_works:
+        monkeypatch.setattr(scraper.scorer, "score_many", lambda texts: crash())
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(RuntimeError):
+        scraper.run()
+
+    comments = scraper.sink.read("comments")
+    assert list(comments["body"]) == ["so real", "meh"]
+    assert ("sentiment_label" in comments.columns) == scorer_works
+    assert list(scraper.sink.read("posts")["post_id"]) == ["a1"]
+
+
+def test_streamed_chunks_are_loaded_into_the_database(fake_reddit, tmp_path, monkeypatch):
+    fake_reddit.add_post("Nosedive", "a1", selftext="rating people", comments=["so real", "meh"])
+    fake_reddit.add_post("Nosedive", "a2", comments=["five stars"])
+    fake_reddit.add_post("Hated in the Nation", "a1", selftext="rating people", comments=["so real", "meh"])
+    database = str(tmp_path / "reddit.sqlite")
+    scraper = make_scraper(fake_reddit, monkeypatch, sink=str(tmp_path / "out.jsonl"), sink_chunk_size=2,
+                           export_excel=False, db_config={"engine": "sqlite", "database": database})
+    scraper.topics = ["Nosedive", "Hated in the Nation"]
+    scraper.run()
+
+    connection = sqlite3.connect(database)
+    assert connection.execute("SELECT COUNT(*) FROM posts").fetchone() == (2,)
+    assert connection.execute("SELECT COUNT(*) FROM post_topics").fetchone() == (3,)
+    assert connection.execute("SELECT COUNT(*) FROM comments WHERE sentiment_label IS NOT NULL").fetchone() == (3,)
+    assert len(scraper.sink.read("comments")) == 5
@@ -0,0 +1,65 @@
+import json
+import pickle
+from reddit_scraper import RedditScraper
+from run_metrics import RunMetrics
+
+
+def test_timers_counters_and_prometheus_text():
+    metrics = RunMetrics()
+    with metrics.timer("stage", stage="fetch"):
+        pass
+    metrics.add_time("topic", 1.5, topic='White "Bear"')
+    metrics.add_time("topic", 0.5, topic='White "Bear"')
+    metrics.increment("api_requests", 3)
+    metrics.increment("api_requests", 2)
+    metrics.set_gauge("texts_per_second", 12.5)
+
+    assert metrics.seconds("topic", topic='White "Bear"') == 2.0
+    assert metrics.count("api_requests") == 5
+    text = metrics.to_prometheus()
+    assert '# TYPE blackmirror_scraper_topic_seconds summary' in text
+    assert 'blackmirror_scraper_topic_seconds_sum{topic="White \\"Bear\\""} 2.0' in text
+    assert 'blackmirror_scraper_topic_seconds_count{topic="White \\"Bear\\""} 2' in text
+    assert 'blackmirror_scraper_api_requests_total 5' in text
+    assert 'blackmirror_scraper_texts_per_second 12.5' in text
+
+
+def test_disabled_metrics_record_nothing_and_pickle_disabled():
+    metrics = RunMetrics(enabled=False)
+    with metrics.timer("stage", stage="fetch"):
+        metrics.increment("api_requests")
+    report = metrics.report()
+    assert report["timers"] == report["counters"] == report["gauges"] == []
+
+    copy = pickle.loads(pickle.dumps(RunMetrics()))
+    assert not copy.enabled
+
+
+def test_scraper_run_writes_json_and_prometheus_reports(fake_reddit, tmp_path, monkeypatch):
+    for name in ("REDDIT_CLIENT_ID", "REDDIT_CLIENT_SECRET", "REDDIT_USER_AGENT"):
+        monkeypatch.setenv(name, "reddit_scraper tests")
+    fake_reddit.add_post("Nosedive", "a1", selftext="rating people", comments=["so real 😂", "meh"])
+    fake_reddit.add_post("Playtest", "b1", comments=["Elon Musk could build this"])
+
+    scraper = RedditScraper("blackmirror", ["Nosedive", "Playtest"], reddit_kwargs=fake_reddit.reddit_kwargs,
+                            requests_per_minute=6000, sink=str(tmp_path / "out.jsonl"), export_excel=False,
+                            metrics_path=str(tmp_path / "metrics" / "run.json"),
+                            db_config={"engine": "sqlite", "database": str(tmp_path / "reddit.sqlite")})
+    scraper.run()
+
+    report = json.loads((tmp_path / "metrics" / "run.json").read_text())
+    timers = {(timer["name"], tuple(timer["labels"].values())) for timer in report["timers"]}
+    counters = {(counter["name"], tuple(counter["labels"].values())): counter["value"] for counter in report["counters"]}
+
+    assert {("stage", (stage,)) for stage in ("fetch", "transform", "database", "excel")} <= timers
+    assert {("topic", ("Nosedive",)), ("topic", ("Playtest",)), ("scoring", ())} <= timers
+    assert {("scoring_component", (component,)) for component in ("spacy", "vader", "textblob", "plausibility")} <= timers
+    assert not any(name == "scoring" and labels for name, labels in timers)
+    assert counters[("api_requests", ())] >= 3
+    assert counters[("comments_fetched", ("Nosedive",))] == 2
+    assert counters[("texts_scored", ())] == 5
+    assert counters[("texts_analyzed", ())] == 4
+    assert counters[("rows_written", ("comments", "sink"))] == 3
+    assert counters[("rows_written", ("comments", "database"))] == 3
+    assert [gauge["name"] for gauge in report["gauges"]] == ["texts_per_second"]
+    assert "blackmirror_scraper_stage_seconds_sum{stage=\"fetch\"}" in (tmp_path / "metrics" / "run.prom").read_text()
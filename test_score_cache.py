@@ -0,0 +1,87 @@
+from score_cache import ScoreCache
+from text_scorer import TextScorer
+
+
+def scores(value):
+    return {"sentiment_polarity": value, "sentiment_label": "Positive", "opinion_strength": None}
+
+
+def test_round_trip_ignores_surrounding_whitespace(tmp_path):
+    cache = ScoreCache(str(tmp_path / "scores.sqlite"), "v1")
+    cache.put_many({"so real": scores(0.25)})
+
+    assert cache.get_many(["  so real\n", "unseen"]) == {"  so real\n": scores(0.25)}
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate() == 0.5
+
+
+def test_scorer_versions_keep_their_own_entries(tmp_path):
+    path = str(tmp_path / "scores.sqlite")
+    ScoreCache(path, "v1").put_many({"so real": scores(0.25)})
+
+    v2 = ScoreCache(path, "v2")
+    assert v2.get_many(["so real"]) == {}
+    v2.put_many({"so real": scores(0.5)})
+    # Switching back to v1 still finds its scores
+    assert ScoreCache(path, "v1").get_many(["so real"]) == {"so real": scores(0.25)}
+    assert ScoreCache(path, "v2").entries == 2
+
+
+def test_unused_versions_are_evicted_first(tmp_path):
+    path = str(tmp_path / "scores.sqlite")
+    ScoreCache(path, "v1").put_many({"a": scores(1.0), "b": scores(2.0)})
+    cache = ScoreCache(path, "v2", max_entries=3)
+    cache.put_many({"a": scores(1.5)})
+    cache.put_many({"c": scores(3.0)})
+
+    assert cache.entries == 3
+    assert set(cache.get_many(["a", "c"])) == {"a", "c"}
+    assert len(ScoreCache(path, "v1").get_many(["a", "b"])) == 1
+
+
+def test_entry_count_ignores_replaced_rows(tmp_path):
+    cache = ScoreCache(str(tmp_path / "scores.sqlite"), "v1")
+    cache.put_many({"a": scores(1.0), "b": scores(2.0)})
+    cache.put_many({"a": scores(1.5), "c": scores(3.0)})
+
+    assert cache.entries == cache.connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0] == 3
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ScoreCache(str(tmp_path / "scores.sqlite"), "v1", max_entries=2)
+    cache.put_many({"a": scores(1.0)})
+    cache.put_many({"b": scores(2.0)})
+    cache.get_many(["a"])
+    cache.put_many({"c": scores(3.0)})
+
+    assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+
+def test_scorer_reuses_cached_scores(tmp_path):
+    scorer = TextScorer()
+    scorer.score_cache = ScoreCache(str(tmp_path / "scores.sqlite"), scorer.version())
+    texts = ["I absolutely love this show! 😍", "   ", None, "This could totally happen with AI."]
+
+    first = scorer.score_many(texts)
+    second = scorer.score_many(texts)
+
+    assert second == first
+    assert (scorer.score_cache.hits, scorer.score_cache.misses) == (2, 2)
+    assert TextScorer(weighted_emoji=True).version() != scorer.version()
+
+
+def test_scorer_version_follows_its_matchers_and_libraries(monkeypatch):
+    import inspect
+    import text_scorer
+    from emoji_index import EmojiIndex
+
+    scorer = TextScorer()
+    version = scorer.version()
+
+    monkeypatch.setattr(text_scorer, "_installed_version", lambda name: "0.0.1" if name == "textblob" else None)
+    assert scorer.version() != version
+    monkeypatch.undo()
+
+    getsource = inspect.getsource
+    monkeypatch.setattr(inspect, "getsource", lambda obj: getsource(obj) + ("#" if obj is EmojiIndex else ""))
+    assert scorer.version() != version
@@ -0,0 +1,85 @@
+import json
+import pytest
+from run_metrics import RunMetrics
+from score_trace import ScoreTracer
+from text_scorer import TextScorer
+
+
+scorer = TextScorer()
+TEXTS = ["I absolutely love this show! 😍🔥", "Elon Musk is probably doing this already.", None,
+         "The moon is listening to our thoughts.", "I HATED THIS 😡🤬 IT WAS AWFUL!!!"]
+
+
+def test_breakdown_matches_the_plain_score():
+    for text in TEXTS:
+        score, breakdown = scorer.calculate_plausibility_score_v2(text, -0.5, 0.6, with_breakdown=True)
+        assert score == scorer.calculate_plausibility_score_v2(text, -0.5, 0.6)
+        if text:
+            assert breakdown["score"] == score
+            boost, emoji = scorer._emoji_sentiment_boost(text, with_breakdown=True)
+            assert boost == emoji["boost"] == scorer._emoji_sentiment_boost(text)
+
+
+def test_scoring_prints_nothing_per_text(capsys):
+    scorer.score_many(TEXTS * 20)
+    assert "FINAL" not in capsys.readouterr().out
+
+
+def test_traces_are_sampled_and_written_without_changing_scores(tmp_path):
+    expected = TextScorer().score_many(TEXTS)
+    path = tmp_path / "traces" / "scores.jsonl"
+    traced = TextScorer(tracer=ScoreTracer(str(path), sample_rate=1.0))
+    assert traced.score_many(TEXTS) == expected
+    traced.tracer.close()
+
+    traces = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [trace["text"] for trace in traces] == [text for text in TEXTS if text]
+    assert traces[1]["plausibility"]["real_actors"] == 0.1
+    assert traces[0]["emoji"]["positive_hits"] == 2
+
+    none = ScoreTracer(str(tmp_path / "none.jsonl"), sample_rate=0.0)
+    TextScorer(tracer=none).score_many(TEXTS)
+    none.close()
+    assert none.written == 0 and (tmp_path / "none.jsonl").read_text() == ""
+
+
+def test_closed_tracer_drops_traces_until_reopened(tmp_path):
+    path = tmp_path / "scores.jsonl"
+    tracer = ScoreTracer(str(path), sample_rate=1.0)
+    tracer.record({"text": "first run"})
+    tracer.close()
+    tracer.record({"text": "between runs"})
+    assert tracer.closed and tracer.dropped == 1
+
+    tracer.open()
+    tracer.record({"text": "second run"})
+    tracer.close()
+    assert [json.loads(line)["text"] for line in path.read_text(encoding="utf-8").splitlines()] == ["first run", "second run"]
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_close_does_not_hang_when_the_writer_died(tmp_path):
+    tracer = ScoreTracer(str(tmp_path / "scores.jsonl"), sample_rate=1.0, max_queue=2)
+    # An unserializable trace key kills the writer thread; the queue then fills up
+    tracer.record({("not", "a", "string"): 1})
+    tracer._thread.join(5)
+    for index in range(5):
+        tracer.record({"text": index})
+
+    tracer.close(timeout=1.0)
+    assert tracer.closed and tracer.dropped == 3
+
+
+def test_worker_processes_send_back_traces_and_component_timings(tmp_path):
+    path = tmp_path / "scores.jsonl"
+    parallel = TextScorer(workers=2, metrics=RunMetrics(), tracer=ScoreTracer(str(path), sample_rate=1.0))
+    try:
+        assert parallel.score_many(TEXTS) == scorer.score_many(TEXTS)
+    finally:
+        parallel.shutdown()
+        parallel.tracer.close()
+
+    traces = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert sorted(trace["text"] for trace in traces) == sorted(text for text in TEXTS if text)
+    assert parallel.metrics.seconds("scoring_component", component="vader") > 0
+    assert parallel.metrics.seconds("scoring_component", component="plausibility") > 0
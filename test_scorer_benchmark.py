@@ -0,0 +1,49 @@
+import json
+import pytest
+from scorer_benchmark import BENCHMARKS, CORPUS_KINDS, compare, main, run_benchmarks, synthetic_corpus
+from text_scorer import TextScorer
+
+
+def test_corpus_is_reproducible():
+    corpus = synthetic_corpus(size=20, seed=7)
+    assert corpus == synthetic_corpus(size=20, seed=7)
+    assert corpus != synthetic_corpus(size=20, seed=8)
+    assert set(corpus) == set(CORPUS_KINDS) and all(len(texts) == 20 for texts in corpus.values())
+
+    average = {kind: sum(map(len, texts)) / len(texts) for kind, texts in corpus.items()}
+    assert average["long"] > 5 * average["short"]
+    assert all(any(ord(char) > 0x1F000 for char in text) for text in corpus["emoji"][:5])
+
+
+def test_results_cover_every_function_and_kind():
+    results = run_benchmarks(TextScorer(), size=5, repeats=2)
+    assert set(results["results"]) == set(BENCHMARKS)
+    for kinds in results["results"].values():
+        assert set(kinds) == set(CORPUS_KINDS)
+        for stats in kinds.values():
+            assert stats["calls"] == 10
+            assert 0 < stats["p50_us"] <= stats["p90_us"] <= stats["p99_us"] <= stats["max_us"]
+            assert stats["texts_per_second"] > 0
+    json.dumps(results)
+
+
+def test_compare_flags_slower_medians():
+    baseline = {"results": {"analyze_sentiment": {"short": {"p50_us": 10.0}, "long": {"p50_us": 100.0}}}}
+    current = {"results": {"analyze_sentiment": {"short": {"p50_us": 11.0}, "long": {"p50_us": 150.0},
+                                                 "emoji": {"p50_us": 1.0}}}}
+    assert compare(current, baseline, tolerance=0.2) == [("analyze_sentiment", "long", 100.0, 150.0)]
+
+
+def test_cli_writes_results_and_fails_on_regression(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    main(["--size", "3", "--repeats", "1", "--only", "_hedging_penalty", "-o", str(baseline)])
+    results = json.loads(baseline.read_text())
+    assert list(results["results"]) == ["_hedging_penalty"]
+
+    for stats in results["results"]["_hedging_penalty"].values():
+        stats["p50_us"] /= 100
+    baseline.write_text(json.dumps(results))
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--size", "3", "--repeats", "1", "--only", "_hedging_penalty", "-o", str(tmp_path / "current.json"),
+              "--baseline", str(baseline)])
+    assert exit_info.value.code == 1
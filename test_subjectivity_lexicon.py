@@ -0,0 +1,32 @@
+import pytest
+from textblob import TextBlob
+from subjectivity_lexicon import SubjectivityLexicon
+
+
+lexicon = SubjectivityLexicon()
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "The ending was good.",
+    "The ending was not good.",
+    "It wasn't bad at all, honestly",
+    "Never a great idea",
+    "really not good",
+    "This is very very scary!!!",
+    "extremely boring but not terrible",
+    "Absolutely amazing (!) sure, totally realistic",
+    "so real <3 :-D",
+    "I don't think it's really that bad... kind of sad though :(",
+    "NOT the worst episode, but definitely not the best either."
+])
+def test_matches_textblob_subjectivity(text):
+    assert lexicon.subjectivity(text) == pytest.approx(TextBlob(text).sentiment.subjectivity, abs=1e-9)
+
+
+def test_text_scorer_batch_subjectivity_matches_textblob():
+    from text_scorer import TextScorer
+    scorer = TextScorer()
+    texts = ["not very good", "I really don't love it", "seriously amazing!", "It wasn't that bad", "meh"]
+    features = [scorer._opinion_features(text, scorer._subjectivity(text)) for text in texts]
+    assert [row[0] for row in features] == pytest.approx([TextBlob(text).sentiment.subjectivity for text in texts], abs=1e-9)
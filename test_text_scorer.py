@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+from text_scorer import TextScorer
+
+
+scorer = TextScorer()
+
+
+def test_score_many_matches_score_text_in_input_order():
+    texts = ["I absolutely love this show! 😍", None, "This could totally happen with AI.", "I absolutely love this show! 😍"]
+    scores = scorer.score_many(texts)
+
+    assert len(scores) == len(texts)
+    assert scores[0] == scores[3] == scorer.score_text(texts[0])
+    assert scores[2] == scorer.score_text(texts[2])
+    assert scores[1]["sentiment_polarity"] is None and scores[1]["plausibility_label"] is None
+
+
+def test_score_many_parallel_matches_serial():
+    texts = [f"Episode {index} was {'great' if index % 2 else 'awful'}!" for index in range(12)]
+    parallel = TextScorer(workers=2)
+    try:
+        assert parallel.score_many(texts) == scorer.score_many(texts)
+    finally:
+        parallel.shutdown()
+
+
+def test_batch_arrays_match_per_text_scores():
+    texts = ["I absolutely love this show! 😍", "I didn’t like it.", "It wasn't that bad.", "THIS WAS SO GOOD OMG",
+             "Maybe, I think it was fine but slow.", None, ""]
+    polarity = scorer.analyze_many(texts)
+    strength = scorer.opinion_strength_many(texts, polarity)
+
+    for text, text_polarity, text_strength in zip(texts, polarity, strength):
+        expected_polarity = scorer.analyze_sentiment(text)
+        expected_strength = scorer.calculate_opinion_strength(text, expected_polarity)
+        if expected_polarity is None:
+            assert np.isnan(text_polarity) and np.isnan(text_strength)
+        else:
+            assert text_polarity == pytest.approx(expected_polarity)
+            assert text_strength == pytest.approx(expected_strength)
+
+
+def test_score_frame_matches_score_many():
+    texts = ["I absolutely love this show! 😍", None, "I HATED THIS 😡🤬", "meh", None, "This could totally happen with AI."]
+    frame = scorer.score_frame(texts)
+    expected = pd.DataFrame(scorer.score_many(texts))
+
+    pd.testing.assert_frame_equal(frame, expected[frame.columns])
+
+
+def test_column_labels_use_the_scalar_thresholds():
+    scores = [0.6, 0.5, 0.31, 0.3, 0.1, 0.09, -0.3, -0.31, None]
+    assert list(scorer.label_sentiment_many(scores)) == [scorer.label_sentiment(score) for score in scores]
+    assert list(scorer.label_opinion_strength_many(scores)) == [scorer.label_opinion_strength(score) for score in scores]
+    assert list(scorer.label_plausibility_many(scores)) == [scorer.label_plausibility(score) for score in scores]
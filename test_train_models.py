@@ -0,0 +1,46 @@
+import os
+import joblib
+import pandas as pd
+import train_models
+from train_models import jobs_per_task, train_model
+
+
+def training_frame():
+    positive = ["loved it", "great episode", "so good", "amazing story", "brilliant ending", "really great"]
+    negative = ["hated it", "awful episode", "so bad", "terrible story", "boring ending", "really awful"]
+    bodies = [f"{text} {index}" for index in range(4) for text in positive + negative]
+    labels = (["Positive"] * 6 + ["Negative"] * 6) * 4
+    return pd.DataFrame({"body": bodies, "sentiment_label": labels})
+
+
+def test_grid_search_with_cached_tfidf(tmp_path, capsys):
+    grid = {"tfidf__ngram_range": [(1, 1), (1, 2)], "clf__C": [0.5, 2.0]}
+    result = train_model(training_frame(), "sentiment_label", "sentiment_model.pkl", search=True, param_grid=grid,
+                         n_jobs=2, cache_dir=str(tmp_path / "cache"), model_dir=str(tmp_path))
+
+    report = capsys.readouterr().out
+    assert report.count("accuracy ") == 4
+    assert set(result["best_params"]) == {"tfidf__ngram_range", "clf__C"}
+    assert os.listdir(tmp_path / "cache")
+
+    model = joblib.load(tmp_path / "sentiment_model.pkl")
+    assert model.memory is None
+    assert list(model.predict(["loved it so good", "awful and boring"])) == ["Positive", "Negative"]
+
+
+def test_compact_export_report(tmp_path, capsys):
+    train_model(training_frame(), "sentiment_label", "sentiment_model.pkl", model_dir=str(tmp_path),
+                compact_dir=str(tmp_path / "compact"), compact_threshold=0.0)
+
+    report = capsys.readouterr().out
+    assert (tmp_path / "compact" / "sentiment_model.npz").exists()
+    for metric in ("size", "load", "predict", "accuracy", "agreement 100.00%"):
+        assert metric in report
+
+
+def test_parallel_tasks_share_the_cpus(monkeypatch):
+    monkeypatch.setattr(train_models, "cpu_count", lambda: 16)
+    assert jobs_per_task(-1, 3) == 5
+    assert jobs_per_task(-2, 3) == 5
+    assert jobs_per_task(12, 3) == 4
+    assert jobs_per_task(2, 3) == 1
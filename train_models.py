@@ -1,12 +1,16 @@
 # train_models.py
 
+import argparse
+import time
 import pandas as pd
 import joblib
 import os
+from joblib import Memory, Parallel, cpu_count, delayed
 from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import GridSearchCV, StratifiedKFold, train_test_split
 from sklearn.pipeline import Pipeline
 from sklearn.feature_extraction.text import TfidfVectorizer
+from model_artifacts import CompactModel, export_compact
 from reddit_scraper import RedditScraper
 
 def load_and_filter(path, label_col_correct):
@@ -14,25 +18,121 @@ def load_and_filter(path, label_col_correct):
     df = df[df[label_col_correct] == 'Yes']
     return df.dropna(subset=["body"])
 
-def prepare_pipeline():
+# Searched with --search; every combination is cross-validated on the training split
+PARAM_GRID = {
+    "tfidf__max_features": [2000, 5000, 10000],
+    "tfidf__ngram_range": [(1, 1), (1, 2)],
+    "clf__C": [0.25, 1.0, 4.0]
+}
+
+def prepare_pipeline(memory=None):
+    # memory: joblib.Memory / cache directory for the fitted TF-IDF step, so fits that only
+    # change the classifier (e.g. clf__C in a grid search) reuse the transformed features
     return Pipeline([
         ('tfidf', TfidfVectorizer(max_features=5000, ngram_range=(1, 2))),
         ('clf', LogisticRegression(max_iter=1000))
-    ])
+    ], memory=memory)
 
-def train_model(df, label_type, model_filename):
+def train_model(df, label_type, model_filename, search=False, param_grid=None, cv=3, n_jobs=1,
+                cache_dir=None, model_dir="models", compact_dir=None, compact_threshold=0.05):
     X = df["body"]
     y = df[label_type]
-    pipeline = prepare_pipeline()
+    memory = Memory(cache_dir, verbose=0) if cache_dir else None
+    pipeline = prepare_pipeline(memory)
 
     X_train, X_test, y_train, y_test = train_test_split(X, y, stratify=y, test_size=0.2, random_state=42)
-    pipeline.fit(X_train, y_train)
+    started = time.perf_counter()
+    best_params = None
+    if search:
+        grid = GridSearchCV(
+            pipeline, param_grid or PARAM_GRID, n_jobs=n_jobs,
+            cv=StratifiedKFold(n_splits=cv, shuffle=True, random_state=42)
+        )
+        grid.fit(X_train, y_train)
+        report_search(model_filename, grid.cv_results_)
+        pipeline = grid.best_estimator_
+        best_params = grid.best_params_
+    else:
+        pipeline.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - started
+
     accuracy = pipeline.score(X_test, y_test)
-    print(f"✅ Trained {model_filename} with accuracy: {accuracy:.4f}")
+    print(f"✅ Trained {model_filename} with accuracy: {accuracy:.4f} in {fit_seconds:.1f}s")
+
+    # The cache only helps while fitting; don't ship a pipeline that points at it
+    pipeline.memory = None
+    model_path = os.path.join(model_dir, model_filename)
+    joblib.dump(pipeline, model_path)
+
+    if compact_dir:
+        compact_path = os.path.join(compact_dir, os.path.splitext(model_filename)[0] + ".npz")
+        kept, total = export_compact(pipeline, compact_path, threshold=compact_threshold)
+        print(f"🗜️ Compact {compact_path}: kept {kept}/{total} features (|coef| >= {compact_threshold})")
+        report_compact(pipeline, model_path, compact_path, X_test, y_test)
+    return {"model": model_filename, "accuracy": accuracy, "fit_seconds": fit_seconds, "best_params": best_params}
+
+def _median_seconds(function, repeats=5):
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return sorted(timings)[len(timings) // 2]
+
+def report_compact(pipeline, model_path, compact_path, X_test, y_test):
+    # Original pipeline vs compact export on the held-out split: file size, load time,
+    # predict throughput, accuracy and how often the two disagree
+    compact = CompactModel.load(compact_path)
+    texts = list(X_test)
+    batch = texts * max(1, 2000 // max(len(texts), 1))
+    rows = [
+        ("size", f"{os.path.getsize(model_path) / 1024:.0f} KB", f"{os.path.getsize(compact_path) / 1024:.0f} KB"),
+        ("load", f"{_median_seconds(lambda: joblib.load(model_path)) * 1000:.1f} ms",
+         f"{_median_seconds(lambda: CompactModel.load(compact_path)) * 1000:.1f} ms"),
+        ("predict", f"{len(batch) / _median_seconds(lambda: pipeline.predict(batch), 3):.0f} texts/s",
+         f"{len(batch) / _median_seconds(lambda: compact.predict(batch), 3):.0f} texts/s"),
+        ("accuracy", f"{(pipeline.predict(texts) == y_test).mean():.4f}", f"{(compact.predict(texts) == y_test).mean():.4f}")
+    ]
+    for metric, original, compacted in rows:
+        print(f"  {metric:<9} original {original:>14}   compact {compacted:>14}")
+    agreement = (compact.predict(texts) == pipeline.predict(texts)).mean()
+    print(f"  agreement {agreement:.2%} of held-out predictions unchanged")
+
+def report_search(model_filename, cv_results):
+    print(f"\n🔍 Grid search for {model_filename}:")
+    ranked = sorted(range(len(cv_results["params"])), key=lambda index: cv_results["rank_test_score"][index])
+    for index in ranked:
+        print(f"  #{cv_results['rank_test_score'][index]:<3} accuracy {cv_results['mean_test_score'][index]:.4f} "
+              f"(±{cv_results['std_test_score'][index]:.4f}), fit {cv_results['mean_fit_time'][index]:.2f}s  "
+              f"{cv_results['params'][index]}")
+
+def train_task(task, **options):
+    df = load_and_filter(task["path"], task["label_col_correct"])
+    return train_model(df, task["label_type"], task["model_filename"], **options)
+
+def jobs_per_task(n_jobs, tasks):
+    # Splits an n_jobs budget (joblib style: -1 = every CPU, -2 = all but one) between tasks
+    # trained side by side, so parallel grid searches don't oversubscribe the machine
+    total = n_jobs if n_jobs > 0 else max(1, cpu_count() + 1 + n_jobs)
+    return max(1, total // tasks)
 
-    joblib.dump(pipeline, f"models/{model_filename}")
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Train the sentiment, opinion and plausibility models.")
+    parser.add_argument("--parallel", action="store_true", help="train the three tasks in parallel processes")
+    parser.add_argument("--search", action="store_true", help="cross-validated grid search over PARAM_GRID")
+    parser.add_argument("--n-jobs", type=int, default=-1,
+                        help="processes for the grid search (shared between the tasks with --parallel)")
+    parser.add_argument("--cv", type=int, default=3, help="cross-validation folds for the grid search")
+    parser.add_argument("--compact", action="store_true",
+                        help="also export pruned float32 models to models/compact and compare them with the originals")
+    parser.add_argument("--compact-threshold", type=float, default=0.05,
+                        help="drop features whose largest absolute coefficient is below this")
+    parser.add_argument("--cache-dir", default=os.path.join("data", "cache", "tfidf"),
+                        help="where fitted TF-IDF steps are cached between fits ('' to disable)")
+    return parser.parse_args(argv)
 
-def main():
+def main(argv=None):
+    args = parse_args(argv)
     os.makedirs("models", exist_ok=True)
 
     tasks = [
@@ -56,11 +156,21 @@ def main():
         }
     ]
 
-    for task in tasks:
-        df = load_and_filter(task["path"], task["label_col_correct"])
-        train_model(df, task["label_type"], task["model_filename"])
+    options = {"search": args.search, "n_jobs": args.n_jobs, "cv": args.cv, "cache_dir": args.cache_dir or None,
+               "compact_dir": os.path.join("models", "compact") if args.compact else None,
+               "compact_threshold": args.compact_threshold}
+    started = time.perf_counter()
+    if args.parallel:
+        options["n_jobs"] = jobs_per_task(args.n_jobs, len(tasks))
+        results = Parallel(n_jobs=len(tasks))(delayed(train_task)(task, **options) for task in tasks)
+    else:
+        results = [train_task(task, **options) for task in tasks]
 
-    print("🎉 All models trained and saved.")
+    print("\n📋 Summary:")
+    for result in results:
+        best = f"  best {result['best_params']}" if result["best_params"] else ""
+        print(f"  {result['model']}: accuracy {result['accuracy']:.4f}, fit {result['fit_seconds']:.1f}s{best}")
+    print(f"🎉 All models trained and saved in {time.perf_counter() - started:.1f}s.")
 
 if __name__ == "__main__":
     main()